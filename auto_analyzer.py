@@ -62,12 +62,12 @@ def analyze_single_frequency(freq_name, path):
     
     # Transition analysis
     print("🔄 Analyzing transitions...")
-    transition_summary = gt_df.groupby('TRANSITION').agg({
-        'DURATION': ['count', 'sum', 'mean', 'median']
-    }).round(6)
-    
-    transition_summary.columns = ['count', 'total_duration', 'avg_duration', 'median_duration']
-    transition_summary = transition_summary.reset_index()
+    transition_summary = gt_df.groupby('TRANSITION').agg(
+        count=('DURATION', 'count'),
+        total_duration=('DURATION', 'sum'),
+        avg_duration=('DURATION', 'mean'),
+        median_duration=('DURATION', 'median')
+    ).round(6).reset_index()
     transition_summary = transition_summary.sort_values('total_duration', ascending=False)
     
     print(f"🎯 Found {len(transition_summary)} unique transitions")
@@ -6,6 +6,7 @@ Handles multiple data source locations and provides flexible path resolution.
 
 import os
 import json
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -100,7 +101,9 @@ class DataSourceConfig:
                 "auto_extract_zip": True,
                 "cleanup_extracted_files": False,
                 "fallback_to_next_source": True,
-                "verbose_logging": True
+                "verbose_logging": True,
+                "write_xlsx": False,
+                "cache_parsed": True
             }
         }
     
@@ -217,12 +220,21 @@ class DataSourceConfig:
             
             csv_file = extract_dir / "simulation_results.csv"
             
-            # Extract only if CSV doesn't exist or ZIP is newer
-            if not csv_file.exists() or os.path.getmtime(zip_path) > os.path.getmtime(csv_file):
-                print(f"   📦 Extracting {zip_path}...")
-                with zipfile.ZipFile(zip_path, 'r') as zipf:
+            with zipfile.ZipFile(zip_path, 'r') as zipf:
+                entry = zipf.NameToInfo.get(csv_file.name)
+                # Extracted files keep their entry's timestamp, so an up-to-date CSV matches the
+                # entry's size and mtime; caches keyed on the CSV's stat then survive re-extraction
+                current = entry is not None and csv_file.exists() and \
+                    csv_file.stat().st_size == entry.file_size and \
+                    csv_file.stat().st_mtime == time.mktime(entry.date_time + (0, 0, -1))
+                if not current:
+                    print(f"   📦 Extracting {zip_path}...")
                     zipf.extractall(extract_dir)
-                print(f"   ✅ Extracted to {extract_dir}")
+                    for info in zipf.infolist():
+                        if not info.is_dir():
+                            mtime = time.mktime(info.date_time + (0, 0, -1))
+                            os.utime(extract_dir / info.filename, (mtime, mtime))
+                    print(f"   ✅ Extracted to {extract_dir}")
             
             return str(csv_file) if csv_file.exists() else None
             
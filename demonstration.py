@@ -31,9 +31,9 @@ def demonstrate_config_manager():
     configs = config_mgr.list_available_configs()
     print(f"Found {len(configs)} configuration(s)")
     
-    for i, config_dict in enumerate(configs, 1):
-        config_name = config_dict['name']
-        config_desc = config_dict['description']
+    for i, config_entry in enumerate(configs, 1):
+        config_name = config_entry.name
+        config_desc = config_entry.description
         print(f"  {i}. {config_name}: {config_desc}")
     
     # Show configuration browser (non-interactive demo)
@@ -11,9 +11,23 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
 import json
+import math
 from typing import Dict, List, Optional, Union
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib parser/encoder is used instead
+    orjson = None
+
+def _json_default(obj):
+    """Convert numpy scalars/arrays that the json encoder cannot serialize natively."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class CalculationApproach(Enum):
     """Enumeration of available calculation approaches."""
     HARDWARE_CALIBRATED = "hardware_calibrated"
@@ -21,6 +35,16 @@ class CalculationApproach(Enum):
     HYBRID_CORRELATION = "hybrid_correlation"
     ALL = "all"
 
+# Per-approach projection column, display name, table header and plot colour
+APPROACH_META = {
+    CalculationApproach.HARDWARE_CALIBRATED: ('hw_calibrated_improved_tgs', "Hardware-Calibrated", 'HW-Calib', '#1f77b4'),
+    CalculationApproach.PURE_SIMULATION: ('pure_sim_improved_tgs', "Pure Simulation", 'Pure-Sim', '#ff7f0e'),
+    CalculationApproach.HYBRID_CORRELATION: ('hybrid_improved_tgs', "Hybrid Correlation", 'Hybrid', '#2ca02c'),
+}
+
+# Current-hardware baseline columns, in order of preference
+BASELINE_TGS_COLUMNS = ('hw_calibrated_baseline_tgs', 'hybrid_baseline_tgs', 'pure_sim_current_tgs')
+
 class HardwareProjectionConfig:
     """Configuration class for hardware projections."""
     
@@ -120,8 +144,9 @@ class HardwareProjectionConfig:
     def load_config(self, config_file: str):
         """Load configuration from JSON file."""
         try:
-            with open(config_file, 'r') as f:
-                file_config = json.load(f)
+            with open(config_file, 'rb') as f:
+                data = f.read()
+            file_config = orjson.loads(data) if orjson is not None else json.loads(data)
             
             # Merge with defaults (file config takes precedence)
             self.config = self._merge_configs(self.default_config, file_config)
@@ -143,8 +168,12 @@ class HardwareProjectionConfig:
     def save_config(self, config_file: str):
         """Save current configuration to JSON file."""
         try:
-            with open(config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode('utf-8')
+            with open(config_file, 'wb') as f:
+                f.write(data)
             print(f"✅ Configuration saved to {config_file}")
         except Exception as e:
             print(f"❌ Error saving config: {e}")
@@ -170,9 +199,13 @@ class HardwareProjectionConfig:
 class EnhancedHardwareProjector:
     """Enhanced hardware projector with configurable approaches and improvements."""
     
-    def __init__(self, config_file: str = None):
-        """Initialize the enhanced hardware projector."""
-        self.config_manager = HardwareProjectionConfig(config_file)
+    def __init__(self, config_file: str = None, config: Optional[Dict] = None):
+        """Initialize the enhanced hardware projector from a config file or an already-parsed config."""
+        if config is not None:
+            self.config_manager = HardwareProjectionConfig()
+            self.config_manager.config = config
+        else:
+            self.config_manager = HardwareProjectionConfig(config_file)
         self.config = self.config_manager.config
         
         # Extract hardware settings
@@ -657,15 +690,10 @@ class EnhancedHardwareProjector:
         
         # Calculate summary statistics for each approach
         for approach in enabled_approaches:
-            if approach == CalculationApproach.HARDWARE_CALIBRATED:
-                col = 'hw_calibrated_improved_tgs'
-            elif approach == CalculationApproach.PURE_SIMULATION:
-                col = 'pure_sim_improved_tgs'
-            elif approach == CalculationApproach.HYBRID_CORRELATION:
-                col = 'hybrid_improved_tgs'
-            else:
+            if approach not in APPROACH_META:
                 continue
-                
+            col = APPROACH_META[approach][0]
+            
             if col in projections_df.columns:
                 values = projections_df[col].dropna()
                 analysis['summary_statistics'][approach.value] = {
@@ -676,26 +704,28 @@ class EnhancedHardwareProjector:
                     'range_tgs': values.max() - values.min()
                 }
         
-        # Add recommendations based on analysis
-        if len(analysis['summary_statistics']) > 1:
-            # Compare approaches and make recommendations
-            approaches_data = analysis['summary_statistics']
-            
-            # Find most conservative and most optimistic approaches
-            mean_values = {k: v['mean_tgs'] for k, v in approaches_data.items()}
-            most_conservative = min(mean_values.keys(), key=lambda k: mean_values[k])
-            most_optimistic = max(mean_values.keys(), key=lambda k: mean_values[k])
-            
-            analysis['recommendations'] = [
-                f"Most conservative estimate: {most_conservative} (avg: {mean_values[most_conservative]:.2f} tok/s)",
-                f"Most optimistic estimate: {most_optimistic} (avg: {mean_values[most_optimistic]:.2f} tok/s)",
-                f"Range between approaches: {mean_values[most_optimistic] - mean_values[most_conservative]:.2f} tok/s"
-            ]
-            
-            if 'hybrid_correlation' in mean_values:
-                analysis['recommendations'].append(
-                    "Hybrid approach recommended for balanced accuracy using both hardware and simulation data"
-                )
+        # Nothing to compare with a single approach
+        if len(analysis['summary_statistics']) <= 1:
+            return analysis
+        
+        # Compare approaches and make recommendations
+        approaches_data = analysis['summary_statistics']
+        
+        # Find most conservative and most optimistic approaches
+        mean_values = {k: v['mean_tgs'] for k, v in approaches_data.items()}
+        most_conservative = min(mean_values.keys(), key=lambda k: mean_values[k])
+        most_optimistic = max(mean_values.keys(), key=lambda k: mean_values[k])
+        
+        analysis['recommendations'] = [
+            f"Most conservative estimate: {most_conservative} (avg: {mean_values[most_conservative]:.2f} tok/s)",
+            f"Most optimistic estimate: {most_optimistic} (avg: {mean_values[most_optimistic]:.2f} tok/s)",
+            f"Range between approaches: {mean_values[most_optimistic] - mean_values[most_conservative]:.2f} tok/s"
+        ]
+        
+        if 'hybrid_correlation' in mean_values:
+            analysis['recommendations'].append(
+                "Hybrid approach recommended for balanced accuracy using both hardware and simulation data"
+            )
         
         return analysis
     
@@ -708,54 +738,44 @@ class EnhancedHardwareProjector:
         output_dir = Path(output_path)
         output_dir.mkdir(exist_ok=True)
         
-        # Set up plotting style
-        plt.style.use('default')
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-        fig.suptitle(f'Hardware Performance Projection: {self.current_hardware} → {self.future_hardware}', 
-                     fontsize=16, fontweight='bold')
-        
         # Prepare data
         frequencies = projections_df['frequency'].tolist()
         freq_labels = [f"{f}MHz" for f in frequencies]
         
-        # Get baseline values
-        baseline_values = []
-        for _, row in projections_df.iterrows():
-            if 'hw_calibrated_baseline_tgs' in row and not pd.isna(row['hw_calibrated_baseline_tgs']):
-                baseline_values.append(row['hw_calibrated_baseline_tgs'])
-            elif 'hybrid_baseline_tgs' in row and not pd.isna(row['hybrid_baseline_tgs']):
-                baseline_values.append(row['hybrid_baseline_tgs'])
-            elif 'pure_sim_current_tgs' in row and not pd.isna(row['pure_sim_current_tgs']):
-                baseline_values.append(row['pure_sim_current_tgs'])
-            else:
-                baseline_values.append(0)
+        # Get baseline values: the first non-missing BASELINE_TGS_COLUMNS value per row, else 0
+        baseline_arr = np.full(len(projections_df), np.nan)
+        for col in BASELINE_TGS_COLUMNS:
+            if col in projections_df.columns:
+                missing = np.isnan(baseline_arr)
+                baseline_arr[missing] = projections_df[col].to_numpy(dtype=float)[missing]
+        baseline_arr[np.isnan(baseline_arr)] = 0
         
         # Plot 1: Current vs Future Hardware Comparison
         approaches_data = {}
         enabled_approaches = self.config_manager.get_enabled_approaches()
         
         for approach in enabled_approaches:
-            if approach == CalculationApproach.HARDWARE_CALIBRATED:
-                col = 'hw_calibrated_improved_tgs'
-                name = "Hardware-Calibrated"
-                color = '#1f77b4'
-            elif approach == CalculationApproach.PURE_SIMULATION:
-                col = 'pure_sim_improved_tgs'
-                name = "Pure Simulation"
-                color = '#ff7f0e'
-            elif approach == CalculationApproach.HYBRID_CORRELATION:
-                col = 'hybrid_improved_tgs'
-                name = "Hybrid Correlation"
-                color = '#2ca02c'
-            else:
+            if approach not in APPROACH_META:
                 continue
-                
+            col, name, _, color = APPROACH_META[approach]
+            
             if col in projections_df.columns:
-                values = projections_df[col].tolist()
+                # Shared by every panel below, so extract the array only once
+                values = projections_df[col].to_numpy(dtype=float)
                 approaches_data[name] = {'values': values, 'color': color}
         
+        # Set up plotting style; the range and log-scale panels (3 and 4) only add
+        # information when there are several projections, so one approach gets a 1x2 figure
+        plt.style.use('default')
+        if len(approaches_data) > 1:
+            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        else:
+            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig.suptitle(f'Hardware Performance Projection: {self.current_hardware} → {self.future_hardware}', 
+                     fontsize=16, fontweight='bold')
+        
         # Plot current hardware baseline
-        ax1.plot(freq_labels, baseline_values, 'o-', linewidth=2, markersize=6, 
+        ax1.plot(freq_labels, baseline_arr, 'o-', linewidth=2, markersize=6, 
                 label=f'{self.current_hardware} Current', color='red')
         
         # Plot future hardware projections
@@ -771,7 +791,7 @@ class EnhancedHardwareProjector:
         
         # Plot 2: Improvement Factors
         for name, data in approaches_data.items():
-            improvements = [proj/base if base > 0 else 0 for proj, base in zip(data['values'], baseline_values)]
+            improvements = [proj/base if base > 0 else 0 for proj, base in zip(data['values'], baseline_arr)]
             ax2.plot(freq_labels, improvements, 'o-', linewidth=2, markersize=6,
                     label=name, color=data['color'])
         
@@ -801,7 +821,7 @@ class EnhancedHardwareProjector:
             
             ax3.fill_between(freq_labels, mins, maxs, alpha=0.3, color='lightblue', label='Projection Range')
             ax3.plot(freq_labels, avgs, 'o-', linewidth=2, markersize=6, color='blue', label='Average Projection')
-            ax3.plot(freq_labels, baseline_values, 'o-', linewidth=2, markersize=6, color='red', label='Current Hardware')
+            ax3.plot(freq_labels, baseline_arr, 'o-', linewidth=2, markersize=6, color='red', label='Current Hardware')
             
             ax3.set_xlabel('Frequency')
             ax3.set_ylabel('Performance (tok/s)')
@@ -810,19 +830,20 @@ class EnhancedHardwareProjector:
             ax3.grid(True, alpha=0.3)
         
         # Plot 4: Relative Performance (Log Scale)
-        ax4.plot(freq_labels, baseline_values, 'o-', linewidth=2, markersize=6, 
-                label=f'{self.current_hardware} Current', color='red')
-        
-        for name, data in approaches_data.items():
-            ax4.plot(freq_labels, data['values'], 'o-', linewidth=2, markersize=6,
-                    label=f'{self.future_hardware} {name}', color=data['color'])
-        
-        ax4.set_xlabel('Frequency')
-        ax4.set_ylabel('Performance (tok/s) - Log Scale')
-        ax4.set_title('Performance Comparison (Logarithmic Scale)')
-        ax4.set_yscale('log')
-        ax4.legend()
-        ax4.grid(True, alpha=0.3)
+        if len(approaches_data) > 1:
+            ax4.plot(freq_labels, baseline_arr, 'o-', linewidth=2, markersize=6, 
+                    label=f'{self.current_hardware} Current', color='red')
+            
+            for name, data in approaches_data.items():
+                ax4.plot(freq_labels, data['values'], 'o-', linewidth=2, markersize=6,
+                        label=f'{self.future_hardware} {name}', color=data['color'])
+            
+            ax4.set_xlabel('Frequency')
+            ax4.set_ylabel('Performance (tok/s) - Log Scale')
+            ax4.set_title('Performance Comparison (Logarithmic Scale)')
+            ax4.set_yscale('log')
+            ax4.legend()
+            ax4.grid(True, alpha=0.3)
         
         # Adjust layout and save
         plt.tight_layout()
@@ -838,14 +859,16 @@ class EnhancedHardwareProjector:
             width = 0.15
             
             # Plot baseline
-            ax.bar(x - width*1.5, baseline_values, width, label=f'{self.current_hardware} Current', 
-                  color='red', alpha=0.7)
+            bars = ax.bar(x - width*1.5, baseline_arr, width, label=f'{self.current_hardware} Current', 
+                         color='red', alpha=0.7)
+            ax.bar_label(bars, padding=2, fmt='%.1f', fontsize=8)
             
             # Plot each approach
             for i, (name, data) in enumerate(approaches_data.items()):
                 offset = width * (i - len(approaches_data)/2 + 0.5)
-                ax.bar(x + offset, data['values'], width, label=f'{self.future_hardware} {name}', 
-                      color=data['color'], alpha=0.7)
+                bars = ax.bar(x + offset, data['values'], width, label=f'{self.future_hardware} {name}', 
+                             color=data['color'], alpha=0.7)
+                ax.bar_label(bars, padding=2, fmt='%.1f', fontsize=8)
             
             ax.set_xlabel('Frequency')
             ax.set_ylabel('Performance (tok/s)')
@@ -855,17 +878,6 @@ class EnhancedHardwareProjector:
             ax.legend()
             ax.grid(True, alpha=0.3, axis='y')
             
-            # Add value labels on bars
-            for i, v in enumerate(baseline_values):
-                ax.text(i - width*1.5, v + max(baseline_values)*0.01, f'{v:.1f}', 
-                       ha='center', va='bottom', fontsize=8)
-            
-            for j, (name, data) in enumerate(approaches_data.items()):
-                offset = width * (j - len(approaches_data)/2 + 0.5)
-                for i, v in enumerate(data['values']):
-                    ax.text(i + offset, v + max(data['values'])*0.01, f'{v:.1f}', 
-                           ha='center', va='bottom', fontsize=8)
-            
             plt.tight_layout()
             bar_plot_file = output_dir / f"hardware_comparison_bar_{self.current_hardware}_to_{self.future_hardware}.png"
             plt.savefig(bar_plot_file, dpi=300, bbox_inches='tight')
@@ -886,25 +898,8 @@ class EnhancedHardwareProjector:
         # Export analysis results
         analysis_file = output_dir / "projection_analysis.json"
         with open(analysis_file, 'w') as f:
-            # Convert numpy types to Python types for JSON serialization
-            def convert_numpy(obj):
-                if isinstance(obj, np.integer):
-                    return int(obj)
-                elif isinstance(obj, np.floating):
-                    return float(obj)
-                elif isinstance(obj, np.ndarray):
-                    return obj.tolist()
-                return obj
-            
-            def clean_for_json(data):
-                if isinstance(data, dict):
-                    return {k: clean_for_json(v) for k, v in data.items()}
-                elif isinstance(data, list):
-                    return [clean_for_json(item) for item in data]
-                else:
-                    return convert_numpy(data)
-            
-            json.dump(clean_for_json(analysis), f, indent=2)
+            # numpy types are converted by the encoder's default hook only when encountered
+            json.dump(analysis, f, indent=2, default=_json_default)
         print(f"✅ Analysis exported to {analysis_file}")
         
         # Export configuration
@@ -955,17 +950,25 @@ def main():
         print("\n📊 Current Hardware Baseline (Reference):")
         print("-" * 45)
         
-        # Calculate current hardware TGS for each frequency
-        baseline_tgs_values = []
-        for _, row in projections_df.iterrows():
-            freq = row['frequency']
-            # Get baseline TGS from any approach that calculated it
-            if 'hw_calibrated_baseline_tgs' in row and not pd.isna(row['hw_calibrated_baseline_tgs']):
-                baseline_tgs_values.append(row['hw_calibrated_baseline_tgs'])
-            elif 'hybrid_baseline_tgs' in row and not pd.isna(row['hybrid_baseline_tgs']):
-                baseline_tgs_values.append(row['hybrid_baseline_tgs'])
-            elif 'pure_sim_current_tgs' in row and not pd.isna(row['pure_sim_current_tgs']):
-                baseline_tgs_values.append(row['pure_sim_current_tgs'])
+        # Extract the needed columns as numpy arrays once; the printing loops below
+        # index into these instead of building a pandas row per frequency
+        approach_cols = [APPROACH_META[a][0] for a in enabled_approaches if a in APPROACH_META]
+        arrs = {c: projections_df[c].to_numpy(dtype=float)
+                for c in BASELINE_TGS_COLUMNS + tuple(approach_cols) if c in projections_df.columns}
+        baseline_cols = [c for c in BASELINE_TGS_COLUMNS if c in arrs]
+        freq_strs = projections_df['frequency_str'].to_numpy()
+        
+        # Calculate current hardware TGS for each frequency (from any approach that calculated it)
+        row_baselines = []
+        for i in range(len(projections_df)):
+            baseline = None
+            for col in baseline_cols:
+                val = arrs[col][i]
+                if not math.isnan(val):
+                    baseline = val
+                    break
+            row_baselines.append(baseline)
+        baseline_tgs_values = [v for v in row_baselines if v is not None]
         
         if baseline_tgs_values:
             baseline_min = min(baseline_tgs_values)
@@ -979,18 +982,10 @@ def main():
         print(f"{projector.future_hardware} Projected Performance:")
         
         for approach in enabled_approaches:
-            if approach == CalculationApproach.HARDWARE_CALIBRATED:
-                col = 'hw_calibrated_improved_tgs'
-                name = "Hardware-Calibrated"
-            elif approach == CalculationApproach.PURE_SIMULATION:
-                col = 'pure_sim_improved_tgs'
-                name = "Pure Simulation"
-            elif approach == CalculationApproach.HYBRID_CORRELATION:
-                col = 'hybrid_improved_tgs'
-                name = "Hybrid Correlation"
-            else:
+            if approach not in APPROACH_META:
                 continue
-                
+            col, name, _, _ = APPROACH_META[approach]
+            
             if col in projections_df.columns:
                 values = projections_df[col].dropna()
                 if len(values) > 0:
@@ -1003,64 +998,34 @@ def main():
         # Create table header
         header = f"{'Frequency':<10} {'Current HW':<12} "
         for approach in enabled_approaches:
-            if approach == CalculationApproach.HARDWARE_CALIBRATED:
-                header += f"{'HW-Calib':<12} "
-            elif approach == CalculationApproach.PURE_SIMULATION:
-                header += f"{'Pure-Sim':<12} "
-            elif approach == CalculationApproach.HYBRID_CORRELATION:
-                header += f"{'Hybrid':<12} "
+            if approach in APPROACH_META:
+                header += f"{APPROACH_META[approach][2]:<12} "
         header += f"{'Best Improv':<12}"
         print(header)
         print("-" * len(header))
         
         # Display each frequency row
-        for _, row in projections_df.iterrows():
-            freq_str = row['frequency_str']
-            
-            # Get current hardware baseline
-            current_hw_tgs = "N/A"
-            if 'hw_calibrated_baseline_tgs' in row and not pd.isna(row['hw_calibrated_baseline_tgs']):
-                current_hw_tgs = f"{row['hw_calibrated_baseline_tgs']:.2f}"
-            elif 'hybrid_baseline_tgs' in row and not pd.isna(row['hybrid_baseline_tgs']):
-                current_hw_tgs = f"{row['hybrid_baseline_tgs']:.2f}"
-            elif 'pure_sim_current_tgs' in row and not pd.isna(row['pure_sim_current_tgs']):
-                current_hw_tgs = f"{row['pure_sim_current_tgs']:.2f}"
+        for i in range(len(projections_df)):
+            baseline = row_baselines[i]
+            current_hw_tgs = f"{baseline:.2f}" if baseline is not None else "N/A"
             
             # Build row string
-            row_str = f"{freq_str:<10} {current_hw_tgs:<12} "
+            row_str = f"{freq_strs[i]:<10} {current_hw_tgs:<12} "
             
             # Get projected values and find best
             projected_values = []
-            for approach in enabled_approaches:
-                if approach == CalculationApproach.HARDWARE_CALIBRATED:
-                    col = 'hw_calibrated_improved_tgs'
-                    if col in row and not pd.isna(row[col]):
-                        val = row[col]
-                        row_str += f"{val:<12.2f} "
-                        projected_values.append(val)
-                    else:
-                        row_str += f"{'N/A':<12} "
-                elif approach == CalculationApproach.PURE_SIMULATION:
-                    col = 'pure_sim_improved_tgs'
-                    if col in row and not pd.isna(row[col]):
-                        val = row[col]
-                        row_str += f"{val:<12.2f} "
-                        projected_values.append(val)
-                    else:
-                        row_str += f"{'N/A':<12} "
-                elif approach == CalculationApproach.HYBRID_CORRELATION:
-                    col = 'hybrid_improved_tgs'
-                    if col in row and not pd.isna(row[col]):
-                        val = row[col]
-                        row_str += f"{val:<12.2f} "
-                        projected_values.append(val)
-                    else:
-                        row_str += f"{'N/A':<12} "
+            for col in approach_cols:
+                val = arrs[col][i] if col in arrs else float('nan')
+                if not math.isnan(val):
+                    row_str += f"{val:<12.2f} "
+                    projected_values.append(val)
+                else:
+                    row_str += f"{'N/A':<12} "
             
             # Add best improvement factor
-            if projected_values and current_hw_tgs != "N/A":
+            if projected_values and baseline is not None:
                 best_projected = max(projected_values)
-                improvement = best_projected / float(current_hw_tgs)
+                improvement = best_projected / baseline
                 row_str += f"{improvement:<12.1f}x"
             else:
                 row_str += f"{'N/A':<12}"
@@ -1072,18 +1037,10 @@ def main():
             print("\n📈 Performance Improvement Summary:")
             print("-" * 35)
             for approach in enabled_approaches:
-                if approach == CalculationApproach.HARDWARE_CALIBRATED:
-                    col = 'hw_calibrated_improved_tgs'
-                    name = "Hardware-Calibrated"
-                elif approach == CalculationApproach.PURE_SIMULATION:
-                    col = 'pure_sim_improved_tgs'
-                    name = "Pure Simulation"
-                elif approach == CalculationApproach.HYBRID_CORRELATION:
-                    col = 'hybrid_improved_tgs'
-                    name = "Hybrid Correlation"
-                else:
+                if approach not in APPROACH_META:
                     continue
-                    
+                col, name, _, _ = APPROACH_META[approach]
+                
                 if col in projections_df.columns:
                     values = projections_df[col].dropna()
                     if len(values) > 0:
@@ -1111,7 +1068,7 @@ def main():
                 # Convert boolean to string for JSON serialization
                 correlation_export = correlation_results.copy()
                 correlation_export['correlation_valid'] = str(correlation_results['correlation_valid'])
-                json.dump(correlation_export, f, indent=2)
+                json.dump(correlation_export, f, indent=2, default=_json_default)
             print(f"✅ TGS correlation analysis exported to {correlation_file}")
         
         print(f"\n✅ Results exported to output/ directory")
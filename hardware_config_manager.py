@@ -4,11 +4,298 @@ Hardware Configuration Manager - Enhanced configuration management system
 Supports creating, updating, and browsing multiple hardware configurations.
 """
 
+import copy
+import hashlib
 import json
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional
 from datetime import datetime
 import shutil
+import stat
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+
+try:
+    # Importing readline once gives every input() prompt line editing and history
+    import readline
+    readline.set_auto_history(True)
+except ImportError:  # not available on Windows
+    pass
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is used instead
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pysimdjson is optional; summaries fall back to a full parse
+    simdjson = None
+
+# One simdjson parser per thread, reused across calls so its buffers are allocated once
+_simdjson_local = threading.local()
+
+def _get_simdjson_parser():
+    """Return this thread's simdjson parser, creating it on first use."""
+    parser = getattr(_simdjson_local, 'parser', None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    return parser
+
+def _read_bytes(path: str) -> bytes:
+    """Read a whole file as raw bytes."""
+    # Unbuffered: readall() sizes its buffer from fstat and skips the BufferedReader copy
+    with open(path, 'rb', buffering=0) as f:
+        return f.read()
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file from a single bytes read."""
+    data = _read_bytes(path)
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _pretty_default() -> bool:
+    """Whether configs are written indented; MARTINI_CONFIG_PRETTY=1 turns it on."""
+    return os.environ.get('MARTINI_CONFIG_PRETTY', '') not in ('', '0')
+
+def _write_json(path: str, obj: Any, pretty: Optional[bool] = None):
+    """Serialize obj to a JSON file (compact unless pretty), replacing it atomically."""
+    if pretty is None:
+        pretty = _pretty_default()
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        buf = orjson.dumps(obj, option=option)
+    elif pretty:
+        buf = json.dumps(obj, indent=2).encode('utf-8') + b"\n"
+    else:
+        buf = json.dumps(obj, separators=(',', ':')).encode('utf-8') + b"\n"
+    # Write next to the target and rename over it so readers never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.tmp_', suffix='.json')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file owner-only; keep the permissions of the file being replaced
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _content_hash(config_data: Dict) -> bytes:
+    """Hash a config's content, ignoring the last_updated timestamp."""
+    metadata = {k: v for k, v in config_data.get('metadata', {}).items() if k != 'last_updated'}
+    payload = json.dumps({**config_data, 'metadata': metadata}, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).digest()
+
+# (epoch second, ISO string) of the last timestamp formatted by _now_iso
+_last_iso_sec = [0, '']
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, formatted at most once per second."""
+    t = int(time.time())
+    if t != _last_iso_sec[0]:
+        _last_iso_sec[:] = [t, datetime.fromtimestamp(t).isoformat()]
+    return _last_iso_sec[1]
+
+def _dig(data, *keys, default='Unknown'):
+    """Look up a nested key path, returning default if any level is missing."""
+    try:
+        for key in keys:
+            data = data[key]
+    except KeyError:
+        return default
+    return data
+
+# Default configuration looked up in the working directory
+DEFAULT_CONFIG_FILE = "hardware_projection_config.json"
+
+class ConfigSummary(NamedTuple):
+    """One entry of the hardware configuration browser."""
+    filename: str
+    path: str
+    name: str
+    current_hw: str
+    future_hw: str
+    description: str
+    created_date: str
+    is_default: bool
+    version: str = '1.0'
+
+# User-provided sections of a new configuration; asdict() yields the on-disk JSON layout
+@dataclass
+class ConfigMetadata:
+    name: str
+    description: str
+    version: str = "1.0"
+    created_date: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_by: str = "Hardware Config Manager"
+
+@dataclass
+class BaselineMeasurements:
+    ttft_ms: float
+    tpot_ms: float
+    baseline_frequency: int
+    tokens_input: int
+    tokens_output: int
+
+@dataclass
+class CurrentHardware:
+    name: str
+    description: str
+    baseline_measurements: BaselineMeasurements
+
+@dataclass
+class ImprovementFactor:
+    value: float
+    description: str
+    applies_to: List[str]
+    configurable: bool = True
+
+@dataclass
+class FactorValue:
+    value: float
+    description: str
+
+@dataclass
+class CommunicationFactors:
+    bandwidth_improvement: FactorValue
+    latency_improvement: FactorValue
+    applies_to: List[str] = field(default_factory=lambda: ["communication_tasks"])
+    configurable: bool = True
+
+@dataclass
+class ImprovementFactors:
+    xecore_compute: ImprovementFactor
+    hbm_bandwidth: ImprovementFactor
+    fabrication_process: ImprovementFactor
+    communication: CommunicationFactors
+
+@dataclass
+class FutureHardware:
+    name: str
+    description: str
+    improvement_factors: ImprovementFactors
+
+@dataclass
+class HardwareSettings:
+    current_hardware: CurrentHardware
+    future_hardware: FutureHardware
+
+# Static menu text, built once and written in a single call
+_BROWSER_HEADER = "\n".join([
+    "\n" + "="*90,
+    "🔧 Hardware Configuration Browser",
+    "="*90,
+    f"{'#':<3} {'Name':<20} {'Current HW':<10} {'Future HW':<10} {'Description':<25} {'Date':<12}",
+    "-" * 90
+])
+
+_BROWSER_FOOTER = "\n".join([
+    "-" * 90,
+    "Options:",
+    "  Enter number to select configuration",
+    "  'n' or 'new' - Create new configuration",
+    "  'u' or 'update' - Update existing configuration",
+    "  'q' or 'quit' - Return to main menu"
+]) + "\n"
+
+_CREATE_HEADER = "\n" + "="*60 + "\n🛠️ Create New Hardware Configuration\n" + "="*60 + "\n"
+
+_IMPROVEMENT_FACTORS_INTRO = (
+    "\n📈 Hardware Improvement Factors:\n"
+    "(Enter improvement factors - lower values mean better performance for time ratios)\n"
+    "⚠️  All values must be greater than 0 to avoid division by zero errors!\n"
+)
+
+_UPDATE_MENU = (
+    "\nWhat would you like to update?\n"
+    "1. Baseline measurements (TTFT, TPOT, tokens)\n"
+    "2. Hardware improvement factors\n"
+    "3. Hardware names and descriptions\n"
+    "4. Calculation settings\n"
+    "5. All of the above (guided update)\n"
+    "q. Cancel\n"
+)
+
+_APPROACHES_MENU = (
+    "\nAvailable approaches:\n"
+    "1. hardware_calibrated\n"
+    "2. pure_simulation\n"
+    "3. hybrid_correlation\n"
+)
+
+# Answers accepted as "yes" by the guided update (empty means the default, yes)
+_YES = frozenset({'', 'y', 'yes'})
+
+# MARTINI_BATCH letters for the guided update sections, in order:
+# baseline measurements, hardware information, improvement factors, calculation settings
+_GUIDED_SECTION_KEYS = "bhic"
+
+# Sections of a new configuration that do not depend on user input
+_CONFIG_TEMPLATE = {
+    "calculation_settings": {
+        "enabled_approaches": [
+            "hardware_calibrated",
+            "pure_simulation", 
+            "hybrid_correlation"
+        ],
+        "execution_options": {
+            "run_single_approach": False,
+            "run_all_approaches": True,
+            "default_single_approach": "hybrid_correlation"
+        },
+        "simulation_correlation": {
+            "correlation_factor": 2.311296913926394e-06,
+            "calibration_method": "hardware_baseline",
+            "configurable": True
+        },
+        "resource_distribution": {
+            "ex_u1_split": {
+                "memory_copy": 0.30,
+                "communication": 0.70,
+                "configurable": True
+            },
+            "fallback_weights": {
+                "compute": 0.4,
+                "memory": 0.3,
+                "communication": 0.3,
+                "configurable": True
+            }
+        }
+    },
+    "multi_gpu_settings": {
+        "configurations": {
+            "8T": {"gpus": 4, "tiles_per_gpu": 2, "description": "4 GPU configuration with 8 tiles"},
+            "16T": {"gpus": 8, "tiles_per_gpu": 2, "description": "8 GPU configuration with 16 tiles"},
+            "144T": {"gpus": 72, "tiles_per_gpu": 2, "description": "72 GPU configuration with 144 tiles"}
+        },
+        "scaling_efficiency": {
+            "compute_scaling": 0.95,
+            "memory_scaling": 0.90,
+            "communication_overhead": 0.85,
+            "configurable": True
+        }
+    },
+    "output_settings": {
+        "generate_visualizations": True,
+        "export_detailed_results": True,
+        "comparison_tables": True,
+        "performance_summary": True,
+        "output_formats": ["csv", "json", "html"]
+    }
+}
 
 class HardwareConfigManager:
     """Enhanced configuration manager for hardware projections."""
@@ -18,6 +305,16 @@ class HardwareConfigManager:
         self.ensure_config_directory()
         self.current_config_file = None
         self.current_config = None
+        # Browser fields per config path, keyed on (st_mtime_ns, st_size) so unchanged files are not re-parsed
+        self._summary_cache: Dict[str, tuple] = {}
+        # Config sections edited in memory since the last write
+        self._dirty = set()
+        # Full parsed configs per path, keyed on (st_mtime_ns, st_size) like the summary cache
+        self._config_cache: Dict[str, tuple] = {}
+        # Content hash (without last_updated) of each config as last read or written
+        self._saved_hashes: Dict[str, bytes] = {}
+        # Cached result of the default config existence check (None = not checked yet)
+        self._default_present = None
         
     def ensure_config_directory(self):
         """Create config directory if it doesn't exist."""
@@ -25,55 +322,124 @@ class HardwareConfigManager:
             os.makedirs(self.config_dir)
             print(f"📁 Created hardware configs directory: {self.config_dir}")
     
-    def list_available_configs(self) -> List[Dict[str, Any]]:
+    def _read_config_summary(self, path: str, st: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Read the fields shown by the config browser, re-parsing only when the file changed."""
+        if st is None:
+            st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._summary_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        if simdjson is not None:
+            # Lazy document: only the fields looked up below are turned into Python objects
+            config_data = _get_simdjson_parser().parse(_read_bytes(path))
+        else:
+            config_data = _read_json(path)
+        
+        # Keep only what the browser needs; the rest of the tree is discarded
+        metadata = config_data['metadata'] if 'metadata' in config_data else {}
+        summary = {
+            'metadata': {k: metadata[k] for k in ('name', 'description', 'created_date', 'version') if k in metadata},
+            'current_hw': _dig(config_data, 'hardware_settings', 'current_hardware', 'name'),
+            'future_hw': _dig(config_data, 'hardware_settings', 'future_hardware', 'name')
+        }
+        self._summary_cache[path] = (key, summary)
+        return summary
+    
+    def _load_config(self, path: str) -> Dict:
+        """Return a private copy of a parsed config, reading the file only when it changed."""
+        st = os.stat(path)
+        cached = self._config_cache.get(path)
+        if cached is None or cached[0] != (st.st_mtime_ns, st.st_size):
+            self._remember_config(path, _read_json(path), st)
+        return copy.deepcopy(self._config_cache[path][1])
+    
+    def _remember_config(self, path: str, config_data: Dict, st: Optional[os.stat_result] = None):
+        """Cache a snapshot of config_data as the current content of path."""
+        if st is None:
+            st = os.stat(path)
+        self._config_cache[path] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(config_data))
+    
+    def invalidate_config_cache(self, path: str):
+        """Drop the cached browser fields for a config file after it was written."""
+        self._summary_cache.pop(path, None)
+    
+    def _default_config_present(self) -> bool:
+        """Check once whether the default config file exists in the working directory."""
+        if self._default_present is None:
+            self._default_present = os.path.isfile(DEFAULT_CONFIG_FILE)
+        return self._default_present
+    
+    def invalidate_default(self):
+        """Forget the cached default-config check so the next listing stats the file again."""
+        self._default_present = None
+    
+    def list_available_configs(self) -> List[ConfigSummary]:
         """List all available hardware configuration files."""
         configs = []
+        # Canonical paths already listed, so a default config symlinked into config_dir is read once
+        seen_paths = set()
         
         # Check for default config in current directory
-        if os.path.exists("hardware_projection_config.json"):
+        if self._default_config_present():
+            seen_paths.add(os.path.realpath(DEFAULT_CONFIG_FILE))
             try:
-                with open("hardware_projection_config.json", 'r') as f:
-                    config_data = json.load(f)
-                configs.append({
-                    'filename': "hardware_projection_config.json",
-                    'path': "hardware_projection_config.json",
-                    'name': "Default Configuration",
-                    'current_hw': config_data['hardware_settings']['current_hardware']['name'],
-                    'future_hw': config_data['hardware_settings']['future_hardware']['name'],
-                    'description': f"{config_data['hardware_settings']['current_hardware']['name']} → {config_data['hardware_settings']['future_hardware']['name']}",
-                    'is_default': True,
-                    'created_date': config_data.get('metadata', {}).get('created_date', 'Unknown')
-                })
+                summary = self._read_config_summary(DEFAULT_CONFIG_FILE)
+                configs.append(ConfigSummary(
+                    filename=DEFAULT_CONFIG_FILE,
+                    path=DEFAULT_CONFIG_FILE,
+                    name="Default Configuration",
+                    current_hw=summary['current_hw'],
+                    future_hw=summary['future_hw'],
+                    description=f"{summary['current_hw']} → {summary['future_hw']}",
+                    created_date=summary['metadata'].get('created_date', 'Unknown'),
+                    is_default=True
+                ))
             except Exception as e:
                 print(f"⚠️ Error reading default config: {e}")
         
         # Check for configs in config directory
-        for filename in os.listdir(self.config_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.config_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        config_data = json.load(f)
-                    
-                    # Extract metadata
-                    metadata = config_data.get('metadata', {})
-                    hw_settings = config_data.get('hardware_settings', {})
-                    current_hw = hw_settings.get('current_hardware', {}).get('name', 'Unknown')
-                    future_hw = hw_settings.get('future_hardware', {}).get('name', 'Unknown')
-                    
-                    configs.append({
-                        'filename': filename,
-                        'path': filepath,
-                        'name': metadata.get('name', filename.replace('.json', '')),
-                        'current_hw': current_hw,
-                        'future_hw': future_hw,
-                        'description': metadata.get('description', f"{current_hw} → {future_hw}"),
-                        'created_date': metadata.get('created_date', 'Unknown'),
-                        'version': metadata.get('version', '1.0'),
-                        'is_default': False
-                    })
-                except Exception as e:
-                    print(f"⚠️ Error reading {filename}: {e}")
+        with os.scandir(self.config_dir) as entries:
+            # Hidden files include leftover .tmp_ files from interrupted atomic writes
+            json_entries = [entry for entry in entries
+                            if entry.name.endswith('.json') and not entry.name.startswith('.') and entry.is_file()
+                            and os.path.realpath(entry.path) not in seen_paths]
+        
+        def read_entry(entry):
+            try:
+                return self._read_config_summary(os.path.join(self.config_dir, entry.name), entry.stat()), None
+            except Exception as e:
+                return None, e
+        
+        # Overlap file reads across threads; results keep directory order
+        if len(json_entries) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(json_entries))) as executor:
+                results = list(executor.map(read_entry, json_entries))
+        else:
+            results = [read_entry(entry) for entry in json_entries]
+        
+        for entry, (summary, error) in zip(json_entries, results):
+            filename = entry.name
+            if error is not None:
+                print(f"⚠️ Error reading {filename}: {error}")
+                continue
+            
+            metadata = summary['metadata']
+            current_hw = summary['current_hw']
+            future_hw = summary['future_hw']
+            
+            configs.append(ConfigSummary(
+                filename=filename,
+                path=os.path.join(self.config_dir, filename),
+                name=metadata.get('name', filename.replace('.json', '')),
+                current_hw=current_hw,
+                future_hw=future_hw,
+                description=metadata.get('description', f"{current_hw} → {future_hw}"),
+                created_date=metadata.get('created_date', 'Unknown'),
+                is_default=False,
+                version=metadata.get('version', '1.0')
+            ))
         
         return configs
     
@@ -85,27 +451,27 @@ class HardwareConfigManager:
             print("❌ No hardware configurations found!")
             return None
         
-        print("\n" + "="*90)
-        print("🔧 Hardware Configuration Browser")
-        print("="*90)
-        
-        print(f"{'#':<3} {'Name':<20} {'Current HW':<10} {'Future HW':<10} {'Description':<25} {'Date':<12}")
-        print("-" * 90)
+        # Assemble the whole listing and emit it with a single write
+        lines = [_BROWSER_HEADER]
         
         for i, config in enumerate(configs, 1):
-            default_marker = "📌" if config['is_default'] else "  "
-            date_str = config['created_date'][:10] if config['created_date'] != 'Unknown' else 'Unknown'
-            print(f"{i:<3} {config['name'][:19]:<20} {config['current_hw']:<10} {config['future_hw']:<10} {config['description'][:24]:<25} {date_str:<12} {default_marker}")
-        
-        print("-" * 90)
-        print("Options:")
-        print("  Enter number to select configuration")
-        print("  'n' or 'new' - Create new configuration")
-        print("  'u' or 'update' - Update existing configuration")
-        print("  'q' or 'quit' - Return to main menu")
+            default_marker = "📌" if config.is_default else "  "
+            date_str = config.created_date[:10] if config.created_date != 'Unknown' else 'Unknown'
+            lines.append(' '.join((
+                str(i).ljust(3),
+                config.name[:19].ljust(20),
+                config.current_hw.ljust(10),
+                config.future_hw.ljust(10),
+                config.description[:24].ljust(25),
+                date_str.ljust(12),
+                default_marker
+            )))
+        
+        lines.append(_BROWSER_FOOTER)
+        sys.stdout.write("\n".join(lines))
         
         while True:
-            choice = input("\nSelect option: ").strip().lower()
+            choice = self._ask("\nSelect option: ", lower=True)
             
             if choice in ['q', 'quit']:
                 return None
@@ -118,33 +484,33 @@ class HardwareConfigManager:
                     config_idx = int(choice) - 1
                     if 0 <= config_idx < len(configs):
                         selected_config = configs[config_idx]
-                        print(f"\n✅ Selected: {selected_config['name']}")
-                        return selected_config['path']
+                        print(f"\n✅ Selected: {selected_config.name}")
+                        return selected_config.path
                     else:
                         print(f"❌ Invalid selection. Choose 1-{len(configs)}")
                 except ValueError:
                     print("❌ Invalid input. Enter a number, 'new', 'update', or 'quit'")
     
-    def select_config_for_update(self, configs: List[Dict]) -> Optional[str]:
+    def select_config_for_update(self, configs: List[ConfigSummary]) -> Optional[str]:
         """Select a configuration to update."""
         print("\n🔧 Select Configuration to Update:")
         print("-" * 40)
         
         for i, config in enumerate(configs, 1):
-            print(f"{i}. {config['name']} ({config['current_hw']} → {config['future_hw']})")
+            print(f"{i}. {config.name} ({config.current_hw} → {config.future_hw})")
         
         while True:
             try:
-                choice = input("Select configuration number to update: ").strip()
+                choice = self._ask("Select configuration number to update: ")
                 if choice.lower() in ['q', 'quit', 'cancel']:
                     return None
                     
                 config_idx = int(choice) - 1
                 if 0 <= config_idx < len(configs):
                     selected_config = configs[config_idx]
-                    updated = self.update_existing_config(selected_config['path'])
+                    updated = self.update_existing_config(selected_config.path)
                     if updated:
-                        return selected_config['path']
+                        return selected_config.path
                     else:
                         return None
                 else:
@@ -154,104 +520,52 @@ class HardwareConfigManager:
     
     def create_new_hardware_config(self) -> Optional[str]:
         """Interactive creation of new hardware configuration."""
-        print("\n" + "="*60)
-        print("🛠️ Create New Hardware Configuration")
-        print("="*60)
+        sys.stdout.write(_CREATE_HEADER)
         
         # Get basic metadata
-        config_name = input("Configuration name: ").strip()
+        config_name = self._ask("Configuration name: ")
         if not config_name:
             print("❌ Configuration name is required!")
             return None
             
-        description = input("Description (optional): ").strip()
+        description = self._ask("Description (optional): ")
         
         # Get current hardware info
         print("\n📊 Current Hardware Settings:")
-        current_hw_name = input("Current hardware name (e.g., PVC): ").strip() or "PVC"
-        current_hw_desc = input("Current hardware description: ").strip() or f"{current_hw_name} Current Generation"
+        current_hw_name = self._ask("Current hardware name (e.g., PVC): ", "PVC")
+        current_hw_desc = self._ask("Current hardware description: ", f"{current_hw_name} Current Generation")
         
         # Get baseline measurements
         print("\n⏱️ Baseline Performance Measurements:")
-        try:
-            ttft_ms = float(input("TTFT (ms) [8336]: ") or "8336")
-            tpot_ms = float(input("TPOT (ms) [53.46]: ") or "53.46")
-            baseline_freq = int(input("Baseline frequency (MHz) [1600]: ") or "1600")
-            tokens_input = int(input("Input tokens [112]: ") or "112")
-            tokens_output = int(input("Output tokens [2]: ") or "2")
-        except ValueError:
-            print("❌ Invalid numeric input!")
-            return None
+        ttft_ms = self._prompt_positive_float("TTFT (ms) [8336]: ", 8336.0, "TTFT")
+        tpot_ms = self._prompt_positive_float("TPOT (ms) [53.46]: ", 53.46, "TPOT")
+        baseline_freq = self._prompt_positive_int("Baseline frequency (MHz) [1600]: ", 1600, "Baseline frequency")
+        tokens_input = self._prompt_positive_int("Input tokens [112]: ", 112, "Input tokens")
+        tokens_output = self._prompt_positive_int("Output tokens [2]: ", 2, "Output tokens")
         
         # Get future hardware info
         print("\n🚀 Future Hardware Settings:")
-        future_hw_name = input("Future hardware name (e.g., JGS): ").strip() or "JGS"
-        future_hw_desc = input("Future hardware description: ").strip() or f"{future_hw_name} Next Generation"
+        future_hw_name = self._ask("Future hardware name (e.g., JGS): ", "JGS")
+        future_hw_desc = self._ask("Future hardware description: ", f"{future_hw_name} Next Generation")
         
         # Get improvement factors
-        print("\n📈 Hardware Improvement Factors:")
-        print("(Enter improvement factors - lower values mean better performance for time ratios)")
-        print("⚠️  All values must be greater than 0 to avoid division by zero errors!")
-        
-        # XeCore compute improvement with validation
-        while True:
-            try:
-                xecore_input = input("XeCore compute improvement (time ratio, e.g., 0.375 for 37.5% faster) [0.375]: ").strip()
-                xecore_factor = float(xecore_input) if xecore_input else 0.375
-                if xecore_factor <= 0:
-                    print("❌ XeCore compute improvement must be greater than 0")
-                    continue
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        # HBM bandwidth improvement with validation
-        while True:
-            try:
-                hbm_input = input("HBM bandwidth multiplier (e.g., 6.5 for 6.5x faster) [6.5]: ").strip()
-                hbm_bandwidth = float(hbm_input) if hbm_input else 6.5
-                if hbm_bandwidth <= 0:
-                    print("❌ HBM bandwidth multiplier must be greater than 0")
-                    continue
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        # Fabrication process improvement with validation
-        while True:
-            try:
-                fab_input = input("Fabrication process improvement (time ratio, e.g., 0.75 for 25% gain) [0.75]: ").strip()
-                fabrication = float(fab_input) if fab_input else 0.75
-                if fabrication <= 0:
-                    print("❌ Fabrication process improvement must be greater than 0")
-                    continue
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        # Communication bandwidth improvement with validation
-        while True:
-            try:
-                comm_bw_input = input("Communication bandwidth multiplier [12.5]: ").strip()
-                comm_bandwidth = float(comm_bw_input) if comm_bw_input else 12.5
-                if comm_bandwidth <= 0:
-                    print("❌ Communication bandwidth multiplier must be greater than 0")
-                    continue
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        # Communication latency improvement with validation
-        while True:
-            try:
-                comm_lat_input = input("Communication latency improvement multiplier [150]: ").strip()
-                comm_latency = float(comm_lat_input) if comm_lat_input else 150
-                if comm_latency <= 0:
-                    print("❌ Communication latency improvement multiplier must be greater than 0")
-                    continue
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
+        sys.stdout.write(_IMPROVEMENT_FACTORS_INTRO)
+        
+        xecore_factor = self._prompt_positive_float(
+            "XeCore compute improvement (time ratio, e.g., 0.375 for 37.5% faster) [0.375]: ", 0.375,
+            "XeCore compute improvement")
+        hbm_bandwidth = self._prompt_positive_float(
+            "HBM bandwidth multiplier (e.g., 6.5 for 6.5x faster) [6.5]: ", 6.5,
+            "HBM bandwidth multiplier")
+        fabrication = self._prompt_positive_float(
+            "Fabrication process improvement (time ratio, e.g., 0.75 for 25% gain) [0.75]: ", 0.75,
+            "Fabrication process improvement")
+        comm_bandwidth = self._prompt_positive_float(
+            "Communication bandwidth multiplier [12.5]: ", 12.5,
+            "Communication bandwidth multiplier")
+        comm_latency = self._prompt_positive_float(
+            "Communication latency improvement multiplier [150]: ", 150,
+            "Communication latency improvement multiplier")
         
         # Create configuration structure
         config_data = self._create_config_structure(
@@ -266,8 +580,9 @@ class HardwareConfigManager:
         filepath = os.path.join(self.config_dir, filename)
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            _write_json(filepath, config_data)
+            self.invalidate_config_cache(filepath)
+            self.invalidate_default()
             
             print(f"\n✅ Configuration saved: {filepath}")
             self._display_config_summary(config_data, current_hw_name, future_hw_name, 
@@ -280,118 +595,77 @@ class HardwareConfigManager:
             print(f"❌ Error saving configuration: {e}")
             return None
     
+    def _ask(self, prompt: str, default: str = "", lower: bool = False) -> str:
+        """Read one stripped answer, returning default when it is empty."""
+        answer = input(prompt).strip()
+        if lower:
+            answer = answer.lower()
+        return answer or default
+    
+    def _prompt_positive(self, prompt: str, default, label: str, cast):
+        """Prompt until input parses with cast and is greater than 0; empty input keeps the default."""
+        while True:
+            raw = self._ask(prompt)
+            if not raw:
+                return default
+            try:
+                value = cast(raw)
+            except ValueError:
+                print("❌ Please enter a valid number")
+                continue
+            if value <= 0:
+                print(f"❌ {label} must be greater than 0")
+                continue
+            return value
+    
+    def _prompt_positive_float(self, prompt: str, default: float, label: str) -> float:
+        """Prompt for a float greater than 0."""
+        return self._prompt_positive(prompt, default, label, float)
+    
+    def _prompt_positive_int(self, prompt: str, default: int, label: str) -> int:
+        """Prompt for an integer greater than 0."""
+        return self._prompt_positive(prompt, default, label, int)
+    
     def _create_config_structure(self, config_name, description, current_hw_name, current_hw_desc,
                                ttft_ms, tpot_ms, baseline_freq, tokens_input, tokens_output,
                                future_hw_name, future_hw_desc, xecore_factor, hbm_bandwidth,
                                fabrication, comm_bandwidth, comm_latency):
         """Create the complete configuration data structure."""
+        metadata = ConfigMetadata(
+            name=config_name,
+            description=description or f"{current_hw_name} to {future_hw_name} projection"
+        )
+        hardware = HardwareSettings(
+            current_hardware=CurrentHardware(
+                name=current_hw_name,
+                description=current_hw_desc,
+                baseline_measurements=BaselineMeasurements(
+                    ttft_ms, tpot_ms, baseline_freq, tokens_input, tokens_output
+                )
+            ),
+            future_hardware=FutureHardware(
+                name=future_hw_name,
+                description=future_hw_desc,
+                improvement_factors=ImprovementFactors(
+                    xecore_compute=ImprovementFactor(
+                        xecore_factor, "Compute improvement (time ratio - lower is better)", ["compute_tasks"]),
+                    hbm_bandwidth=ImprovementFactor(
+                        hbm_bandwidth, f"{hbm_bandwidth}x higher memory bandwidth (throughput multiplier)", ["memory_tasks"]),
+                    fabrication_process=ImprovementFactor(
+                        fabrication, "Performance gain from process improvement (time ratio)", ["all_tasks"]),
+                    communication=CommunicationFactors(
+                        bandwidth_improvement=FactorValue(
+                            comm_bandwidth, f"{comm_bandwidth}x communication bandwidth improvement"),
+                        latency_improvement=FactorValue(
+                            comm_latency, f"{comm_latency}x lower communication latency")
+                    )
+                )
+            )
+        )
         return {
-            "metadata": {
-                "name": config_name,
-                "description": description or f"{current_hw_name} to {future_hw_name} projection",
-                "version": "1.0",
-                "created_date": datetime.now().isoformat(),
-                "created_by": "Hardware Config Manager"
-            },
-            "hardware_settings": {
-                "current_hardware": {
-                    "name": current_hw_name,
-                    "description": current_hw_desc,
-                    "baseline_measurements": {
-                        "ttft_ms": ttft_ms,
-                        "tpot_ms": tpot_ms,
-                        "baseline_frequency": baseline_freq,
-                        "tokens_input": tokens_input,
-                        "tokens_output": tokens_output
-                    }
-                },
-                "future_hardware": {
-                    "name": future_hw_name,
-                    "description": future_hw_desc,
-                    "improvement_factors": {
-                        "xecore_compute": {
-                            "value": xecore_factor,
-                            "description": "Compute improvement (time ratio - lower is better)",
-                            "applies_to": ["compute_tasks"],
-                            "configurable": True
-                        },
-                        "hbm_bandwidth": {
-                            "value": hbm_bandwidth,
-                            "description": f"{hbm_bandwidth}x higher memory bandwidth (throughput multiplier)",
-                            "applies_to": ["memory_tasks"],
-                            "configurable": True
-                        },
-                        "fabrication_process": {
-                            "value": fabrication,
-                            "description": "Performance gain from process improvement (time ratio)",
-                            "applies_to": ["all_tasks"],
-                            "configurable": True
-                        },
-                        "communication": {
-                            "bandwidth_improvement": {
-                                "value": comm_bandwidth,
-                                "description": f"{comm_bandwidth}x communication bandwidth improvement"
-                            },
-                            "latency_improvement": {
-                                "value": comm_latency,
-                                "description": f"{comm_latency}x lower communication latency"
-                            },
-                            "applies_to": ["communication_tasks"],
-                            "configurable": True
-                        }
-                    }
-                }
-            },
-            "calculation_settings": {
-                "enabled_approaches": [
-                    "hardware_calibrated",
-                    "pure_simulation", 
-                    "hybrid_correlation"
-                ],
-                "execution_options": {
-                    "run_single_approach": False,
-                    "run_all_approaches": True,
-                    "default_single_approach": "hybrid_correlation"
-                },
-                "simulation_correlation": {
-                    "correlation_factor": 2.311296913926394e-06,
-                    "calibration_method": "hardware_baseline",
-                    "configurable": True
-                },
-                "resource_distribution": {
-                    "ex_u1_split": {
-                        "memory_copy": 0.30,
-                        "communication": 0.70,
-                        "configurable": True
-                    },
-                    "fallback_weights": {
-                        "compute": 0.4,
-                        "memory": 0.3,
-                        "communication": 0.3,
-                        "configurable": True
-                    }
-                }
-            },
-            "multi_gpu_settings": {
-                "configurations": {
-                    "8T": {"gpus": 4, "tiles_per_gpu": 2, "description": "4 GPU configuration with 8 tiles"},
-                    "16T": {"gpus": 8, "tiles_per_gpu": 2, "description": "8 GPU configuration with 16 tiles"},
-                    "144T": {"gpus": 72, "tiles_per_gpu": 2, "description": "72 GPU configuration with 144 tiles"}
-                },
-                "scaling_efficiency": {
-                    "compute_scaling": 0.95,
-                    "memory_scaling": 0.90,
-                    "communication_overhead": 0.85,
-                    "configurable": True
-                }
-            },
-            "output_settings": {
-                "generate_visualizations": True,
-                "export_detailed_results": True,
-                "comparison_tables": True,
-                "performance_summary": True,
-                "output_formats": ["csv", "json", "html"]
-            }
+            "metadata": asdict(metadata),
+            "hardware_settings": asdict(hardware),
+            **copy.deepcopy(_CONFIG_TEMPLATE)
         }
     
     def _display_config_summary(self, config_data, current_hw_name, future_hw_name, 
@@ -408,11 +682,11 @@ class HardwareConfigManager:
     def update_existing_config(self, config_path: str) -> bool:
         """Update an existing hardware configuration."""
         try:
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
+            config_data = self._load_config(config_path)
         except Exception as e:
             print(f"❌ Error loading config: {e}")
             return False
+        self._saved_hashes[config_path] = _content_hash(config_data)
         
         print(f"\n🔧 Update Configuration: {os.path.basename(config_path)}")
         print("="*60)
@@ -424,31 +698,29 @@ class HardwareConfigManager:
         print(f"📊 Current Hardware: {current_hw['name']} - {current_hw['description']}")
         print(f"🚀 Future Hardware: {future_hw['name']} - {future_hw['description']}")
         
-        print("\nWhat would you like to update?")
-        print("1. Baseline measurements (TTFT, TPOT, tokens)")
-        print("2. Hardware improvement factors")
-        print("3. Hardware names and descriptions")
-        print("4. Calculation settings")
-        print("5. All of the above (guided update)")
-        print("q. Cancel")
+        sys.stdout.write(_UPDATE_MENU)
         
-        choice = input("\nSelect option: ").strip().lower()
+        choice = self._ask("\nSelect option: ", lower=True)
         
+        # Section updates only edit config_data in memory; the file is written once below
+        self._dirty.clear()
         if choice == '1':
-            return self._update_baseline_measurements(config_data, config_path)
+            updated = self._update_baseline_measurements(config_data)
         elif choice == '2':
-            return self._update_improvement_factors(config_data, config_path)
+            updated = self._update_improvement_factors(config_data)
         elif choice == '3':
-            return self._update_hardware_info(config_data, config_path)
+            updated = self._update_hardware_info(config_data)
         elif choice == '4':
-            return self._update_calculation_settings(config_data, config_path)
+            updated = self._update_calculation_settings(config_data)
         elif choice == '5':
-            return self._guided_full_update(config_data, config_path)
+            updated = self._guided_full_update(config_data)
         else:
             print("❌ Update cancelled")
             return False
+        
+        return updated and self._commit(config_data, config_path)
     
-    def _update_baseline_measurements(self, config_data: Dict, config_path: str) -> bool:
+    def _update_baseline_measurements(self, config_data: Dict) -> bool:
         """Update baseline performance measurements."""
         baseline = config_data['hardware_settings']['current_hardware']['baseline_measurements']
         
@@ -461,23 +733,23 @@ class HardwareConfigManager:
         print(f"  Output tokens: {baseline['tokens_output']}")
         
         try:
-            ttft = input(f"New TTFT (ms) [{baseline['ttft_ms']}]: ").strip()
+            ttft = self._ask(f"New TTFT (ms) [{baseline['ttft_ms']}]: ")
             if ttft:
                 baseline['ttft_ms'] = float(ttft)
                 
-            tpot = input(f"New TPOT (ms) [{baseline['tpot_ms']}]: ").strip()
+            tpot = self._ask(f"New TPOT (ms) [{baseline['tpot_ms']}]: ")
             if tpot:
                 baseline['tpot_ms'] = float(tpot)
                 
-            freq = input(f"New baseline frequency (MHz) [{baseline['baseline_frequency']}]: ").strip()
+            freq = self._ask(f"New baseline frequency (MHz) [{baseline['baseline_frequency']}]: ")
             if freq:
                 baseline['baseline_frequency'] = int(freq)
                 
-            tokens_in = input(f"New input tokens [{baseline['tokens_input']}]: ").strip()
+            tokens_in = self._ask(f"New input tokens [{baseline['tokens_input']}]: ")
             if tokens_in:
                 baseline['tokens_input'] = int(tokens_in)
                 
-            tokens_out = input(f"New output tokens [{baseline['tokens_output']}]: ").strip()
+            tokens_out = self._ask(f"New output tokens [{baseline['tokens_output']}]: ")
             if tokens_out:
                 baseline['tokens_output'] = int(tokens_out)
                 
@@ -485,93 +757,45 @@ class HardwareConfigManager:
             print("❌ Invalid numeric input!")
             return False
         
-        return self._save_config(config_data, config_path)
+        self._dirty.add('baseline_measurements')
+        return True
     
-    def _update_improvement_factors(self, config_data: Dict, config_path: str) -> bool:
+    def _update_improvement_factors(self, config_data: Dict) -> bool:
         """Update hardware improvement factors."""
         factors = config_data['hardware_settings']['future_hardware']['improvement_factors']
         
         print("\n📈 Update Hardware Improvement Factors:")
         print("⚠️  All values must be greater than 0 to avoid division by zero errors!")
         
-        # XeCore compute with validation
-        while True:
-            try:
-                current_xecore = factors['xecore_compute']['value']
-                new_xecore = input(f"XeCore compute improvement (time ratio) [{current_xecore}]: ").strip()
-                if new_xecore:
-                    value = float(new_xecore)
-                    if value <= 0:
-                        print("❌ XeCore compute improvement must be greater than 0")
-                        continue
-                    factors['xecore_compute']['value'] = value
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        # HBM bandwidth with validation
-        while True:
-            try:
-                current_hbm = factors['hbm_bandwidth']['value']
-                new_hbm = input(f"HBM bandwidth multiplier [{current_hbm}]: ").strip()
-                if new_hbm:
-                    value = float(new_hbm)
-                    if value <= 0:
-                        print("❌ HBM bandwidth multiplier must be greater than 0")
-                        continue
-                    factors['hbm_bandwidth']['value'] = value
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        # Fabrication with validation
-        while True:
-            try:
-                current_fab = factors['fabrication_process']['value']
-                new_fab = input(f"Fabrication process improvement (time ratio) [{current_fab}]: ").strip()
-                if new_fab:
-                    value = float(new_fab)
-                    if value <= 0:
-                        print("❌ Fabrication process improvement must be greater than 0")
-                        continue
-                    factors['fabrication_process']['value'] = value
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        # Communication bandwidth with validation
-        while True:
-            try:
-                current_comm_bw = factors['communication']['bandwidth_improvement']['value']
-                new_comm_bw = input(f"Communication bandwidth multiplier [{current_comm_bw}]: ").strip()
-                if new_comm_bw:
-                    value = float(new_comm_bw)
-                    if value <= 0:
-                        print("❌ Communication bandwidth multiplier must be greater than 0")
-                        continue
-                    factors['communication']['bandwidth_improvement']['value'] = value
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        # Communication latency with validation
-        while True:
-            try:
-                current_comm_lat = factors['communication']['latency_improvement']['value']
-                new_comm_lat = input(f"Communication latency improvement multiplier [{current_comm_lat}]: ").strip()
-                if new_comm_lat:
-                    value = float(new_comm_lat)
-                    if value <= 0:
-                        print("❌ Communication latency improvement multiplier must be greater than 0")
-                        continue
-                    factors['communication']['latency_improvement']['value'] = value
-                break
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        return self._save_config(config_data, config_path)
+        xecore = factors['xecore_compute']
+        xecore['value'] = self._prompt_positive_float(
+            f"XeCore compute improvement (time ratio) [{xecore['value']}]: ", xecore['value'],
+            "XeCore compute improvement")
+        
+        hbm = factors['hbm_bandwidth']
+        hbm['value'] = self._prompt_positive_float(
+            f"HBM bandwidth multiplier [{hbm['value']}]: ", hbm['value'],
+            "HBM bandwidth multiplier")
+        
+        fab = factors['fabrication_process']
+        fab['value'] = self._prompt_positive_float(
+            f"Fabrication process improvement (time ratio) [{fab['value']}]: ", fab['value'],
+            "Fabrication process improvement")
+        
+        comm_bw = factors['communication']['bandwidth_improvement']
+        comm_bw['value'] = self._prompt_positive_float(
+            f"Communication bandwidth multiplier [{comm_bw['value']}]: ", comm_bw['value'],
+            "Communication bandwidth multiplier")
+        
+        comm_lat = factors['communication']['latency_improvement']
+        comm_lat['value'] = self._prompt_positive_float(
+            f"Communication latency improvement multiplier [{comm_lat['value']}]: ", comm_lat['value'],
+            "Communication latency improvement multiplier")
+        
+        self._dirty.add('improvement_factors')
+        return True
     
-    def _update_hardware_info(self, config_data: Dict, config_path: str) -> bool:
+    def _update_hardware_info(self, config_data: Dict) -> bool:
         """Update hardware names and descriptions."""
         current_hw = config_data['hardware_settings']['current_hardware']
         future_hw = config_data['hardware_settings']['future_hardware']
@@ -579,26 +803,27 @@ class HardwareConfigManager:
         print("\n🔧 Update Hardware Information:")
         
         # Current hardware
-        new_current_name = input(f"Current hardware name [{current_hw['name']}]: ").strip()
+        new_current_name = self._ask(f"Current hardware name [{current_hw['name']}]: ")
         if new_current_name:
             current_hw['name'] = new_current_name
             
-        new_current_desc = input(f"Current hardware description [{current_hw['description']}]: ").strip()
+        new_current_desc = self._ask(f"Current hardware description [{current_hw['description']}]: ")
         if new_current_desc:
             current_hw['description'] = new_current_desc
         
         # Future hardware
-        new_future_name = input(f"Future hardware name [{future_hw['name']}]: ").strip()
+        new_future_name = self._ask(f"Future hardware name [{future_hw['name']}]: ")
         if new_future_name:
             future_hw['name'] = new_future_name
             
-        new_future_desc = input(f"Future hardware description [{future_hw['description']}]: ").strip()
+        new_future_desc = self._ask(f"Future hardware description [{future_hw['description']}]: ")
         if new_future_desc:
             future_hw['description'] = new_future_desc
         
-        return self._save_config(config_data, config_path)
+        self._dirty.add('hardware_info')
+        return True
     
-    def _update_calculation_settings(self, config_data: Dict, config_path: str) -> bool:
+    def _update_calculation_settings(self, config_data: Dict) -> bool:
         """Update calculation and correlation settings."""
         calc_settings = config_data['calculation_settings']
         
@@ -606,12 +831,9 @@ class HardwareConfigManager:
         print("Current enabled approaches:", calc_settings['enabled_approaches'])
         
         # Update enabled approaches
-        print("\nAvailable approaches:")
-        print("1. hardware_calibrated")
-        print("2. pure_simulation") 
-        print("3. hybrid_correlation")
+        sys.stdout.write(_APPROACHES_MENU)
         
-        approaches_input = input("Enter approach numbers to enable (e.g., '1,3') or press Enter to keep current: ").strip()
+        approaches_input = self._ask("Enter approach numbers to enable (e.g., '1,3') or press Enter to keep current: ")
         if approaches_input:
             try:
                 approach_map = {
@@ -629,7 +851,7 @@ class HardwareConfigManager:
         
         # Update correlation factor
         current_corr = calc_settings['simulation_correlation']['correlation_factor']
-        new_corr = input(f"Simulation correlation factor [{current_corr:.2e}]: ").strip()
+        new_corr = self._ask(f"Simulation correlation factor [{current_corr:.2e}]: ")
         if new_corr:
             try:
                 calc_settings['simulation_correlation']['correlation_factor'] = float(new_corr)
@@ -637,51 +859,68 @@ class HardwareConfigManager:
                 print("❌ Invalid correlation factor!")
                 return False
         
-        return self._save_config(config_data, config_path)
+        self._dirty.add('calculation_settings')
+        return True
     
-    def _guided_full_update(self, config_data: Dict, config_path: str) -> bool:
+    def _guided_full_update(self, config_data: Dict) -> bool:
         """Guided update of all configuration sections."""
         print("\n🎯 Guided Full Configuration Update")
         print("=" * 40)
         
         # Update each section in sequence
         sections = [
-            ("Baseline Measurements", lambda: self._update_baseline_measurements(config_data, config_path)),
-            ("Hardware Information", lambda: self._update_hardware_info(config_data, config_path)),
-            ("Improvement Factors", lambda: self._update_improvement_factors(config_data, config_path)),
-            ("Calculation Settings", lambda: self._update_calculation_settings(config_data, config_path))
+            ("Baseline Measurements", self._update_baseline_measurements),
+            ("Hardware Information", self._update_hardware_info),
+            ("Improvement Factors", self._update_improvement_factors),
+            ("Calculation Settings", self._update_calculation_settings)
         ]
         
+        # MARTINI_BATCH selects sections up front in one pass, e.g. "bi" for baseline + improvement factors
+        batch = os.environ.get('MARTINI_BATCH')
+        if batch is not None:
+            selected = batch.strip().lower()
+            for letter, (section_name, update_func) in zip(_GUIDED_SECTION_KEYS, sections):
+                if letter in selected:
+                    print(f"\n📋 {section_name}:")
+                    update_func(config_data)
+            return True
+        
         for section_name, update_func in sections:
             print(f"\n📋 {section_name}:")
-            proceed = input(f"Update {section_name}? (y/n) [y]: ").strip().lower()
-            if proceed in ['', 'y', 'yes']:
-                # For guided update, we don't save after each step
-                if section_name == "Baseline Measurements":
-                    self._update_baseline_measurements(config_data, None)
-                elif section_name == "Hardware Information":
-                    self._update_hardware_info(config_data, None)
-                elif section_name == "Improvement Factors":
-                    self._update_improvement_factors(config_data, None)
-                elif section_name == "Calculation Settings":
-                    self._update_calculation_settings(config_data, None)
-        
-        # Save once at the end
-        return self._save_config(config_data, config_path)
+            proceed = self._ask(f"Update {section_name}? (y/n) [y]: ", lower=True)
+            if proceed in _YES:
+                update_func(config_data)
+        
+        return True
     
-    def _save_config(self, config_data: Dict, config_path: str) -> bool:
-        """Save configuration data to file."""
-        if config_path is None:
-            return True  # For guided updates, don't save until the end
-            
+    def _commit(self, config_data: Dict, config_path: str) -> bool:
+        """Write pending section edits to disk in a single save."""
+        if not self._dirty:
+            return True
+        saved = self._save_config(config_data, config_path)
+        if saved:
+            self._dirty.clear()
+        return saved
+    
+    def _save_config(self, config_data: Dict, config_path: str, pretty: Optional[bool] = None) -> bool:
+        """Save configuration data to file (indented if pretty, else per MARTINI_CONFIG_PRETTY)."""
         try:
+            # Edits that left the content as it is on disk need no write (or new timestamp)
+            content_hash = _content_hash(config_data)
+            if self._saved_hashes.get(config_path) == content_hash:
+                print(f"✅ Configuration unchanged: {config_path}")
+                return True
+            
             # Update metadata
             if 'metadata' not in config_data:
                 config_data['metadata'] = {}
-            config_data['metadata']['last_updated'] = datetime.now().isoformat()
+            config_data['metadata']['last_updated'] = _now_iso()
             
-            with open(config_path, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            _write_json(config_path, config_data, pretty)
+            self._saved_hashes[config_path] = content_hash
+            self._remember_config(config_path, config_data)
+            self.invalidate_config_cache(config_path)
+            self.invalidate_default()
             print(f"✅ Configuration updated: {config_path}")
             return True
         except Exception as e:
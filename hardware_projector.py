@@ -4,12 +4,75 @@ Hardware Performance Projector v1.0x - Advanced JGS Hardware Projection
 Projects performance from PVC baseline to JGS hardware across multiple improvement parameters.
 """
 
+import argparse
+import io
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Figures are only written to files
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
 import json
+import math
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional; fall back to Excel
+    pa = pq = None
+
+try:
+    import xlsxwriter
+except ImportError:  # Excel export then uses pandas' default openpyxl engine
+    xlsxwriter = None
+
+# Columns of simulation_results.csv read for the resource analysis
+RAW_DATA_COLUMNS = ['RESOURCE', 'DURATION']
+
+# Resource class codes stored in the raw data '_cls' column
+RESOURCE_COMPUTE, RESOURCE_MEMORY_COMM, RESOURCE_OTHER, RESOURCE_IGNORED = 0, 1, 2, 3
+
+def classify_resources(resources):
+    """Class code per RESOURCE: ex_u0 tile compute, then ex_u1 tile memory/comm, then other gt/."""
+    # A run only has a handful of distinct resource names: hash every row once,
+    # scan the distinct names for the substrings, then broadcast back by code
+    codes, uniques = pd.factorize(resources, use_na_sentinel=False)
+    resource = pd.Series(uniques).astype(str)
+    is_tile = resource.str.contains('GT_TILE_', regex=False).to_numpy()
+    cls = np.where(resource.str.startswith('gt/').to_numpy(), RESOURCE_OTHER, RESOURCE_IGNORED).astype(np.int8)
+    cls[is_tile & resource.str.contains('/ex_u1', regex=False).to_numpy()] = RESOURCE_MEMORY_COMM
+    cls[is_tile & resource.str.contains('/ex_u0', regex=False).to_numpy()] = RESOURCE_COMPUTE
+    return cls[codes]
+
+# Numeric columns of the calculate_jgs_projections frame, after frequency/frequency_str
+PROJECTION_COLUMNS = (
+    'pvc_duration', 'jgs_duration', 'overall_improvement',
+    'compute_improvement', 'memory_improvement', 'comm_improvement',
+    'jgs_compute_duration', 'jgs_memory_duration', 'jgs_comm_duration', 'jgs_other_duration',
+    'performance_gain_percent'
+)
+
+# Multi-GPU scaling configurations (2 tiles per GPU), scaled from the 8-tile baseline
+GPU_CONFIGS = [
+    {'tiles': 8, 'gpus': 4, 'label': '8T(4GPU)', 'short_label': '8T(4G)'},
+    {'tiles': 16, 'gpus': 8, 'label': '16T(8GPU)', 'short_label': '16T(8G)'},
+    {'tiles': 144, 'gpus': 72, 'label': '144T(72GPU)', 'short_label': '144T(72G)'}
+]
+GPU_SCALE_FACTORS = np.array([config['tiles'] / 8 for config in GPU_CONFIGS])
+
+def scale_llm_metrics(llm_df):
+    """Scale TGS/TTFT to every GPU configuration; each array is (configs, frequencies)."""
+    scales = GPU_SCALE_FACTORS[:, None]
+    return {
+        # Higher parallelism = higher throughput
+        'pvc_tgs': llm_df['pvc_tgs'].to_numpy()[None, :] * scales,
+        'jgs_tgs': llm_df['jgs_tgs'].to_numpy()[None, :] * scales,
+        # TTFT scales with parallelism (more GPUs = faster first token)
+        'pvc_ttft_ms': llm_df['pvc_ttft_ms'].to_numpy()[None, :] / scales,
+        'jgs_ttft_ms': llm_df['jgs_ttft_ms'].to_numpy()[None, :] / scales
+    }
 
 class HardwareProjector:
     def __init__(self):
@@ -34,6 +97,35 @@ class HardwareProjector:
             'communication': 0.70    # 70% Communication
         }
         
+        # Per-component time ratios (compute, memory, comm, other), constant for the run
+        # 1. XeCore compute improvement (35-40% faster)
+        # 2. Memory improvement: 6-7x HBM bandwidth
+        # 3. Communication improvement: 12x bandwidth + 150x latency
+        #    Assume bandwidth improvement dominates for throughput, latency for responsiveness;
+        #    use geometric mean for combined improvement
+        # 4. Fabrication process improvement (25% gain), applied to all components
+        comm = self.improvement_factors['communication']
+        self._comm_combined = math.sqrt(comm['bandwidth_improvement'] * comm['latency_improvement'])
+        fabrication_factor = self.improvement_factors['fabrication_process']
+        self._component_scales = np.array([
+            self.improvement_factors['xecore_compute'] * fabrication_factor,
+            fabrication_factor / self.improvement_factors['hbm_bandwidth'],
+            fabrication_factor / self._comm_combined,
+            fabrication_factor
+        ])
+        
+        # Fallback when no raw data is available for a frequency:
+        # conservative estimate using geometric mean of all improvements
+        xecore_factor = 1 / self.improvement_factors['xecore_compute']  # Convert to improvement ratio
+        hbm_factor = self.improvement_factors['hbm_bandwidth']
+        fab_factor = 1 / fabrication_factor
+        # Weighted combination (assuming 40% compute, 30% memory, 30% comm)
+        self._fallback_combined_factor = (xecore_factor ** 0.4) * (hbm_factor ** 0.3) * (self._comm_combined ** 0.3) * fab_factor
+        self._fallback_improvements = (xecore_factor * fab_factor, hbm_factor * fab_factor, self._comm_combined * fab_factor)
+        
+        # Resource analysis summaries per frequency key ('600', '1000', ...)
+        self._analysis_cache = {}
+        
         # Load baseline performance data
         self.load_baseline_data()
         
@@ -46,11 +138,17 @@ class HardwareProjector:
             
             # Load detailed raw CSV data for resource analysis
             self.raw_data = {}
+            self._analysis_cache.clear()
             for freq in ['600', '1000', '1600', '2000']:
                 try:
-                    df = pd.read_csv(f'temp_data/{freq}mhz/simulation_results.csv')
+                    # Only the columns used by the resource analysis
+                    df = pd.read_csv(f'temp_data/{freq}mhz/simulation_results.csv',
+                                     usecols=RAW_DATA_COLUMNS,
+                                     dtype={'RESOURCE': str})
                     # Filter for GT resources only
-                    gt_df = df[df['RESOURCE'].str.contains('gt/', na=False)]
+                    gt_df = df[df['RESOURCE'].str.contains('gt/', na=False, regex=False)]
+                    # Classify once here so every analysis of this frequency is just masked sums
+                    gt_df = gt_df.assign(_cls=classify_resources(gt_df['RESOURCE']))
                     self.raw_data[freq] = gt_df
                     print(f"✅ Loaded {freq}MHz raw data: {len(gt_df)} GT resources")
                 except FileNotFoundError:
@@ -65,121 +163,87 @@ class HardwareProjector:
         if freq_data is None or freq_data.empty:
             return None
             
-        # Categorize resources based on RESOURCE column patterns
-        analysis = {
-            'compute_tasks': [],      # gt/GT_TILE_*/ex_u0 - XeCore compute tasks
-            'memory_comm_tasks': [],  # gt/GT_TILE_*/ex_u1 - Memory + Communication tasks
-            'other_tasks': []         # Other GT resources
-        }
-        
-        total_compute_duration = 0
-        total_memory_comm_duration = 0
-        total_other_duration = 0
-        
         try:
-            # Ensure proper data types
-            freq_data = freq_data.copy()
-            freq_data['DURATION'] = pd.to_numeric(freq_data['DURATION'], errors='coerce')
-            freq_data = freq_data.dropna(subset=['DURATION'])
+            # Ensure proper data types; only rows with a numeric duration count
+            duration = pd.to_numeric(freq_data['DURATION'], errors='coerce')
+            valid = duration.notna()
+            duration = duration[valid].to_numpy(dtype=float)
             
-            for idx, row in freq_data.iterrows():
-                resource = str(row['RESOURCE'])
-                duration = float(row['DURATION'])
-                transition = str(row['TRANSITION'])
-                
-                if '/ex_u0' in resource and 'GT_TILE_' in resource:
-                    # XeCore compute tasks
-                    analysis['compute_tasks'].append({
-                        'resource': resource,
-                        'duration': duration,
-                        'transition': transition
-                    })
-                    total_compute_duration += duration
-                    
-                elif '/ex_u1' in resource and 'GT_TILE_' in resource:
-                    # Memory + Communication tasks
-                    analysis['memory_comm_tasks'].append({
-                        'resource': resource,
-                        'duration': duration,
-                        'transition': transition
-                    })
-                    total_memory_comm_duration += duration
-                    
-                elif resource.startswith('gt/'):
-                    # Other GT resources
-                    analysis['other_tasks'].append({
-                        'resource': resource,
-                        'duration': duration,
-                        'transition': transition
-                    })
-                    total_other_duration += duration
+            # Categorize resources based on RESOURCE column patterns
+            # (precomputed at load time, or classified here for other frames):
+            #   gt/GT_TILE_*/ex_u0 - XeCore compute tasks
+            #   gt/GT_TILE_*/ex_u1 - Memory + Communication tasks
+            #   other GT resources
+            if '_cls' in freq_data:
+                cls = freq_data['_cls'][valid].to_numpy()
+            else:
+                cls = classify_resources(freq_data['RESOURCE'][valid])
+            is_compute = cls == RESOURCE_COMPUTE
+            is_memory_comm = cls == RESOURCE_MEMORY_COMM
+            is_other = cls == RESOURCE_OTHER
+            
+            total_compute_duration = float(duration[is_compute].sum())
+            total_memory_comm_duration = float(duration[is_memory_comm].sum())
+            total_other_duration = float(duration[is_other].sum())
         except Exception as e:
             print(f"⚠️ Error processing frequency data: {e}")
             return None
         
-        analysis['summary'] = {
+        total_duration = total_compute_duration + total_memory_comm_duration + total_other_duration
+        inv_total = (1.0 / total_duration) if total_duration > 0 else 0.0
+        analysis = {'summary': {
             'compute_duration': total_compute_duration,
             'memory_comm_duration': total_memory_comm_duration,
             'other_duration': total_other_duration,
-            'total_duration': total_compute_duration + total_memory_comm_duration + total_other_duration,
-            'compute_percentage': (total_compute_duration / (total_compute_duration + total_memory_comm_duration + total_other_duration)) * 100 if (total_compute_duration + total_memory_comm_duration + total_other_duration) > 0 else 0,
-            'memory_comm_percentage': (total_memory_comm_duration / (total_compute_duration + total_memory_comm_duration + total_other_duration)) * 100 if (total_compute_duration + total_memory_comm_duration + total_other_duration) > 0 else 0,
-            'compute_tasks_count': len(analysis['compute_tasks']),
-            'memory_comm_tasks_count': len(analysis['memory_comm_tasks']),
-            'other_tasks_count': len(analysis['other_tasks'])
-        }
+            'total_duration': total_duration,
+            'compute_percentage': total_compute_duration * inv_total * 100,
+            'memory_comm_percentage': total_memory_comm_duration * inv_total * 100,
+            'compute_tasks_count': int(is_compute.sum()),
+            'memory_comm_tasks_count': int(is_memory_comm.sum()),
+            'other_tasks_count': int(is_other.sum())
+        }}
         
         return analysis
+    
+    def _get_analysis(self, freq_key):
+        """Resource analysis summary for a frequency, computed once per loaded dataset."""
+        if freq_key not in self._analysis_cache:
+            freq_data = self.raw_data.get(freq_key)
+            analysis = self.analyze_resource_types(freq_data) if freq_data is not None else None
+            self._analysis_cache[freq_key] = analysis['summary'] if analysis else None
+        return self._analysis_cache[freq_key]
         
     def calculate_jgs_projections(self):
         """Calculate JGS hardware projections for all frequencies."""
         if self.sim_data is None:
             return None
             
-        projections = []
-        
-        for _, row in self.sim_data.iterrows():
-            freq_str = row['Frequency']
-            freq_num = int(freq_str.replace('MHz', ''))
-            pvc_duration = row['total_duration']
+        # One row per frequency, filled in place (columns as in PROJECTION_COLUMNS)
+        n = len(self.sim_data)
+        freq_nums = np.empty(n, dtype=np.int64)
+        freq_strs = self.sim_data['Frequency'].to_numpy()
+        values = np.empty((n, len(PROJECTION_COLUMNS)))
+        
+        for i, (freq_str, pvc_duration) in enumerate(zip(freq_strs, self.sim_data['total_duration'])):
+            freq_nums[i] = int(freq_str.replace('MHz', ''))
             
             # Get detailed resource analysis for this frequency
-            freq_data = self.raw_data.get(freq_str.replace('MHz', ''))
-            resource_analysis = self.analyze_resource_types(freq_data) if freq_data is not None else None
+            resource_summary = self._get_analysis(freq_str.replace('MHz', ''))
             
-            if resource_analysis:
+            if resource_summary:
                 # Detailed projection based on resource types
-                compute_duration = resource_analysis['summary']['compute_duration']
-                memory_comm_duration = resource_analysis['summary']['memory_comm_duration']
-                other_duration = resource_analysis['summary']['other_duration']
-                
-                # Apply hardware improvements
-                # 1. XeCore compute improvement (35-40% faster)
-                jgs_compute_duration = compute_duration * self.improvement_factors['xecore_compute']
+                compute_duration = resource_summary['compute_duration']
+                memory_comm_duration = resource_summary['memory_comm_duration']
+                other_duration = resource_summary['other_duration']
                 
-                # 2. Memory + Communication improvements (combined)
+                # Split ex_u1 time into memory copy and communication portions
                 memory_portion = memory_comm_duration * self.ex_u1_distribution['memory_copy']
                 comm_portion = memory_comm_duration * self.ex_u1_distribution['communication']
                 
-                # Memory improvement: 6-7x HBM bandwidth
-                jgs_memory_duration = memory_portion / self.improvement_factors['hbm_bandwidth']
-                
-                # Communication improvement: 12x bandwidth + 150x latency
-                # Assume bandwidth improvement dominates for throughput, latency for responsiveness
-                comm_bandwidth_factor = self.improvement_factors['communication']['bandwidth_improvement']
-                comm_latency_factor = self.improvement_factors['communication']['latency_improvement']
-                # Use geometric mean for combined improvement
-                comm_combined_factor = np.sqrt(comm_bandwidth_factor * comm_latency_factor)
-                jgs_comm_duration = comm_portion / comm_combined_factor
-                
-                # 3. Fabrication process improvement (25% gain)
-                fabrication_factor = self.improvement_factors['fabrication_process']
-                
-                # Apply fabrication improvement to all components
-                jgs_compute_duration *= fabrication_factor
-                jgs_memory_duration *= fabrication_factor
-                jgs_comm_duration *= fabrication_factor
-                jgs_other_duration = other_duration * fabrication_factor  # Apply to other tasks too
+                # Apply hardware improvements to all four components in one step
+                portions = np.array([compute_duration, memory_portion, comm_portion, other_duration])
+                (jgs_compute_duration, jgs_memory_duration,
+                 jgs_comm_duration, jgs_other_duration) = (portions * self._component_scales).tolist()
                 
                 jgs_total_duration = jgs_compute_duration + jgs_memory_duration + jgs_comm_duration + jgs_other_duration
                 
@@ -190,21 +254,10 @@ class HardwareProjector:
                 
             else:
                 # Fallback: Apply combined improvement to total duration
-                # Conservative estimate using geometric mean of all improvements
-                xecore_factor = 1 / self.improvement_factors['xecore_compute']  # Convert to improvement ratio
-                hbm_factor = self.improvement_factors['hbm_bandwidth']
-                fab_factor = 1 / self.improvement_factors['fabrication_process']
-                comm_factor = np.sqrt(self.improvement_factors['communication']['bandwidth_improvement'] * 
-                                    self.improvement_factors['communication']['latency_improvement'])
-                
-                # Weighted combination (assuming 40% compute, 30% memory, 30% comm)
-                combined_factor = (xecore_factor ** 0.4) * (hbm_factor ** 0.3) * (comm_factor ** 0.3) * fab_factor
-                jgs_total_duration = pvc_duration / combined_factor
+                jgs_total_duration = pvc_duration / self._fallback_combined_factor
                 
                 # Individual components (estimated)
-                compute_improvement = xecore_factor * fab_factor
-                memory_improvement = hbm_factor * fab_factor
-                comm_improvement = comm_factor * fab_factor
+                compute_improvement, memory_improvement, comm_improvement = self._fallback_improvements
                 
                 jgs_compute_duration = pvc_duration * 0.4 / compute_improvement
                 jgs_memory_duration = pvc_duration * 0.3 / memory_improvement
@@ -214,23 +267,18 @@ class HardwareProjector:
             # Calculate overall improvement
             overall_improvement = pvc_duration / jgs_total_duration if jgs_total_duration > 0 else 1
             
-            projections.append({
-                'frequency': freq_num,
-                'frequency_str': freq_str,
-                'pvc_duration': pvc_duration,
-                'jgs_duration': jgs_total_duration,
-                'overall_improvement': overall_improvement,
-                'compute_improvement': compute_improvement,
-                'memory_improvement': memory_improvement,
-                'comm_improvement': comm_improvement,
-                'jgs_compute_duration': jgs_compute_duration,
-                'jgs_memory_duration': jgs_memory_duration,
-                'jgs_comm_duration': jgs_comm_duration,
-                'jgs_other_duration': jgs_other_duration,
-                'performance_gain_percent': (overall_improvement - 1) * 100
-            })
-        
-        return pd.DataFrame(projections)
+            values[i] = (
+                pvc_duration, jgs_total_duration, overall_improvement,
+                compute_improvement, memory_improvement, comm_improvement,
+                jgs_compute_duration, jgs_memory_duration, jgs_comm_duration, jgs_other_duration,
+                (overall_improvement - 1) * 100
+            )
+        
+        return pd.DataFrame({
+            'frequency': freq_nums,
+            'frequency_str': freq_strs,
+            **dict(zip(PROJECTION_COLUMNS, values.T))
+        })
         
     def project_llm_performance(self, hardware_df):
         """Project LLM performance (TTFT/TPOT/TGS) for JGS hardware."""
@@ -244,77 +292,86 @@ class HardwareProjector:
         output_tokens = 2
         total_tokens = 114
         
-        llm_projections = []
+        freq = hardware_df['frequency'].to_numpy()
+        pvc_duration = hardware_df['pvc_duration'].to_numpy(dtype=float)
+        overall_improvement = hardware_df['overall_improvement'].to_numpy(dtype=float)
         
-        for _, row in hardware_df.iterrows():
-            freq = row['frequency']
-            pvc_duration = row['pvc_duration']
-            jgs_duration = row['jgs_duration']
-            overall_improvement = row['overall_improvement']
-            
-            # Get PVC simulation duration ratio for frequency scaling
-            if freq == baseline_freq:
-                freq_scale_factor = 1.0
-            else:
-                baseline_sim_duration = hardware_df[hardware_df['frequency'] == baseline_freq]['pvc_duration'].iloc[0]
-                freq_scale_factor = pvc_duration / baseline_sim_duration
-            
-            # Project PVC performance at this frequency
-            pvc_ttft = baseline_ttft_ms * freq_scale_factor
-            pvc_tpot = baseline_tpot_ms * freq_scale_factor
-            pvc_total = pvc_ttft + pvc_tpot
-            
-            # Project JGS performance using hardware improvements
-            jgs_ttft = pvc_ttft / overall_improvement
-            jgs_tpot = pvc_tpot / overall_improvement
-            jgs_total = jgs_ttft + jgs_tpot
-            
+        # PVC simulation duration ratio for frequency scaling (1.0 at the baseline frequency)
+        is_baseline = freq == baseline_freq
+        freq_scale_factor = np.ones(len(freq))
+        if not is_baseline.all():
+            baseline_sim_duration = pvc_duration[is_baseline][0]
+            freq_scale_factor = np.where(is_baseline, 1.0, pvc_duration / baseline_sim_duration)
+        
+        # Project PVC performance at each frequency
+        pvc_ttft = baseline_ttft_ms * freq_scale_factor
+        pvc_tpot = baseline_tpot_ms * freq_scale_factor
+        pvc_total = pvc_ttft + pvc_tpot
+        
+        # Project JGS performance using hardware improvements
+        jgs_ttft = pvc_ttft / overall_improvement
+        jgs_tpot = pvc_tpot / overall_improvement
+        jgs_total = jgs_ttft + jgs_tpot
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
             # Calculate Token Generation Speeds
-            pvc_tgs = total_tokens / (pvc_total / 1000) if pvc_total > 0 else 0
-            jgs_tgs = total_tokens / (jgs_total / 1000) if jgs_total > 0 else 0
+            pvc_tgs = np.where(pvc_total > 0, total_tokens / (pvc_total / 1000), 0.0)
+            jgs_tgs = np.where(jgs_total > 0, total_tokens / (jgs_total / 1000), 0.0)
             
             # Calculate output token rates
-            pvc_output_rate = output_tokens / (pvc_tpot / 1000) if pvc_tpot > 0 else 0
-            jgs_output_rate = output_tokens / (jgs_tpot / 1000) if jgs_tpot > 0 else 0
+            pvc_output_rate = np.where(pvc_tpot > 0, output_tokens / (pvc_tpot / 1000), 0.0)
+            jgs_output_rate = np.where(jgs_tpot > 0, output_tokens / (jgs_tpot / 1000), 0.0)
             
-            llm_projections.append({
-                'frequency': freq,
-                'frequency_str': f"{freq}MHz",
-                'pvc_ttft_ms': pvc_ttft,
-                'pvc_tpot_ms': pvc_tpot,
-                'pvc_total_ms': pvc_total,
-                'pvc_tgs': pvc_tgs,
-                'pvc_output_rate': pvc_output_rate,
-                'jgs_ttft_ms': jgs_ttft,
-                'jgs_tpot_ms': jgs_tpot,
-                'jgs_total_ms': jgs_total,
-                'jgs_tgs': jgs_tgs,
-                'jgs_output_rate': jgs_output_rate,
-                'llm_improvement': jgs_tgs / pvc_tgs if pvc_tgs > 0 else 1,
-                'llm_improvement_percent': ((jgs_tgs / pvc_tgs) - 1) * 100 if pvc_tgs > 0 else 0
-            })
-        
-        return pd.DataFrame(llm_projections)
+            llm_improvement = np.where(pvc_tgs > 0, jgs_tgs / pvc_tgs, 1.0)
+            llm_improvement_percent = np.where(pvc_tgs > 0, ((jgs_tgs / pvc_tgs) - 1) * 100, 0.0)
+        
+        return pd.DataFrame({
+            'frequency': freq,
+            'frequency_str': [f"{f}MHz" for f in freq],
+            'pvc_ttft_ms': pvc_ttft,
+            'pvc_tpot_ms': pvc_tpot,
+            'pvc_total_ms': pvc_total,
+            'pvc_tgs': pvc_tgs,
+            'pvc_output_rate': pvc_output_rate,
+            'jgs_ttft_ms': jgs_ttft,
+            'jgs_tpot_ms': jgs_tpot,
+            'jgs_total_ms': jgs_total,
+            'jgs_tgs': jgs_tgs,
+            'jgs_output_rate': jgs_output_rate,
+            'llm_improvement': llm_improvement,
+            'llm_improvement_percent': llm_improvement_percent
+        })
         
     def create_hardware_comparison_visualizations(self, hardware_df, llm_df):
         """Create comprehensive hardware comparison visualizations."""
         plt.style.use('default')
         fig = plt.figure(figsize=(24, 18))
         
+        # Plotted columns as plain arrays, converted once for all panels
+        freq_strs = llm_df['frequency_str'].to_numpy()
+        pvc_tgs = llm_df['pvc_tgs'].to_numpy()
+        jgs_tgs = llm_df['jgs_tgs'].to_numpy()
+        pvc_ttft_s = llm_df['pvc_ttft_ms'].to_numpy() / 1000
+        jgs_ttft_s = llm_df['jgs_ttft_ms'].to_numpy() / 1000
+        pvc_tpot = llm_df['pvc_tpot_ms'].to_numpy()
+        jgs_tpot = llm_df['jgs_tpot_ms'].to_numpy()
+        llm_improvement = llm_df['llm_improvement'].to_numpy()
+        improvement_values = llm_df['llm_improvement_percent'].to_numpy()
+        
         # 1. Hardware Performance Comparison
         ax1 = plt.subplot(3, 4, 1)
-        x_pos = range(len(hardware_df))
+        x_pos = np.arange(len(hardware_df))
         width = 0.35
         
-        plt.bar([x - width/2 for x in x_pos], hardware_df['pvc_duration'] / 1000000, 
+        plt.bar(x_pos - width/2, hardware_df['pvc_duration'].to_numpy() / 1000000, 
                 width, label='PVC (Baseline)', color='lightcoral', alpha=0.8)
-        plt.bar([x + width/2 for x in x_pos], hardware_df['jgs_duration'] / 1000000, 
+        plt.bar(x_pos + width/2, hardware_df['jgs_duration'].to_numpy() / 1000000, 
                 width, label='JGS (Projected)', color='lightgreen', alpha=0.8)
         
         plt.title('Hardware Performance Comparison\n(Lower is Better)', fontweight='bold')
         plt.xlabel('Frequency')
         plt.ylabel('Duration (Million Units)')
-        plt.xticks(x_pos, hardware_df['frequency_str'])
+        plt.xticks(x_pos, hardware_df['frequency_str'].to_numpy())
         plt.legend()
         plt.grid(axis='y', alpha=0.3)
         
@@ -342,15 +399,15 @@ class HardwareProjector:
         
         # 3. LLM Performance Comparison - TGS
         ax3 = plt.subplot(3, 4, 3)
-        plt.bar([x - width/2 for x in x_pos], llm_df['pvc_tgs'], 
+        plt.bar(x_pos - width/2, pvc_tgs, 
                 width, label='PVC TGS', color='lightcoral', alpha=0.8)
-        plt.bar([x + width/2 for x in x_pos], llm_df['jgs_tgs'], 
+        plt.bar(x_pos + width/2, jgs_tgs, 
                 width, label='JGS TGS', color='lightgreen', alpha=0.8)
         
         plt.title('Token Generation Speed\n(Higher is Better)', fontweight='bold')
         plt.xlabel('Frequency')
         plt.ylabel('Tokens per Second')
-        plt.xticks(x_pos, llm_df['frequency_str'])
+        plt.xticks(x_pos, freq_strs)
         plt.legend()
         plt.grid(axis='y', alpha=0.3)
         
@@ -358,14 +415,13 @@ class HardwareProjector:
         ax4 = plt.subplot(3, 4, 4)
         
         # Create gradient colors based on improvement values
-        improvement_values = llm_df['llm_improvement_percent']
         colors = ['#2E8B57' if x > 200 else '#32CD32' if x > 100 else '#90EE90' for x in improvement_values]
         
-        bars = plt.bar(range(len(llm_df)), improvement_values, 
+        bars = plt.bar(x_pos, improvement_values, 
                       color=colors, alpha=0.8, edgecolor='black', linewidth=1)
         
         # Add enhanced value labels with improvement factor
-        for i, (percent_val, factor_val) in enumerate(zip(improvement_values, llm_df['llm_improvement'])):
+        for i, (percent_val, factor_val) in enumerate(zip(improvement_values, llm_improvement)):
             # Main percentage label
             plt.text(i, percent_val + 10, f'{percent_val:+.0f}%', 
                     ha='center', va='bottom', fontweight='bold', fontsize=12)
@@ -377,7 +433,7 @@ class HardwareProjector:
         plt.title('LLM Performance Improvement\n(JGS vs PVC Hardware)', fontweight='bold', fontsize=14)
         plt.xlabel('Frequency', fontweight='bold')
         plt.ylabel('Performance Improvement (%)', fontweight='bold')
-        plt.xticks(range(len(llm_df)), llm_df['frequency_str'], fontweight='bold')
+        plt.xticks(x_pos, freq_strs, fontweight='bold')
         
         # Enhanced baseline and grid
         plt.axhline(y=0, color='red', linestyle='--', alpha=0.8, linewidth=2, label='PVC Baseline')
@@ -387,33 +443,33 @@ class HardwareProjector:
         plt.legend(loc='upper left')
         
         # Set y-axis limits for better visualization
-        plt.ylim(-50, max(improvement_values) + 50)
+        plt.ylim(-50, improvement_values.max() + 50)
         
         # 5. TTFT Comparison
         ax5 = plt.subplot(3, 4, 5)
-        plt.bar([x - width/2 for x in x_pos], llm_df['pvc_ttft_ms'] / 1000, 
+        plt.bar(x_pos - width/2, pvc_ttft_s, 
                 width, label='PVC TTFT', color='lightcoral', alpha=0.8)
-        plt.bar([x + width/2 for x in x_pos], llm_df['jgs_ttft_ms'] / 1000, 
+        plt.bar(x_pos + width/2, jgs_ttft_s, 
                 width, label='JGS TTFT', color='lightgreen', alpha=0.8)
         
         plt.title('Time to First Token\n(Lower is Better)', fontweight='bold')
         plt.xlabel('Frequency')
         plt.ylabel('TTFT (seconds)')
-        plt.xticks(x_pos, llm_df['frequency_str'])
+        plt.xticks(x_pos, freq_strs)
         plt.legend()
         plt.grid(axis='y', alpha=0.3)
         
         # 6. TPOT Comparison
         ax6 = plt.subplot(3, 4, 6)
-        plt.bar([x - width/2 for x in x_pos], llm_df['pvc_tpot_ms'], 
+        plt.bar(x_pos - width/2, pvc_tpot, 
                 width, label='PVC TPOT', color='lightcoral', alpha=0.8)
-        plt.bar([x + width/2 for x in x_pos], llm_df['jgs_tpot_ms'], 
+        plt.bar(x_pos + width/2, jgs_tpot, 
                 width, label='JGS TPOT', color='lightgreen', alpha=0.8)
         
         plt.title('Time Per Output Token\n(Lower is Better)', fontweight='bold')
         plt.xlabel('Frequency')
         plt.ylabel('TPOT (ms)')
-        plt.xticks(x_pos, llm_df['frequency_str'])
+        plt.xticks(x_pos, freq_strs)
         plt.legend()
         plt.grid(axis='y', alpha=0.3)
         
@@ -460,42 +516,20 @@ class HardwareProjector:
         
         # Create comprehensive summary table with GPU scaling
         # GPU configurations: 8 tiles (4 GPUs), 16 tiles (8 GPUs), 144 tiles (72 GPUs)
-        gpu_configs = [
-            {'tiles': 8, 'gpus': 4, 'label': '8T(4G)'},
-            {'tiles': 16, 'gpus': 8, 'label': '16T(8G)'},
-            {'tiles': 144, 'gpus': 72, 'label': '144T(72G)'}
-        ]
+        scaled = scale_llm_metrics(llm_df)
         
         table_data = []
-        for i, row in llm_df.iterrows():
-            hardware_row = hardware_df.iloc[i]
-            
-            # Base performance (8 tiles baseline)
-            base_pvc_tgs = row['pvc_tgs']
-            base_jgs_tgs = row['jgs_tgs']
-            base_pvc_ttft = row['pvc_ttft_ms']
-            base_jgs_ttft = row['jgs_ttft_ms']
-            
-            for config in gpu_configs:
-                scale_factor = config['tiles'] / 8  # Scale from 8-tile baseline
-                
-                # Scale TGS (higher parallelism = higher throughput)
-                scaled_pvc_tgs = base_pvc_tgs * scale_factor
-                scaled_jgs_tgs = base_jgs_tgs * scale_factor
-                
-                # TTFT scales with parallelism (more GPUs = faster first token)
-                scaled_pvc_ttft = base_pvc_ttft / scale_factor
-                scaled_jgs_ttft = base_jgs_ttft / scale_factor
-                
+        for i in range(len(llm_df)):
+            for k, config in enumerate(GPU_CONFIGS):
                 table_data.append([
-                    f"{row['frequency_str']} {config['label']}",
-                    f"{scaled_pvc_ttft/1000:.3f}s",
-                    f"{row['pvc_tpot_ms']:.1f}ms",
-                    f"{scaled_pvc_tgs:.1f}",
-                    f"{scaled_jgs_ttft/1000:.3f}s",
-                    f"{row['jgs_tpot_ms']:.1f}ms",
-                    f"{scaled_jgs_tgs:.1f}", 
-                    f"{row['llm_improvement']:.1f}x"
+                    f"{freq_strs[i]} {config['short_label']}",
+                    f"{scaled['pvc_ttft_ms'][k, i]/1000:.3f}s",
+                    f"{pvc_tpot[i]:.1f}ms",
+                    f"{scaled['pvc_tgs'][k, i]:.1f}",
+                    f"{scaled['jgs_ttft_ms'][k, i]/1000:.3f}s",
+                    f"{jgs_tpot[i]:.1f}ms",
+                    f"{scaled['jgs_tgs'][k, i]:.1f}", 
+                    f"{llm_improvement[i]:.1f}x"
                 ])
         
         table = ax10.table(cellText=table_data,
@@ -508,7 +542,7 @@ class HardwareProjector:
         table.scale(1, 1.8)
         
         # Style the table with GPU configuration highlighting
-        total_rows = len(llm_df) * len(gpu_configs) + 1
+        total_rows = len(llm_df) * len(GPU_CONFIGS) + 1
         for i in range(total_rows):
             for j in range(8):  # Updated for 8 columns
                 cell = table[(i, j)]
@@ -517,7 +551,7 @@ class HardwareProjector:
                     cell.set_text_props(weight='bold', color='white')
                 else:
                     # Color code by GPU configuration
-                    config_idx = (i - 1) % len(gpu_configs)
+                    config_idx = (i - 1) % len(GPU_CONFIGS)
                     if config_idx == 0:  # 8 tiles
                         cell.set_facecolor('#e8f5e8')
                     elif config_idx == 1:  # 16 tiles  
@@ -529,8 +563,12 @@ class HardwareProjector:
                       fontsize=14, fontweight='bold', pad=15)
         
         plt.tight_layout()
-        plt.savefig('output/jgs_hardware_projection.png', dpi=300, bbox_inches='tight')
-        plt.savefig('jgs_hardware_projection.png', dpi=300, bbox_inches='tight')
+        # Rasterize once and write the same PNG to both locations
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=300, bbox_inches='tight')
+        png = buf.getvalue()
+        Path('output/jgs_hardware_projection.png').write_bytes(png)
+        Path('jgs_hardware_projection.png').write_bytes(png)
         print("JGS hardware projection visualization saved")
         plt.close()
         
@@ -559,22 +597,14 @@ class HardwareProjector:
         print("\n🤖 LLM PERFORMANCE PROJECTIONS (Multi-GPU Scaling):")
         print("-" * 120)
         
-        gpu_configs = [
-            {'tiles': 8, 'gpus': 4, 'label': '8T(4GPU)'},
-            {'tiles': 16, 'gpus': 8, 'label': '16T(8GPU)'},
-            {'tiles': 144, 'gpus': 72, 'label': '144T(72GPU)'}
-        ]
-        
-        for _, row in llm_df.iterrows():
-            print(f"\n📊 {row['frequency_str']} Scaling:")
-            for config in gpu_configs:
-                scale_factor = config['tiles'] / 8
-                scaled_pvc_tgs = row['pvc_tgs'] * scale_factor
-                scaled_jgs_tgs = row['jgs_tgs'] * scale_factor
-                scaled_jgs_ttft = row['jgs_ttft_ms'] / scale_factor / 1000
+        scaled = scale_llm_metrics(llm_df)
+        for i, (freq_str, llm_improvement) in enumerate(zip(llm_df['frequency_str'], llm_df['llm_improvement'])):
+            print(f"\n📊 {freq_str} Scaling:")
+            for k, config in enumerate(GPU_CONFIGS):
+                scaled_jgs_ttft = scaled['jgs_ttft_ms'][k, i] / 1000
                 
-                print(f"   {config['label']:>12}: PVC={scaled_pvc_tgs:6.1f} -> JGS={scaled_jgs_tgs:6.1f} tok/s | "
-                      f"TTFT={scaled_jgs_ttft:5.3f}s | Gain={row['llm_improvement']:4.1f}x")
+                print(f"   {config['label']:>12}: PVC={scaled['pvc_tgs'][k, i]:6.1f} -> JGS={scaled['jgs_tgs'][k, i]:6.1f} tok/s | "
+                      f"TTFT={scaled_jgs_ttft:5.3f}s | Gain={llm_improvement:4.1f}x")
         
         # Find best performance
         best_hw = hardware_df.loc[hardware_df['overall_improvement'].idxmax()]
@@ -589,8 +619,36 @@ class HardwareProjector:
         
         return hardware_df, llm_df
 
+def save_projection_table(df, stem, fmt='parquet'):
+    """Write a projection table as 'parquet', 'xlsx' or 'csv' and return the path written."""
+    path = f'{stem}.{fmt}'
+    if fmt == 'parquet':
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, compression='zstd')
+    elif fmt == 'xlsx':
+        if xlsxwriter is not None:
+            # Stream rows to disk instead of building the workbook in memory
+            with pd.ExcelWriter(path, engine='xlsxwriter',
+                                engine_kwargs={'options': {'constant_memory': True}}) as writer:
+                df.to_excel(writer, index=False)
+        else:
+            df.to_excel(path, index=False)
+    else:
+        df.to_csv(path, index=False, lineterminator='\n')
+    return path
+
 def main():
     """Run JGS hardware projection analysis."""
+    parser = argparse.ArgumentParser(description="JGS Hardware Projection Analysis")
+    parser.add_argument("--xlsx", action="store_true",
+                        help="Save the projection tables as Excel instead of Parquet")
+    parser.add_argument("--csv", action="store_true",
+                        help="Save the combined projections as CSV instead of Parquet")
+    args = parser.parse_args()
+    
+    # Parquet needs pyarrow; without it fall back to the Excel/CSV outputs
+    table_fmt = 'xlsx' if args.xlsx or pq is None else 'parquet'
+    combined_fmt = 'csv' if args.csv or pq is None else 'parquet'
+    
     print("🎯 Starting JGS Hardware Projection Analysis v1.0x...")
     
     projector = HardwareProjector()
@@ -611,6 +669,13 @@ def main():
     print("🤖 Projecting LLM performance for JGS hardware...")
     llm_df = projector.project_llm_performance(hardware_df)
     
+    # frequency_str has a handful of labels; a shared categorical lets formatting and the
+    # merge key work on integer codes instead of Python strings
+    freq_dtype = pd.CategoricalDtype(pd.unique(np.concatenate(
+        [hardware_df['frequency_str'].to_numpy(), llm_df['frequency_str'].to_numpy()])))
+    for df in (hardware_df, llm_df):
+        df['frequency_str'] = df['frequency_str'].astype(freq_dtype)
+    
     # Generate report
     projector.generate_hardware_report(hardware_df, llm_df)
     
@@ -618,20 +683,30 @@ def main():
     print("\n📊 Creating JGS hardware projection visualizations...")
     projector.create_hardware_comparison_visualizations(hardware_df, llm_df)
     
-    # Save detailed results
-    hardware_df.to_excel('output/jgs_hardware_projections.xlsx', index=False)
-    llm_df.to_excel('output/jgs_llm_projections.xlsx', index=False)
+    # Save combined results; the LLM frame is derived row-for-row from the hardware frame,
+    # so its columns can be appended directly instead of joining on frequency
+    if np.array_equal(hardware_df['frequency'].to_numpy(), llm_df['frequency'].to_numpy()):
+        combined_df = hardware_df.copy()
+        for col in llm_df.columns.drop(['frequency', 'frequency_str']):
+            combined_df[col] = llm_df[col].to_numpy()
+    else:
+        combined_df = pd.merge(hardware_df, llm_df, on=['frequency', 'frequency_str'])
     
-    # Save combined results
-    combined_df = pd.merge(hardware_df, llm_df, on=['frequency', 'frequency_str'])
-    combined_df.to_csv('output/jgs_combined_projections.csv', index=False)
+    # Save detailed and combined results; the three files are independent, so write them concurrently
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        hardware_future = pool.submit(save_projection_table, hardware_df, 'output/jgs_hardware_projections', table_fmt)
+        llm_future = pool.submit(save_projection_table, llm_df, 'output/jgs_llm_projections', table_fmt)
+        combined_future = pool.submit(save_projection_table, combined_df, 'output/jgs_combined_projections', combined_fmt)
+        hardware_file = hardware_future.result()
+        llm_file = llm_future.result()
+        combined_file = combined_future.result()
     
     print("\n✅ JGS Hardware Projection Analysis Complete!")
     print("📁 Files generated:")
     print("   - output/jgs_hardware_projection.png")
-    print("   - output/jgs_hardware_projections.xlsx")
-    print("   - output/jgs_llm_projections.xlsx") 
-    print("   - output/jgs_combined_projections.csv")
+    print(f"   - {hardware_file}")
+    print(f"   - {llm_file}") 
+    print(f"   - {combined_file}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,42 +4,111 @@ Interactive Hardware Projection Tool - User Configuration Interface
 Allows users to configure and execute hardware projections with different approaches.
 """
 
+import copy
 import json
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, TYPE_CHECKING
 import argparse
 import sys
-import pandas as pd
 
-# Import our enhanced projector
-from enhanced_hardware_projector import EnhancedHardwareProjector, CalculationApproach, HardwareProjectionConfig
 from hardware_config_manager import HardwareConfigManager
 
+# The enhanced projector pulls in pandas/matplotlib; it is imported on first use
+# so browsing menus and configs starts instantly
+if TYPE_CHECKING:
+    from enhanced_hardware_projector import CalculationApproach, HardwareProjectionConfig
+
+@lru_cache(maxsize=8)
+def _load_cfg(path: str, mtime_ns) -> "HardwareProjectionConfig":
+    """Parse a configuration file once per (path, modification time)."""
+    from enhanced_hardware_projector import HardwareProjectionConfig
+    return HardwareProjectionConfig(path)
+
+def cached_config(path: str) -> "HardwareProjectionConfig":
+    """Shared parsed configuration for path; callers must not modify it."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except (OSError, TypeError):
+        mtime_ns = None
+    return _load_cfg(path, mtime_ns)
+
+# Static part of the main menu, up to the current-config line
+_MAIN_MENU = (
+    "\n" + "="*60 + "\n"
+    "🚀 Interactive Hardware Projection Tool v2.1\n"
+    + "="*60 + "\n"
+    "1. Run All Configured Approaches\n"
+    "2. Run Single Approach\n"
+    "3. Hardware Configuration Manager (Create/Update/Browse)\n"
+    "4. Configure Calculation Settings\n"
+    "5. View Current Configuration\n"
+    "6. Load/Browse Configurations\n"
+    "7. Save Configuration to File\n"
+    "8. Run with Custom Scenario (Conservative/Optimistic)\n"
+    "9. Exit\n"
+    + "-"*60 + "\n"
+)
+
+# Every calculation approach (CalculationApproach member names), in the order they are run and reported
+_ALL_APPROACHES = ("HARDWARE_CALIBRATED", "PURE_SIMULATION", "HYBRID_CORRELATION")
+
+# Approach selections from the interactive menu (1-4, all) and the --approach flag (hw/sim/hybrid/all)
+_APPROACH_MAP = {
+    "1": ("HARDWARE_CALIBRATED",),
+    "2": ("PURE_SIMULATION",),
+    "3": ("HYBRID_CORRELATION",),
+    "4": _ALL_APPROACHES,
+    "hw": ("HARDWARE_CALIBRATED",),
+    "sim": ("PURE_SIMULATION",),
+    "hybrid": ("HYBRID_CORRELATION",),
+    "all": _ALL_APPROACHES
+}
+
+# Result columns shown by display_results, in display order
+_BASELINE_COLS = (
+    ('hw_calibrated_baseline_tgs', 'Hardware-Calibrated Baseline'),
+    ('pure_sim_current_tgs', 'Pure Simulation Current'),
+    ('hybrid_baseline_tgs', 'Hybrid Baseline')
+)
+_APPROACH_COLS = (
+    ('Hardware-Calibrated', 'hw_calibrated_improved_tgs'),
+    ('Pure Simulation', 'pure_sim_improved_tgs'),
+    ('Hybrid Correlation', 'hybrid_improved_tgs')
+)
+# Scenario value -> improvement factor path (under improvement_factors) it overrides
+_SCENARIO_FIELDS = (
+    ('xecore_compute', ('xecore_compute',)),
+    ('hbm_bandwidth', ('hbm_bandwidth',)),
+    ('fabrication_process', ('fabrication_process',)),
+    ('communication_bandwidth', ('communication', 'bandwidth_improvement')),
+    ('communication_latency', ('communication', 'latency_improvement'))
+)
+_SCENARIO_LABELS = {"1": " (Conservative)", "2": " (Optimistic)", "3": " (Current Config)"}
+
 class InteractiveProjectionTool:
     """Interactive tool for configurable hardware projections."""
     
     def __init__(self):
         self.config_file = "hardware_projection_config.json"
         self.projector = None
+        self._menu_cache = None  # (config_file, rendered menu)
+    
+    @cached_property
+    def approach_map(self) -> Dict[str, List["CalculationApproach"]]:
+        """Approach selections resolved to CalculationApproach members."""
+        from enhanced_hardware_projector import CalculationApproach
+        return {key: [CalculationApproach[name] for name in names]
+                for key, names in _APPROACH_MAP.items()}
         
     def display_menu(self):
         """Display main menu options."""
-        print("\n" + "="*60)
-        print("🚀 Interactive Hardware Projection Tool v2.1")
-        print("="*60)
-        print("1. Run All Configured Approaches")
-        print("2. Run Single Approach") 
-        print("3. Hardware Configuration Manager (Create/Update/Browse)")
-        print("4. Configure Calculation Settings")
-        print("5. View Current Configuration")
-        print("6. Load/Browse Configurations")
-        print("7. Save Configuration to File")
-        print("8. Run with Custom Scenario (Conservative/Optimistic)")
-        print("9. Exit")
-        print("-"*60)
-        print(f"Current Config: {os.path.basename(self.config_file) if self.config_file else 'Default'}")
-        print("-"*60)
+        # The menu only changes with the selected config file; render it once per file
+        if self._menu_cache is None or self._menu_cache[0] != self.config_file:
+            config_name = os.path.basename(self.config_file) if self.config_file else 'Default'
+            self._menu_cache = (self.config_file, f"{_MAIN_MENU}Current Config: {config_name}\n{'-'*60}\n")
+        sys.stdout.write(self._menu_cache[1])
     
     def get_user_choice(self, prompt: str, options: List[str]) -> str:
         """Get user choice with validation."""
@@ -61,24 +130,13 @@ class InteractiveProjectionTool:
         
         choice = self.get_user_choice("Select approach", ["1", "2", "3", "4", "all"])
         
-        if choice == "1":
-            return [CalculationApproach.HARDWARE_CALIBRATED]
-        elif choice == "2":
-            return [CalculationApproach.PURE_SIMULATION] 
-        elif choice == "3":
-            return [CalculationApproach.HYBRID_CORRELATION]
-        else:  # "4" or "all"
-            return [CalculationApproach.HARDWARE_CALIBRATED, 
-                   CalculationApproach.PURE_SIMULATION,
-                   CalculationApproach.HYBRID_CORRELATION]
+        return self.approach_map[choice]
     
     def configure_hardware_parameters(self):
         """Enhanced hardware configuration with browser and creation capabilities."""
         print("\n🔧 Hardware Configuration Manager")
         print("-" * 40)
         
-        hw_config_mgr = HardwareConfigManager()
-        
         print("Hardware Configuration Options:")
         print("1. Browse and select existing configurations")
         print("2. Create new hardware configuration")
@@ -90,6 +148,7 @@ class InteractiveProjectionTool:
         
         if choice == '1':
             # Browse configurations
+            hw_config_mgr = HardwareConfigManager()
             selected_config = hw_config_mgr.display_config_browser()
             if selected_config:
                 self.config_file = selected_config
@@ -97,6 +156,7 @@ class InteractiveProjectionTool:
             
         elif choice == '2':
             # Create new configuration
+            hw_config_mgr = HardwareConfigManager()
             new_config = hw_config_mgr.create_new_hardware_config()
             if new_config:
                 self.config_file = new_config
@@ -104,6 +164,7 @@ class InteractiveProjectionTool:
         
         elif choice == '3':
             # Update existing configuration
+            hw_config_mgr = HardwareConfigManager()
             configs = hw_config_mgr.list_available_configs()
             if configs:
                 selected_config = hw_config_mgr.select_config_for_update(configs)
@@ -115,6 +176,7 @@ class InteractiveProjectionTool:
         elif choice == '4':
             # Quick update current configuration
             if self.config_file and os.path.exists(self.config_file):
+                hw_config_mgr = HardwareConfigManager()
                 updated = hw_config_mgr.update_existing_config(self.config_file)
                 if updated:
                     print("\n✅ Configuration updated successfully!")
@@ -146,13 +208,7 @@ class InteractiveProjectionTool:
         print("\n🚀 Running All Configured Approaches")
         print("-" * 40)
         
-        approaches = [
-            CalculationApproach.HARDWARE_CALIBRATED,
-            CalculationApproach.PURE_SIMULATION, 
-            CalculationApproach.HYBRID_CORRELATION
-        ]
-        
-        self.execute_projection(approaches)
+        self.execute_projection(self.approach_map["all"])
     
     def run_custom_scenario(self):
         """Run with custom conservative/optimistic scenarios."""
@@ -164,49 +220,45 @@ class InteractiveProjectionTool:
         
         choice = self.get_user_choice("Select scenario", ["1", "2", "3"])
         
-        # Load base config
-        config_mgr = HardwareProjectionConfig(self.config_file)
+        from enhanced_hardware_projector import EnhancedHardwareProjector
         
-        if choice == "1":
-            print("📉 Running Conservative Scenario...")
-            # Apply conservative estimates
-            alt_config = config_mgr.config['alternative_hardware_scenarios']['conservative_estimates']
-            self.apply_scenario_config(config_mgr, alt_config)
-        elif choice == "2":  
-            print("📈 Running Optimistic Scenario...")
-            # Apply optimistic estimates
-            alt_config = config_mgr.config['alternative_hardware_scenarios']['optimistic_estimates']
+        if choice in ("1", "2"):
+            # Scenarios edit the improvement factors, so they work on a private copy of the config
+            config_mgr = copy.deepcopy(cached_config(self.config_file))
+            if choice == "1":
+                print("📉 Running Conservative Scenario...")
+                # Apply conservative estimates
+                alt_config = config_mgr.config['alternative_hardware_scenarios']['conservative_estimates']
+            else:
+                print("📈 Running Optimistic Scenario...")
+                # Apply optimistic estimates
+                alt_config = config_mgr.config['alternative_hardware_scenarios']['optimistic_estimates']
             self.apply_scenario_config(config_mgr, alt_config)
+            
+            # Create projector with modified config
+            projector = EnhancedHardwareProjector(config=config_mgr.config)
         else:
             print("📊 Running Current Configuration...")
-        
-        # Create projector with modified config
-        projector = EnhancedHardwareProjector()
-        if choice != "3":
-            projector.config = config_mgr.config
-            projector.improvement_factors = config_mgr.config['hardware_settings']['future_hardware']['improvement_factors']
+            projector = EnhancedHardwareProjector(self.config_file)
         
         # Run all approaches for scenario comparison
-        approaches = [CalculationApproach.HARDWARE_CALIBRATED,
-                     CalculationApproach.PURE_SIMULATION,
-                     CalculationApproach.HYBRID_CORRELATION]
-        
-        projections_df = projector.calculate_projections(approaches)
+        projections_df = projector.calculate_projections(self.approach_map["all"])
         self.display_results(projections_df, scenario=choice)
     
-    def apply_scenario_config(self, config_mgr: HardwareProjectionConfig, alt_config: Dict):
+    def apply_scenario_config(self, config_mgr: "HardwareProjectionConfig", alt_config: Dict):
         """Apply alternative scenario configuration."""
         improvements = config_mgr.config['hardware_settings']['future_hardware']['improvement_factors']
         
         # Update improvement factors with scenario values
-        improvements['xecore_compute']['value'] = alt_config['xecore_compute']
-        improvements['hbm_bandwidth']['value'] = alt_config['hbm_bandwidth']  
-        improvements['fabrication_process']['value'] = alt_config['fabrication_process']
-        improvements['communication']['bandwidth_improvement']['value'] = alt_config['communication_bandwidth']
-        improvements['communication']['latency_improvement']['value'] = alt_config['communication_latency']
+        for alt_key, path in _SCENARIO_FIELDS:
+            factor = improvements
+            for key in path:
+                factor = factor[key]
+            factor['value'] = alt_config[alt_key]
     
-    def execute_projection(self, approaches: List[CalculationApproach]):
+    def execute_projection(self, approaches: List["CalculationApproach"]):
         """Execute projection calculations with specified approaches."""
+        from enhanced_hardware_projector import EnhancedHardwareProjector
         print(f"\n🔄 Executing projections with {len(approaches)} approach(es)...")
         
         # Initialize projector
@@ -230,38 +282,26 @@ class InteractiveProjectionTool:
             print("❌ No results to display. Check input data and configuration.")
             return
         
-        scenario_label = ""
-        if scenario == "1":
-            scenario_label = " (Conservative)"
-        elif scenario == "2":
-            scenario_label = " (Optimistic)"
-        elif scenario == "3":
-            scenario_label = " (Current Config)"
+        scenario_label = _SCENARIO_LABELS.get(scenario, "")
         
         print(f"\n📈 Projection Results{scenario_label}")
         print("=" * (25 + len(scenario_label)))
         
         # Display current hardware baseline first
-        baseline_cols = {
-            'hw_calibrated_baseline_tgs': 'Hardware-Calibrated Baseline',
-            'pure_sim_current_tgs': 'Pure Simulation Current',
-            'hybrid_baseline_tgs': 'Hybrid Baseline'
-        }
+        columns = set(projections_df.columns)
         
         print("\n📊 Current Hardware Performance (Reference):")
         print("-" * 45)
         baseline_found = False
         
         # Show individual frequency values instead of summary
-        for col_name, display_name in baseline_cols.items():
-            if col_name in projections_df.columns:
+        freq_arr = projections_df['frequency_str'].to_numpy()
+        for col_name, display_name in _BASELINE_COLS:
+            if col_name in columns:
                 # Display frequency-by-frequency baseline values
-                freq_values = []
-                for _, row in projections_df.iterrows():
-                    if col_name in row and not pd.isna(row[col_name]):
-                        freq_str = row['frequency_str']
-                        baseline_val = row[col_name]
-                        freq_values.append((freq_str, baseline_val))
+                values = projections_df[col_name]
+                mask = values.notna().to_numpy()
+                freq_values = list(zip(freq_arr[mask], values.to_numpy()[mask]))
                 
                 if freq_values:
                     print(f"  {display_name}:")
@@ -277,24 +317,23 @@ class InteractiveProjectionTool:
         print(f"\n🚀 Projected Hardware Performance:")
         print("-" * 35)
         
-        approaches_cols = {
-            'Hardware-Calibrated': 'hw_calibrated_improved_tgs',
-            'Pure Simulation': 'pure_sim_improved_tgs', 
-            'Hybrid Correlation': 'hybrid_improved_tgs'
-        }
+        # Approaches with a column in this run, reduced in one pass (NaNs skipped)
+        present = {col_name: approach_name for approach_name, col_name in _APPROACH_COLS
+                   if col_name in columns}
         
         results_table = []
         
-        for approach_name, col_name in approaches_cols.items():
-            if col_name in projections_df.columns:
-                values = projections_df[col_name].dropna()
-                if len(values) > 0:
+        if present:
+            stats = projections_df[list(present)].agg(['min', 'max', 'mean', 'count']).T
+            for col_name, vmin, vmax, vmean, count in zip(stats.index, stats['min'], stats['max'],
+                                                          stats['mean'], stats['count']):
+                if count > 0:
                     results_table.append({
-                        'Approach': approach_name,
-                        'Min TGS': f"{values.min():.2f}",
-                        'Max TGS': f"{values.max():.2f}", 
-                        'Avg TGS': f"{values.mean():.2f}",
-                        'Range': f"{values.max() - values.min():.2f}"
+                        'Approach': present[col_name],
+                        'Min TGS': f"{vmin:.2f}",
+                        'Max TGS': f"{vmax:.2f}", 
+                        'Avg TGS': f"{vmean:.2f}",
+                        'Range': f"{vmax - vmin:.2f}"
                     })
         
         if results_table:
@@ -309,13 +348,17 @@ class InteractiveProjectionTool:
         # Display frequency breakdown
         print(f"\n📊 Detailed Results by Frequency:")
         print("-" * 50)
-        for _, row in projections_df.iterrows():
-            freq = row['frequency_str']
-            print(f"\n{freq}:")
-            
-            for approach_name, col_name in approaches_cols.items():
-                if col_name in row and not pd.isna(row[col_name]):
-                    print(f"  {approach_name:18}: {row[col_name]:8.2f} tok/s")
+        approach_arrays = [(approach_name, projections_df[col_name].to_numpy(),
+                            projections_df[col_name].notna().to_numpy())
+                           for col_name, approach_name in present.items()]
+        # Build the whole breakdown and write it at once
+        lines = []
+        for i, freq in enumerate(freq_arr):
+            lines.append(f"\n{freq}:")
+            lines.extend(f"  {approach_name:18}: {values[i]:8.2f} tok/s"
+                         for approach_name, values, valid in approach_arrays if valid[i])
+        if lines:
+            print("\n".join(lines))
     
     def view_configuration(self):
         """Display current configuration."""
@@ -323,7 +366,7 @@ class InteractiveProjectionTool:
         print("-" * 30)
         
         try:
-            config_mgr = HardwareProjectionConfig(self.config_file)
+            config_mgr = cached_config(self.config_file)
             config = config_mgr.config
             
             # Hardware settings
@@ -354,8 +397,6 @@ class InteractiveProjectionTool:
         print("\n📁 Load Configuration")
         print("-" * 30)
         
-        hw_config_mgr = HardwareConfigManager()
-        
         print("Load Configuration Options:")
         print("1. Browse available configurations")
         print("2. Enter specific file path")
@@ -365,11 +406,12 @@ class InteractiveProjectionTool:
         
         if choice == '1':
             # Use configuration browser
+            hw_config_mgr = HardwareConfigManager()
             selected_config = hw_config_mgr.display_config_browser()
             if selected_config:
                 self.config_file = selected_config
                 try:
-                    config_mgr = HardwareProjectionConfig(selected_config)
+                    config_mgr = cached_config(selected_config)
                     hw_config = config_mgr.config['hardware_settings']
                     print(f"\n✅ Configuration loaded successfully!")
                     print(f"Hardware: {hw_config['current_hardware']['name']} → {hw_config['future_hardware']['name']}")
@@ -384,7 +426,7 @@ class InteractiveProjectionTool:
                 
             if Path(filename).exists():
                 try:
-                    config_mgr = HardwareProjectionConfig(filename)
+                    config_mgr = cached_config(filename)
                     self.config_file = filename
                     hw_config = config_mgr.config['hardware_settings']
                     print(f"\n✅ Configuration loaded from {filename}")
@@ -410,8 +452,9 @@ class InteractiveProjectionTool:
             filename = self.config_file
         
         try:
-            config_mgr = HardwareProjectionConfig(self.config_file)
+            config_mgr = cached_config(self.config_file)
             config_mgr.save_config(filename)
+            _load_cfg.cache_clear()
             print(f"✅ Configuration saved to {filename}")
         except Exception as e:
             print(f"❌ Error saving configuration: {e}")
@@ -469,17 +512,7 @@ def main():
     if args.approach and not args.interactive:
         print(f"🚀 Running {args.approach} approach directly...")
         
-        # Map approach names
-        approach_map = {
-            "hw": [CalculationApproach.HARDWARE_CALIBRATED],
-            "sim": [CalculationApproach.PURE_SIMULATION], 
-            "hybrid": [CalculationApproach.HYBRID_CORRELATION],
-            "all": [CalculationApproach.HARDWARE_CALIBRATED, 
-                   CalculationApproach.PURE_SIMULATION,
-                   CalculationApproach.HYBRID_CORRELATION]
-        }
-        
-        tool.execute_projection(approach_map[args.approach])
+        tool.execute_projection(tool.approach_map[args.approach])
         
     elif args.scenario and not args.interactive:
         print(f"🎭 Running {args.scenario} scenario...")
@@ -493,6 +526,4 @@ def main():
         tool.run()
 
 if __name__ == "__main__":
-    # Fix import issue for standalone execution
-    import pandas as pd
     main()
\ No newline at end of file
@@ -4,12 +4,72 @@ LLM Performance Projector - Projects TTFT and TPOT performance across frequencie
 Based on simulation duration data and 1600MHz baseline performance.
 """
 
+import io
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Figures are only written to files
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow only speeds up CSV I/O; pandas' own reader/writer is the fallback
+    pa = pacsv = None
+
+try:
+    import xlsxwriter
+except ImportError:  # Excel export then uses pandas' default openpyxl engine
+    xlsxwriter = None
+
+try:
+    from numba import njit
+except ImportError:  # The projection kernel then runs as plain NumPy
+    njit = None
+
+def _project(sim_duration, freq_num, baseline_sim_duration, baseline_ttft, baseline_tpot,
+             baseline_freq, baseline_total, total_tokens, output_tokens):
+    """Projection arithmetic for all frequencies; array in, tuple of arrays out."""
+    # Performance scaling: higher simulation duration = longer execution time
+    # Assumption: Performance scales proportionally with simulation duration
+    duration_ratio = sim_duration / baseline_sim_duration
+    
+    # Calculate projected performance metrics
+    projected_ttft = baseline_ttft * duration_ratio
+    projected_tpot = baseline_tpot * duration_ratio
+    projected_total = projected_ttft + projected_tpot
+    
+    # Also calculate frequency-based theoretical scaling
+    # Higher frequency should give better performance (inverse relationship)
+    freq_ratio = baseline_freq / freq_num
+    theoretical_ttft = baseline_ttft * freq_ratio
+    theoretical_tpot = baseline_tpot * freq_ratio
+    theoretical_total = theoretical_ttft + theoretical_tpot
+    
+    # Calculate Token Generation Speed (TGS) - tokens per second
+    # For simulation-based projections
+    projected_total_seconds = projected_total / 1000
+    projected_tgs = np.where(projected_total_seconds > 0, total_tokens / projected_total_seconds, 0.0)
+    
+    # For theoretical projections
+    theoretical_total_seconds = theoretical_total / 1000
+    theoretical_tgs = np.where(theoretical_total_seconds > 0, total_tokens / theoretical_total_seconds, 0.0)
+    
+    # Calculate output token rate (tokens per second for generation phase)
+    projected_tpot_seconds = projected_tpot / 1000
+    output_token_rate = np.where(projected_tpot_seconds > 0, output_tokens / projected_tpot_seconds, 0.0)
+    
+    performance_improvement = (baseline_total / projected_total - 1) * 100
+    
+    return (duration_ratio, projected_ttft, projected_tpot, projected_total,
+            theoretical_ttft, theoretical_tpot, theoretical_total,
+            projected_tgs, theoretical_tgs, output_token_rate, performance_improvement)
+
+if njit is not None:
+    # Compiled once and cached on disk, so repeated runs and parameter sweeps skip the Python overhead
+    _project = njit(cache=True)(_project)
+
 class LLMPerformanceProjector:
     def __init__(self):
         # Baseline performance at 1600MHz (Updated Nov 15, 2025)
@@ -29,7 +89,8 @@ class LLMPerformanceProjector:
     def load_simulation_data(self):
         """Load the master summary from previous analysis."""
         try:
-            self.sim_data = pd.read_csv('output/master_summary.csv')
+            self.sim_data = pd.read_csv('output/master_summary.csv',
+                                        engine='pyarrow' if pa is not None else 'c')
             print("✅ Loaded simulation data:")
             print(self.sim_data[['Frequency', 'total_duration', 'avg_duration']])
         except FileNotFoundError:
@@ -41,79 +102,57 @@ class LLMPerformanceProjector:
         if self.sim_data is None:
             return None
         
-        # Get baseline simulation duration for 1600MHz
-        baseline_sim = self.sim_data[self.sim_data['Frequency'] == '1600MHz']
-        if baseline_sim.empty:
+        freq_str = self.sim_data['Frequency']
+        sim_duration = self.sim_data['total_duration'].to_numpy(dtype=float)
+        
+        # Get baseline simulation duration for 1600MHz (first matching row)
+        baseline_pos = np.flatnonzero(freq_str.to_numpy() == '1600MHz')
+        if baseline_pos.size == 0:
             print("❌ 1600MHz baseline not found in simulation data!")
             return None
         
-        baseline_sim_duration = baseline_sim['total_duration'].iloc[0]
+        baseline_sim_duration = sim_duration[baseline_pos[0]]
         print(f"🎯 Baseline (1600MHz) simulation duration: {baseline_sim_duration:,.2f}")
         
-        # Calculate performance scaling factors based on simulation durations
-        results = []
-        
-        for _, row in self.sim_data.iterrows():
-            freq_str = row['Frequency']
-            freq_num = int(freq_str.replace('MHz', ''))
-            sim_duration = row['total_duration']
-            
-            # Performance scaling: higher simulation duration = longer execution time
-            # Assumption: Performance scales proportionally with simulation duration
-            duration_ratio = sim_duration / baseline_sim_duration
-            
-            # Calculate projected performance metrics
-            projected_ttft = self.baseline_ttft * duration_ratio
-            projected_tpot = self.baseline_tpot * duration_ratio
-            projected_total = projected_ttft + projected_tpot
-            
-            # Also calculate frequency-based theoretical scaling
-            # Higher frequency should give better performance (inverse relationship)
-            freq_ratio = self.baseline_freq / freq_num
-            theoretical_ttft = self.baseline_ttft * freq_ratio
-            theoretical_tpot = self.baseline_tpot * freq_ratio
-            theoretical_total = theoretical_ttft + theoretical_tpot
-            
-            # Calculate Token Generation Speed (TGS) - tokens per second
-            # For simulation-based projections
-            projected_total_seconds = projected_total / 1000
-            projected_tgs = self.total_tokens / projected_total_seconds if projected_total_seconds > 0 else 0
-            
-            # For theoretical projections  
-            theoretical_total_seconds = theoretical_total / 1000
-            theoretical_tgs = self.total_tokens / theoretical_total_seconds if theoretical_total_seconds > 0 else 0
-            
-            # Calculate output token rate (tokens per second for generation phase)
-            projected_tpot_seconds = projected_tpot / 1000
-            output_token_rate = self.output_tokens / projected_tpot_seconds if projected_tpot_seconds > 0 else 0
-            
-            results.append({
-                'frequency': freq_num,
-                'frequency_str': freq_str,
-                'sim_duration': sim_duration,
-                'duration_ratio': duration_ratio,
-                'projected_ttft': projected_ttft,
-                'projected_tpot': projected_tpot,
-                'projected_total': projected_total,
-                'theoretical_ttft': theoretical_ttft,
-                'theoretical_tpot': theoretical_tpot,
-                'theoretical_total': theoretical_total,
-                'projected_tgs': projected_tgs,
-                'theoretical_tgs': theoretical_tgs,
-                'output_token_rate': output_token_rate,
-                'performance_improvement': (self.baseline_total / projected_total - 1) * 100
-            })
-        
-        return pd.DataFrame(results)
+        # Calculate performance scaling factors based on simulation durations, for all frequencies at once
+        freq_num = freq_str.str.extract(r'(\d+)', expand=False).astype('int32').to_numpy()
+        
+        # Zero durations are guarded inside the kernel; silence NumPy's warnings for those lanes
+        with np.errstate(divide='ignore', invalid='ignore'):
+            (duration_ratio, projected_ttft, projected_tpot, projected_total,
+             theoretical_ttft, theoretical_tpot, theoretical_total,
+             projected_tgs, theoretical_tgs, output_token_rate, performance_improvement) = _project(
+                sim_duration, freq_num, float(baseline_sim_duration),
+                float(self.baseline_ttft), float(self.baseline_tpot), float(self.baseline_freq),
+                float(self.baseline_total), float(self.total_tokens), float(self.output_tokens))
+        
+        return pd.DataFrame({
+            'frequency': freq_num,
+            'frequency_str': freq_str.to_numpy(),
+            'sim_duration': sim_duration,
+            'duration_ratio': duration_ratio,
+            'projected_ttft': projected_ttft,
+            'projected_tpot': projected_tpot,
+            'projected_total': projected_total,
+            'theoretical_ttft': theoretical_ttft,
+            'theoretical_tpot': theoretical_tpot,
+            'theoretical_total': theoretical_total,
+            'projected_tgs': projected_tgs,
+            'theoretical_tgs': theoretical_tgs,
+            'output_token_rate': output_token_rate,
+            'performance_improvement': performance_improvement
+        })
     
     def create_performance_visualizations(self, df):
         """Create comprehensive performance visualizations."""
+        import seaborn as sns  # Only needed for plotting; keeps report-only imports light
+        
         # Set up the plotting style
         plt.style.use('default')
         sns.set_palette("husl")
         
-        # Create figure with subplots
-        fig = plt.figure(figsize=(20, 15))
+        # Create figure with one row for the three panels in use; constrained_layout handles spacing
+        fig, (ax2, ax5, ax6) = plt.subplots(1, 3, figsize=(20, 6), constrained_layout=True)
         
         # # 1. Total Performance Comparison
         # ax1 = plt.subplot(2, 3, 1)
@@ -134,19 +173,18 @@ class LLMPerformanceProjector:
         # plt.grid(axis='y', alpha=0.3)
         
         # 2. TTFT vs TPOT Breakdown
-        ax2 = plt.subplot(2, 3, 2)
         width = 0.35
         x_pos = np.arange(len(df))
         
-        plt.bar(x_pos - width/2, df['projected_ttft'], width, label='TTFT', alpha=0.8, color='lightcoral')
-        plt.bar(x_pos + width/2, df['projected_tpot'], width, label='TPOT', alpha=0.8, color='lightgreen')
+        ax2.bar(x_pos - width/2, df['projected_ttft'], width, label='TTFT', alpha=0.8, color='lightcoral')
+        ax2.bar(x_pos + width/2, df['projected_tpot'], width, label='TPOT', alpha=0.8, color='lightgreen')
         
-        plt.title('TTFT vs TPOT Breakdown (Simulation-based)', fontsize=14, fontweight='bold')
-        plt.xlabel('Frequency')
-        plt.ylabel('Time (ms)')
-        plt.xticks(x_pos, df['frequency_str'])
-        plt.legend()
-        plt.grid(axis='y', alpha=0.3)
+        ax2.set_title('TTFT vs TPOT Breakdown (Simulation-based)', fontsize=14, fontweight='bold')
+        ax2.set_xlabel('Frequency')
+        ax2.set_ylabel('Time (ms)')
+        ax2.set_xticks(x_pos, df['frequency_str'])
+        ax2.legend()
+        ax2.grid(axis='y', alpha=0.3)
         
         # # 3. Performance Improvement Chart
         # ax3 = plt.subplot(2, 3, 3)
@@ -183,25 +221,23 @@ class LLMPerformanceProjector:
         # plt.grid(alpha=0.3)
         
         # 5. Frequency vs Performance Trend
-        ax5 = plt.subplot(2, 3, 5)
-        plt.plot(df['frequency'], df['projected_total'], 'o-', linewidth=3, markersize=10, 
+        ax5.plot(df['frequency'], df['projected_total'], 'o-', linewidth=3, markersize=10, 
                 label='Simulation-based', color='blue')
-        plt.plot(df['frequency'], df['theoretical_total'], 's--', linewidth=3, markersize=8, 
+        ax5.plot(df['frequency'], df['theoretical_total'], 's--', linewidth=3, markersize=8, 
                 label='Theoretical', color='red', alpha=0.7)
         
         # Highlight baseline
         baseline_row = df[df['frequency'] == 1600].iloc[0]
-        plt.plot(1600, baseline_row['projected_total'], 'ro', markersize=15, 
+        ax5.plot(1600, baseline_row['projected_total'], 'ro', markersize=15, 
                 label=f'Baseline (1600MHz: {self.baseline_total}ms)', alpha=0.8)
         
-        plt.title('Performance Latency vs Frequency Trend, (Lower is Better)', fontsize=14, fontweight='bold')
-        plt.xlabel('Frequency (MHz)')
-        plt.ylabel('Total Performance (ms)')
-        plt.legend()
-        plt.grid(alpha=0.3)
+        ax5.set_title('Performance Latency vs Frequency Trend, (Lower is Better)', fontsize=14, fontweight='bold')
+        ax5.set_xlabel('Frequency (MHz)')
+        ax5.set_ylabel('Total Performance (ms)')
+        ax5.legend()
+        ax5.grid(alpha=0.3)
         
         # 6. Performance Summary Table
-        ax6 = plt.subplot(2, 3, 6)
         ax6.axis('tight')
         ax6.axis('off')
         
@@ -225,21 +261,22 @@ class LLMPerformanceProjector:
         table.set_fontsize(10)
         table.scale(1, 2)
         
-        # Style the table
-        for i in range(len(df) + 1):
-            for j in range(6):  # Updated for 6 columns
-                cell = table[(i, j)]
-                if i == 0:  # Header
-                    cell.set_facecolor('#4CAF50')
-                    cell.set_text_props(weight='bold', color='white')
-                else:
-                    cell.set_facecolor('#f0f0f0' if i % 2 == 0 else 'white')
-        
-        plt.title('Performance Summary Table', fontsize=14, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        plt.savefig('output/llm_performance_projection.png', dpi=300, bbox_inches='tight')
-        plt.savefig('llm_performance_projection.png', dpi=300, bbox_inches='tight')  # Also save to root
+        # Style the table, walking the cell dict once
+        for (i, j), cell in table.get_celld().items():
+            if i == 0:  # Header
+                cell.set_facecolor('#4CAF50')
+                cell.set_text_props(weight='bold', color='white')
+            else:
+                cell.set_facecolor('#f0f0f0' if i % 2 == 0 else 'white')
+        
+        ax6.set_title('Performance Summary Table', fontsize=14, fontweight='bold', pad=20)
+        
+        # Rasterize once and write the same PNG to output/ and the project root
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=300, bbox_inches='tight')
+        png = buf.getvalue()
+        Path('output/llm_performance_projection.png').write_bytes(png)
+        Path('llm_performance_projection.png').write_bytes(png)
         print("📊 Performance visualization saved to: output/llm_performance_projection.png")
         plt.close()  # Close instead of show to avoid GUI
         
@@ -303,8 +340,19 @@ def main():
     fig = projector.create_performance_visualizations(performance_df)
     
     # Save detailed results
-    performance_df.to_excel('output/llm_performance_projections.xlsx', index=False)
-    performance_df.to_csv('output/llm_performance_projections.csv', index=False)
+    if xlsxwriter is not None:
+        # Stream rows to disk instead of building the workbook in memory
+        with pd.ExcelWriter('output/llm_performance_projections.xlsx', engine='xlsxwriter',
+                            engine_kwargs={'options': {'constant_memory': True}}) as writer:
+            performance_df.to_excel(writer, index=False)
+    else:
+        performance_df.to_excel('output/llm_performance_projections.xlsx', index=False)
+    if pacsv is not None:
+        # C++ writer; releases the GIL and skips pandas' Python-level formatting
+        pacsv.write_csv(pa.Table.from_pandas(performance_df, preserve_index=False),
+                        'output/llm_performance_projections.csv')
+    else:
+        performance_df.to_csv('output/llm_performance_projections.csv', index=False)
     
     print("\n✅ Analysis complete!")
     print("📁 Files generated:")
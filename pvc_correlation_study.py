@@ -7,11 +7,123 @@ at 1600MHz baseline without any performance improvements.
 
 import pandas as pd
 import numpy as np
+import hashlib
+import os
+import matplotlib
+matplotlib.use('Agg')  # Figures are only written to files
 import matplotlib.pyplot as plt
 import json
 from pathlib import Path
 from typing import Dict, Optional
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pandas' own CSV reader is used instead, without the Parquet cache
+    pa = pacsv = pq = None
+
+try:
+    from numba import njit
+except ImportError:  # The bucket reduction then uses np.bincount
+    njit = None
+
+# Columns of the raw simulation_results.csv used by the workload analysis
+RAW_DATA_COLUMNS = ['RESOURCE', 'DURATION']
+
+# GT rows of each raw results CSV, cached locally so later runs skip the share
+GT_CACHE_DIR = Path.home() / '.cache' / 'pvc_correlation_study'
+
+def read_raw_simulation_csv(path: str) -> pd.DataFrame:
+    """Read the RAW_DATA_COLUMNS of a simulation results CSV."""
+    if pacsv is None:
+        return pd.read_csv(path, usecols=RAW_DATA_COLUMNS)
+    # Multithreaded Arrow parse of just the needed columns, converted without a second copy
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 22),
+        convert_options=pacsv.ConvertOptions(include_columns=RAW_DATA_COLUMNS,
+                                             column_types={'RESOURCE': pa.string()}))
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+# One pass over a resource name: group 1 = 'gt/' prefix, group 2 = '/ex_u0' on a GT tile
+# (XeCore compute), group 3 = '/ex_u1' on a GT tile without ex_u0 (Memory + Communication)
+WORKLOAD_PATTERN = r'^(gt/)?(?:(?=.*GT_TILE_)(?:(?=.*(/ex_u0))|(?=.*(/ex_u1))))?'
+
+# Workload bucket tags per GT row; rows tagged WORKLOAD_IGNORED are not counted
+WORKLOAD_IGNORED, WORKLOAD_COMPUTE, WORKLOAD_MEMORY_COMM, WORKLOAD_OTHER = 0, 1, 2, 3
+
+def _bucket_sums(duration, tag):
+    """Duration sum and row count per workload tag."""
+    return np.bincount(tag, weights=duration, minlength=4), np.bincount(tag, minlength=4)
+
+if njit is not None:
+    @njit(cache=True)
+    def _bucket_sums(duration, tag):
+        """Duration sum and row count per workload tag, in one compiled pass."""
+        sums = np.zeros(4)
+        counts = np.zeros(4, dtype=np.int64)
+        for i in range(duration.size):
+            sums[tag[i]] += duration[i]
+            counts[tag[i]] += 1
+        return sums, counts
+
+def processing_time(ttft_s, tpot_s, output_tokens):
+    """End-to-end request time in seconds: first token plus one TPOT per output token."""
+    return ttft_s + (tpot_s * output_tokens)
+
+def frequency_scaled_time(sim_duration, correlation_factor, freq_mhz, baseline_freq=1600):
+    """Real time predicted from a simulation duration, scaled from the baseline frequency.
+    
+    Works elementwise on NumPy arrays as well as on scalars.
+    """
+    return sim_duration * correlation_factor / (freq_mhz / baseline_freq)
+
+def _gt_cache_path(path: str, stat: os.stat_result) -> Path:
+    """Cache file for this exact version of path; a new size or mtime gives a new name."""
+    source = hashlib.blake2b(os.path.abspath(path).encode(), digest_size=8).hexdigest()
+    version = hashlib.blake2b(f"{stat.st_size}|{stat.st_mtime_ns}".encode(), digest_size=8).hexdigest()
+    return GT_CACHE_DIR / f"{source}-{version}.parquet"
+
+def load_gt_simulation_rows(path: str):
+    """GT rows of a raw simulation results CSV and the CSV's total record count.
+    
+    With pyarrow the GT rows are cached as Parquet under GT_CACHE_DIR and reused
+    while the CSV keeps the same size and mtime.
+    """
+    cache = None
+    if pq is not None:
+        try:
+            cache = _gt_cache_path(path, os.stat(path))
+        except OSError:
+            pass
+        if cache is not None and cache.is_file():
+            table = pq.read_table(cache)
+            return table.to_pandas(), int(table.schema.metadata[b'raw_records'])
+    
+    raw_sim_data = read_raw_simulation_csv(path)
+    gt_sim_data = raw_sim_data[raw_sim_data['RESOURCE'].str.contains('gt/', na=False)]
+    
+    if cache is not None:
+        table = pa.Table.from_pandas(gt_sim_data, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               b'raw_records': str(len(raw_sim_data)).encode()})
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            # Written under a temporary name so a concurrent run never reads a partial file
+            partial = cache.with_suffix(f'.{os.getpid()}.tmp')
+            pq.write_table(table, partial, compression='zstd')
+            os.replace(partial, cache)
+            # Older versions of the same CSV are never read again
+            source = cache.name.split('-')[0]
+            for stale in GT_CACHE_DIR.glob(f"{source}-*.parquet"):
+                if stale != cache:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:  # Caching is best effort
+            print(f"⚠️  Could not cache GT rows: {e}")
+    
+    return gt_sim_data, len(raw_sim_data)
+
 class PVCCorrelationStudy:
     """Study correlation between measured PVC hardware and simulation results."""
     
@@ -30,6 +142,9 @@ class PVCCorrelationStudy:
         # Calculate measured PVC performance metrics
         self.calculate_measured_performance()
         
+        # output/master_summary.csv, read on first use (see master_df)
+        self._master_df = None
+        
         # Load simulation data
         self.load_simulation_data()
     
@@ -39,7 +154,7 @@ class PVCCorrelationStudy:
         tpot_sec = self.pvc_measurements["tpot_ms"] / 1000  # Convert to seconds
         
         # Calculate total time for processing
-        total_time = ttft_sec + (tpot_sec * self.pvc_measurements["tokens_output"])
+        total_time = processing_time(ttft_sec, tpot_sec, self.pvc_measurements["tokens_output"])
         
         # Calculate Tokens per Second (TGS)
         measured_tgs = self.pvc_measurements["total_tokens"] / total_time
@@ -57,11 +172,21 @@ class PVCCorrelationStudy:
         print(f"  Total Time: {total_time:.3f} seconds")
         print(f"  Measured TGS: {measured_tgs:.2f} tokens/second")
     
+    @property
+    def master_df(self) -> pd.DataFrame:
+        """Master summary with a parsed freq_mhz column, read once per study."""
+        if self._master_df is None:
+            master_df = pd.read_csv('output/master_summary.csv',
+                                    engine='pyarrow' if pa is not None else 'c')
+            master_df['freq_mhz'] = master_df['Frequency'].str.replace('MHz', '', regex=False).astype(int)
+            self._master_df = master_df
+        return self._master_df
+    
     def load_simulation_data(self):
         """Load simulation results for 1600MHz."""
         try:
             # Load master summary for 1600MHz
-            master_df = pd.read_csv('output/master_summary.csv')
+            master_df = self.master_df
             freq_1600_row = master_df[master_df['Frequency'] == '1600MHz']
             
             if not freq_1600_row.empty:
@@ -76,24 +201,23 @@ class PVCCorrelationStudy:
             # Load detailed raw simulation data for 1600MHz
             raw_data_path = 'temp_data/1600mhz/simulation_results.csv'
             if Path(raw_data_path).exists():
-                self.raw_sim_data = pd.read_csv(raw_data_path)
-                # Filter for GT resources only
-                self.gt_sim_data = self.raw_sim_data[self.raw_sim_data['RESOURCE'].str.contains('gt/', na=False)]
+                # GT resources only; the full raw frame is not kept
+                self.gt_sim_data, self.raw_record_count = load_gt_simulation_rows(raw_data_path)
                 
-                print(f"  Raw Simulation Records: {len(self.raw_sim_data)}")
+                print(f"  Raw Simulation Records: {self.raw_record_count}")
                 print(f"  GT Resources: {len(self.gt_sim_data)}")
                 
                 # Analyze resource breakdown
                 self.analyze_simulation_workload()
             else:
                 print(f"⚠️  Raw simulation data not found: {raw_data_path}")
-                self.raw_sim_data = None
+                self.raw_record_count = None
                 self.gt_sim_data = None
                 
         except FileNotFoundError as e:
             print(f"❌ Error loading simulation data: {e}")
             self.sim_total_duration = None
-            self.raw_sim_data = None
+            self.raw_record_count = None
     
     def analyze_simulation_workload(self):
         """Analyze simulation workload characteristics."""
@@ -101,35 +225,31 @@ class PVCCorrelationStudy:
             print("⚠️  No GT simulation data available for analysis")
             return
         
-        # Ensure duration is numeric
-        self.gt_sim_data = self.gt_sim_data.copy()
-        self.gt_sim_data['DURATION'] = pd.to_numeric(self.gt_sim_data['DURATION'], errors='coerce')
-        self.gt_sim_data = self.gt_sim_data.dropna(subset=['DURATION'])
-        
-        # Categorize workload types
-        workload_analysis = {
-            'compute_tasks': [],      # ex_u0 - XeCore compute
-            'memory_comm_tasks': [],  # ex_u1 - Memory + Communication
-            'other_gt_tasks': []      # Other GT resources
-        }
-        
-        compute_duration = 0
-        memory_comm_duration = 0
-        other_duration = 0
-        
-        for _, row in self.gt_sim_data.iterrows():
-            resource = str(row['RESOURCE'])
-            duration = float(row['DURATION'])
-            
-            if '/ex_u0' in resource and 'GT_TILE_' in resource:
-                workload_analysis['compute_tasks'].append(row.to_dict())
-                compute_duration += duration
-            elif '/ex_u1' in resource and 'GT_TILE_' in resource:
-                workload_analysis['memory_comm_tasks'].append(row.to_dict())
-                memory_comm_duration += duration
-            elif resource.startswith('gt/'):
-                workload_analysis['other_gt_tasks'].append(row.to_dict())
-                other_duration += duration
+        # Ensure duration is numeric; assign builds the new frame without copying it first
+        self.gt_sim_data = self.gt_sim_data.assign(
+            DURATION=pd.to_numeric(self.gt_sim_data['DURATION'], errors='coerce')
+        ).dropna(subset=['DURATION'])
+        
+        # Categorize workload types: match only the distinct resource names, in a single
+        # regex pass, then broadcast the per-name tags back to rows by code
+        codes, uniques = pd.factorize(self.gt_sim_data['RESOURCE'], use_na_sentinel=False)
+        resource = pd.Series(uniques).astype(str)
+        groups = resource.str.extract(WORKLOAD_PATTERN).notna().to_numpy()
+        is_compute = groups[:, 1]
+        is_memory_comm = groups[:, 2]
+        # Other GT resources
+        is_other = groups[:, 0] & ~(is_compute | is_memory_comm)
+        
+        tags = np.full(len(resource), WORKLOAD_IGNORED, dtype=np.intp)
+        tags[is_compute] = WORKLOAD_COMPUTE
+        tags[is_memory_comm] = WORKLOAD_MEMORY_COMM
+        tags[is_other] = WORKLOAD_OTHER
+        
+        # All three buckets in a single reduction over the rows
+        sums, counts = _bucket_sums(self.gt_sim_data['DURATION'].to_numpy(dtype=np.float64), tags[codes])
+        compute_duration = float(sums[WORKLOAD_COMPUTE])
+        memory_comm_duration = float(sums[WORKLOAD_MEMORY_COMM])
+        other_duration = float(sums[WORKLOAD_OTHER])
         
         total_gt_duration = compute_duration + memory_comm_duration + other_duration
         
@@ -142,9 +262,9 @@ class PVCCorrelationStudy:
             'memory_comm_percentage': (memory_comm_duration / total_gt_duration * 100) if total_gt_duration > 0 else 0,
             'other_percentage': (other_duration / total_gt_duration * 100) if total_gt_duration > 0 else 0,
             'task_counts': {
-                'compute_tasks': len(workload_analysis['compute_tasks']),
-                'memory_comm_tasks': len(workload_analysis['memory_comm_tasks']),
-                'other_tasks': len(workload_analysis['other_gt_tasks'])
+                'compute_tasks': int(counts[WORKLOAD_COMPUTE]),
+                'memory_comm_tasks': int(counts[WORKLOAD_MEMORY_COMM]),
+                'other_tasks': int(counts[WORKLOAD_OTHER])
             }
         }
         
@@ -173,10 +293,11 @@ class PVCCorrelationStudy:
         
         # Alternative correlations
         ttft_correlation = self.measured_performance["ttft_seconds"] / sim_duration
-        tgs_from_sim = self.pvc_measurements["total_tokens"] / (sim_duration * correlation_factor)
         
-        # Validation: calculate TGS using simulation time
-        simulated_tgs = self.pvc_measurements["total_tokens"] / measured_time  # Should match measured TGS
+        # Round-trip check: predicting the baseline run through the same path as the frequency
+        # study must reproduce the measured TGS (it is not an independent validation)
+        tgs_from_sim = self.pvc_measurements["total_tokens"] / frequency_scaled_time(
+            sim_duration, correlation_factor, 1600)
         
         self.correlation_results = {
             "primary_correlation_factor": correlation_factor,
@@ -206,7 +327,7 @@ class PVCCorrelationStudy:
     def validate_correlation_across_frequencies(self):
         """Validate correlation factor across all available frequencies."""
         try:
-            master_df = pd.read_csv('output/master_summary.csv')
+            master_df = self.master_df
             
             print(f"\n🎯 Frequency Validation Study:")
             print(f"{'Frequency':<12} {'Sim Duration':<15} {'Predicted Time':<15} {'Predicted TGS':<15} {'Freq Scale':<12}")
@@ -215,36 +336,37 @@ class PVCCorrelationStudy:
             correlation_factor = self.correlation_results["primary_correlation_factor"]
             baseline_freq = 1600  # MHz
             
-            validation_results = []
+            freq_mhz = master_df['freq_mhz'].to_numpy()
+            sim_duration = master_df['total_duration'].to_numpy(dtype=np.float64)
             
-            for _, row in master_df.iterrows():
-                freq_str = row['Frequency']
-                freq_mhz = int(freq_str.replace('MHz', ''))
-                sim_duration = row['total_duration']
-                
-                # Calculate frequency scaling factor
-                freq_scale = freq_mhz / baseline_freq
-                
-                # Predict real time using correlation factor
-                predicted_time = sim_duration * correlation_factor
-                
-                # Scale by frequency (higher frequency = faster processing)
-                freq_scaled_time = predicted_time / freq_scale
-                
-                # Calculate predicted TGS
-                predicted_tgs = self.pvc_measurements["total_tokens"] / freq_scaled_time
-                
-                validation_results.append({
-                    'frequency_mhz': freq_mhz,
-                    'frequency_str': freq_str,
-                    'sim_duration': sim_duration,
-                    'predicted_time': predicted_time,
-                    'freq_scaled_time': freq_scaled_time,
-                    'predicted_tgs': predicted_tgs,
-                    'freq_scale': freq_scale
-                })
-                
-                print(f"{freq_str:<12} {sim_duration:<15.8f} {freq_scaled_time:<15.6f} {predicted_tgs:<15.2f} {freq_scale:<12.3f}")
+            # Calculate frequency scaling factor
+            freq_scale = freq_mhz / baseline_freq
+            
+            # Predict real time using correlation factor
+            predicted_time = sim_duration * correlation_factor
+            
+            # Scale by frequency (higher frequency = faster processing)
+            freq_scaled_time = frequency_scaled_time(sim_duration, correlation_factor, freq_mhz, baseline_freq)
+            
+            # Calculate predicted TGS
+            predicted_tgs = self.pvc_measurements["total_tokens"] / freq_scaled_time
+            
+            # Plain Python values, so the records export to JSON/CSV as before
+            columns = {
+                'frequency_mhz': freq_mhz.tolist(),
+                'frequency_str': master_df['Frequency'].tolist(),
+                'sim_duration': sim_duration.tolist(),
+                'predicted_time': predicted_time.tolist(),
+                'freq_scaled_time': freq_scaled_time.tolist(),
+                'predicted_tgs': predicted_tgs.tolist(),
+                'freq_scale': freq_scale.tolist()
+            }
+            validation_results = [dict(zip(columns, values)) for values in zip(*columns.values())]
+            
+            print("\n".join(
+                f"{v['frequency_str']:<12} {v['sim_duration']:<15.8f} {v['freq_scaled_time']:<15.6f} "
+                f"{v['predicted_tgs']:<15.2f} {v['freq_scale']:<12.3f}"
+                for v in validation_results))
             
             self.frequency_validation = validation_results
             return validation_results
@@ -253,7 +375,7 @@ class PVCCorrelationStudy:
             print(f"❌ Error in frequency validation: {e}")
             return None
     
-    def generate_correlation_plots(self, output_path: str = "output"):
+    def generate_correlation_plots(self, output_path: str = "output", dpi: int = 150):
         """Generate visualization plots for correlation analysis."""
         if not hasattr(self, 'correlation_results') or not hasattr(self, 'frequency_validation'):
             print("⚠️  Cannot generate plots - missing correlation data")
@@ -335,10 +457,10 @@ class PVCCorrelationStudy:
         
         # Save plots
         plot_file = output_dir / "pvc_hardware_simulation_correlation_study.png"
-        plt.savefig(plot_file, dpi=300, bbox_inches='tight')
+        fig.savefig(plot_file, dpi=dpi, bbox_inches='tight')
         print(f"\n📈 Correlation study plots saved to {plot_file}")
         
-        plt.show()
+        plt.close(fig)
     
     def export_correlation_results(self, output_path: str = "output"):
         """Export correlation study results to files."""
@@ -3,13 +3,257 @@
 Quick analysis script - processes one frequency at a time for better control.
 """
 
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
 import pandas as pd
 import numpy as np
 import os
 from pathlib import Path
 
-def analyze_single_frequency(freq_name, path):
-    """Analyze a single frequency sweep."""
+try:
+    import polars as pl
+except ImportError:  # Without Polars the CSV is loaded eagerly with pandas
+    pl = None
+
+try:
+    import cudf
+except ImportError:  # No RAPIDS install / NVIDIA GPU; aggregation stays on the CPU
+    cudf = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pandas' own CSV reader is used instead, without the Parquet cache
+    pa = pacsv = pq = None
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:  # ALL-frequency runs then use a plain ProcessPoolExecutor
+    Parallel = delayed = None
+
+try:
+    import xlsxwriter
+except ImportError:  # Excel export then uses pandas' default openpyxl engine
+    xlsxwriter = None
+
+# Columns used by the analysis, and rows per chunk when reading with pandas
+GT_COLUMNS = ['RESOURCE', 'DURATION', 'TRANSITION']
+CSV_CHUNK_ROWS = 200_000
+
+# GT-only subset of each results CSV, cached locally so later runs skip the share
+GT_CACHE_DIR = Path.home() / '.cache' / 'quick_analyzer'
+
+# Where transition tables and the master summary are written
+OUTPUT_DIR = "output"
+
+def _gt_cache_path(csv_file, stat):
+    """Cache file for this exact version of csv_file; a new size or mtime gives a new name."""
+    source = hashlib.blake2b(os.path.abspath(csv_file).encode(), digest_size=8).hexdigest()
+    version = hashlib.blake2b(f"{stat.st_size}|{stat.st_mtime_ns}".encode(), digest_size=8).hexdigest()
+    return GT_CACHE_DIR / f"{source}-{version}.parquet"
+
+def _gt_cache(csv_file, stat=None):
+    """Path of the GT-row cache for the current version of csv_file if it exists, else None.
+    
+    Pass stat when the CSV has already been stat'ed to save a round trip to the share.
+    """
+    if pq is None:
+        return None
+    try:
+        cache = _gt_cache_path(csv_file, stat or os.stat(csv_file))
+    except OSError:
+        return None
+    return cache if cache.is_file() else None
+
+def _write_gt_cache(table, cache):
+    """Save a GT-row table under cache and drop the entries of older versions of the same CSV."""
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a temporary name so a concurrent run never reads a partial file
+        partial = cache.with_suffix(f'.{os.getpid()}.tmp')
+        pq.write_table(table, partial, compression='zstd')
+        os.replace(partial, cache)
+        source = cache.name.split('-')[0]
+        for stale in cache.parent.glob(f"{source}-*.parquet"):
+            if stale != cache:
+                stale.unlink(missing_ok=True)
+    except OSError as e:  # e.g. a read-only home directory; just run uncached
+        print(f"⚠️ Could not cache GT rows: {e}")
+
+def _scan_gt_stats(csv_file):
+    """Parse, filter and aggregate a results CSV in one lazy Polars pass.
+    
+    Returns (total_rows, n_columns, gt_rows, duration_stats, transition_summary); the
+    transition summary is a pandas frame in TRANSITION order with unrounded values. With
+    pyarrow the GT rows are collected in the same pass and cached for _read_gt_stats.
+    """
+    stat = os.stat(csv_file)
+    lf = pl.scan_csv(csv_file, low_memory=True, infer_schema_length=0)
+    n_columns = len(lf.collect_schema())
+    gt_all = (lf.filter(pl.col('RESOURCE').str.starts_with('gt/'))
+                .with_columns(pl.col('DURATION').cast(pl.Float64, strict=False)))
+    gt = gt_all.select('TRANSITION', 'DURATION')
+    duration = pl.col('DURATION')
+    
+    queries = [
+        lf.select(pl.len().alias('rows')),
+        gt.select(
+            duration.sum().alias('total_duration'),
+            duration.mean().alias('avg_duration'),
+            duration.median().alias('median_duration'),
+            duration.max().alias('max_duration'),
+            duration.min().alias('min_duration'),
+            duration.std().alias('std_duration'),
+            pl.len().alias('count')
+        ),
+        gt.filter(pl.col('TRANSITION').is_not_null())
+          .group_by('TRANSITION')
+          .agg(
+              duration.count().alias('count'),
+              duration.sum().alias('total_duration'),
+              duration.mean().alias('avg_duration'),
+              duration.median().alias('median_duration')
+          )
+          .sort('TRANSITION')
+    ]
+    if pq is not None:
+        queries.append(gt_all.select(GT_COLUMNS))
+    totals, stats, transitions, *rows = pl.collect_all(queries, streaming=True)
+    
+    if rows:
+        table = rows[0].to_arrow().replace_schema_metadata({
+            b'total_rows': str(totals.item()).encode(),
+            b'n_columns': str(n_columns).encode()
+        })
+        _write_gt_cache(table, _gt_cache_path(csv_file, stat))
+    
+    duration_stats = stats.row(0, named=True)
+    return totals.item(), n_columns, duration_stats['count'], duration_stats, transitions.to_pandas()
+
+def _gpu_gt_stats(csv_file):
+    """cuDF equivalent of _scan_gt_stats: parse, GT filter and aggregation run on the GPU."""
+    n_columns = len(pd.read_csv(csv_file, nrows=0).columns)
+    df = cudf.read_csv(csv_file, usecols=GT_COLUMNS, dtype={column: 'str' for column in GT_COLUMNS})
+    total_rows = len(df)
+    gt = df[df['RESOURCE'].str.startswith('gt/')]
+    del df
+    gt = gt.assign(DURATION=cudf.to_numeric(gt['DURATION'], errors='coerce'))
+    
+    duration = gt['DURATION']
+    duration_stats = {
+        'total_duration': float(duration.sum()),
+        'avg_duration': float(duration.mean()),
+        'median_duration': float(duration.median()),
+        'max_duration': float(duration.max()),
+        'min_duration': float(duration.min()),
+        'std_duration': float(duration.std()),
+        'count': len(gt)
+    }
+    
+    # Only the per-transition table comes back to the host
+    transition_summary = gt.groupby('TRANSITION').agg({
+        'DURATION': ['count', 'sum', 'mean', 'median']
+    }).to_pandas().sort_index()
+    transition_summary.columns = ['count', 'total_duration', 'avg_duration', 'median_duration']
+    
+    return total_rows, n_columns, len(gt), duration_stats, transition_summary.reset_index()
+
+def _load_gt_rows(csv_file, chunksize=CSV_CHUNK_ROWS):
+    """GT rows of GT_COLUMNS from a results CSV, with the CSV's total row and column counts.
+    
+    Only the GT rows of the analysed columns are kept between chunks, so peak memory
+    is one chunk plus the GT subset rather than the whole file. With pyarrow the
+    analysed columns are parsed in one multithreaded pass instead, and the GT rows
+    are cached as Parquet so later runs skip the CSV entirely.
+    """
+    stat = os.stat(csv_file)
+    cache = _gt_cache(csv_file, stat)
+    if cache is not None:
+        table = pq.read_table(cache)
+        meta = table.schema.metadata
+        return table.to_pandas(), int(meta[b'total_rows']), int(meta[b'n_columns'])
+    
+    n_columns = len(pd.read_csv(csv_file, nrows=0).columns)
+    if pacsv is not None:
+        # Multithreaded Arrow parse of just the analysed columns, in a single frame
+        table = pacsv.read_csv(
+            csv_file,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 22),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=GT_COLUMNS,
+                column_types={'RESOURCE': pa.string(), 'TRANSITION': pa.string()}))
+        chunks = [table.to_pandas(self_destruct=True, split_blocks=True)]
+        del table
+    else:
+        chunks = pd.read_csv(csv_file, usecols=GT_COLUMNS, chunksize=chunksize,
+                             dtype={'RESOURCE': str, 'TRANSITION': str})
+    
+    total_rows = 0
+    gt_chunks = []
+    for chunk in chunks:
+        total_rows += len(chunk)
+        gt_chunks.append(chunk[chunk['RESOURCE'].str.startswith('gt/', na=False)])
+    
+    gt_df = pd.concat(gt_chunks, ignore_index=True)
+    gt_df['DURATION'] = pd.to_numeric(gt_df['DURATION'], errors='coerce')
+    
+    if pq is not None:
+        table = pa.Table.from_pandas(gt_df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               b'total_rows': str(total_rows).encode(),
+                                               b'n_columns': str(n_columns).encode()})
+        _write_gt_cache(table, _gt_cache_path(csv_file, stat))
+    
+    return gt_df, total_rows, n_columns
+
+def _read_gt_stats(csv_file, chunksize=CSV_CHUNK_ROWS):
+    """pandas equivalent of _scan_gt_stats."""
+    gt_df, total_rows, n_columns = _load_gt_rows(csv_file, chunksize)
+    
+    duration_stats = {
+        'total_duration': gt_df['DURATION'].sum(),
+        'avg_duration': gt_df['DURATION'].mean(),
+        'median_duration': gt_df['DURATION'].median(),
+        'max_duration': gt_df['DURATION'].max(),
+        'min_duration': gt_df['DURATION'].min(),
+        'std_duration': gt_df['DURATION'].std(),
+        'count': len(gt_df)
+    }
+    
+    transition_summary = gt_df.groupby('TRANSITION').agg(
+        count=('DURATION', 'count'),
+        total_duration=('DURATION', 'sum'),
+        avg_duration=('DURATION', 'mean'),
+        median_duration=('DURATION', 'median')
+    )
+    
+    return total_rows, n_columns, len(gt_df), duration_stats, transition_summary.reset_index()
+
+def save_table(df, stem, fmt):
+    """Write an analysis table as 'parquet', 'csv' or 'xlsx' and return the path written."""
+    path = f'{stem}.{fmt}'
+    if fmt == 'parquet':
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, compression='zstd')
+    elif fmt == 'xlsx':
+        if xlsxwriter is not None:
+            # Stream rows to disk instead of building the workbook in memory
+            with pd.ExcelWriter(path, engine='xlsxwriter',
+                                engine_kwargs={'options': {'constant_memory': True}}) as writer:
+                df.to_excel(writer, index=False)
+        else:
+            df.to_excel(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+    return path
+
+def analyze_single_frequency(freq_name, path, xlsx=False, output_dir=OUTPUT_DIR):
+    """Analyze a single frequency sweep.
+    
+    The transition table is saved in output_dir, which must exist, as Parquet (CSV without
+    pyarrow), plus an Excel copy when xlsx is set.
+    """
     print(f"\n{'='*60}")
     print(f"Analyzing {freq_name}")
     print(f"Path: {path}")
@@ -17,43 +261,41 @@ def analyze_single_frequency(freq_name, path):
     
     csv_file = os.path.join(path, 'simulation_results.csv')
     
-    if not os.path.exists(csv_file):
+    # One stat per file: each is a network round trip on the results share
+    try:
+        csv_stat = os.stat(csv_file)
+    except OSError:
         print(f"❌ File not found: {csv_file}")
         return None
     
     print("📁 Loading CSV file...")
     try:
-        # Load with progress indication
-        df = pd.read_csv(csv_file)
-        print(f"✅ Loaded {len(df):,} rows, {len(df.columns)} columns")
+        # cuDF runs parse, GT filter and aggregation on the GPU and Polars streams them in one
+        # pass; pandas reads the file in chunks, or the cached GT rows from an earlier run
+        if _gt_cache(csv_file, csv_stat) is not None:
+            gt_stats = _read_gt_stats
+        elif cudf is not None:
+            gt_stats = _gpu_gt_stats
+        elif pl is not None:
+            gt_stats = _scan_gt_stats
+        else:
+            gt_stats = _read_gt_stats
+        total_rows, n_columns, gt_rows, duration_stats, transition_summary = gt_stats(csv_file)
+        print(f"✅ Loaded {total_rows:,} rows, {n_columns} columns")
     except Exception as e:
         print(f"❌ Error loading file: {e}")
         return None
     
     # Filter for GT resources
     print("🔍 Filtering for gt/* resources...")
-    gt_mask = df['RESOURCE'].str.startswith('gt/', na=False)
-    gt_df = df[gt_mask].copy()
-    print(f"✅ Found {len(gt_df):,} GT resources ({len(gt_df)/len(df)*100:.1f}% of total)")
+    print(f"✅ Found {gt_rows:,} GT resources ({gt_rows/total_rows*100:.1f}% of total)")
     
-    if len(gt_df) == 0:
+    if gt_rows == 0:
         print("⚠️ No GT resources found!")
         return None
     
     # Duration analysis
     print("📊 Analyzing durations...")
-    gt_df['DURATION'] = pd.to_numeric(gt_df['DURATION'], errors='coerce')
-    
-    duration_stats = {
-        'total_duration': gt_df['DURATION'].sum(),
-        'avg_duration': gt_df['DURATION'].mean(),
-        'median_duration': gt_df['DURATION'].median(),
-        'max_duration': gt_df['DURATION'].max(),
-        'min_duration': gt_df['DURATION'].min(),
-        'std_duration': gt_df['DURATION'].std(),
-        'count': len(gt_df)
-    }
-    
     print(f"💰 TOTAL DURATION: {duration_stats['total_duration']:,.6f}")
     print(f"📈 Average: {duration_stats['avg_duration']:.6f}")
     print(f"📊 Median: {duration_stats['median_duration']:.6f}")
@@ -62,37 +304,32 @@ def analyze_single_frequency(freq_name, path):
     
     # Transition analysis
     print("🔄 Analyzing transitions...")
-    transition_summary = gt_df.groupby('TRANSITION').agg({
-        'DURATION': ['count', 'sum', 'mean', 'median']
-    }).round(6)
-    
-    transition_summary.columns = ['count', 'total_duration', 'avg_duration', 'median_duration']
-    transition_summary = transition_summary.reset_index()
-    transition_summary = transition_summary.sort_values('total_duration', ascending=False)
+    transition_summary = transition_summary.round(6).sort_values('total_duration', ascending=False)
     
     print(f"🎯 Found {len(transition_summary)} unique transitions")
     print("\n🏆 TOP 10 TRANSITIONS BY TOTAL DURATION:")
     print("-" * 80)
-    for i, row in transition_summary.head(10).iterrows():
-        print(f"{i+1:2d}. {row['total_duration']:12.6f} | {row['count']:6d} times | {row['TRANSITION'][:50]}...")
+    top = transition_summary.head(10)
+    print("\n".join(f"{i+1:2d}. {total:12.6f} | {count:6d} times | {transition[:50]}..."
+                    for i, total, count, transition in zip(top.index, top['total_duration'],
+                                                           top['count'], top['TRANSITION'])))
     
     # Save results
-    output_dir = "output"
-    os.makedirs(output_dir, exist_ok=True)
-    
     freq_clean = freq_name.replace('MHz', '').replace('/', '_')
     
     # Save transition summary
-    trans_file = os.path.join(output_dir, f"{freq_clean}_transitions.xlsx")
-    transition_summary.to_excel(trans_file, index=False)
+    trans_stem = os.path.join(output_dir, f"{freq_clean}_transitions")
+    trans_file = save_table(transition_summary, trans_stem, 'parquet' if pq is not None else 'csv')
     print(f"\n💾 Saved transition analysis: {trans_file}")
+    if xlsx:
+        print(f"💾 Saved Excel copy: {save_table(transition_summary, trans_stem, 'xlsx')}")
     
     # Save summary stats
     summary_data = {
         'Frequency': freq_name,
-        'Total_Rows': len(df),
-        'GT_Rows': len(gt_df),
-        'GT_Percentage': len(gt_df)/len(df)*100,
+        'Total_Rows': total_rows,
+        'GT_Rows': gt_rows,
+        'GT_Percentage': gt_rows/total_rows*100,
         **duration_stats,
         'Unique_Transitions': len(transition_summary)
     }
@@ -101,6 +338,13 @@ def analyze_single_frequency(freq_name, path):
 
 def main():
     """Main function with menu."""
+    parser = argparse.ArgumentParser(description="Quick simulation results analyzer")
+    parser.add_argument("--interactive", "-i", action="store_true",
+                        help="Analyze ALL frequencies one at a time, confirming before each next one")
+    parser.add_argument("--xlsx", action="store_true",
+                        help="Also save Excel copies of the transition tables and output/master_summary.xlsx")
+    args = parser.parse_args()
+    
     frequencies = {
         '1': ('600MHz', r'\\samba.zsc3.intel.com\nfs\site\disks\fsintel\disk_001\apattnay\martini_wa\llama4-8tp-600Mhz'),
         '2': ('1000MHz', r'\\samba.zsc3.intel.com\nfs\site\disks\fsintel\disk_001\apattnay\martini_wa\llama4-8tp-1000Mhz'),
@@ -116,7 +360,7 @@ def main():
     print("2. 1000MHz") 
     print("3. 1600MHz")
     print("4. 2000MHz")
-    print("a. ALL frequencies (sequential)")
+    print(f"a. ALL frequencies ({'sequential' if args.interactive else 'parallel'})")
     print("-" * 50)
     
     choice = input("Enter your choice (1/2/3/4/a): ").strip().lower()
@@ -125,13 +369,14 @@ def main():
         print("❌ Invalid choice!")
         return
     
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     all_summaries = []
     
-    if choice == 'a':
+    if choice == 'a' and args.interactive:
         # Process all frequencies
         for key in ['1', '2', '3', '4']:
             freq_name, path = frequencies[key]
-            summary = analyze_single_frequency(freq_name, path)
+            summary = analyze_single_frequency(freq_name, path, args.xlsx)
             if summary:
                 all_summaries.append(summary)
             
@@ -140,10 +385,22 @@ def main():
                 cont = input(f"\n⏭️ Continue to next frequency? (y/n): ").strip().lower()
                 if cont != 'y':
                     break
+    elif choice == 'a':
+        # Each frequency reads its own CSV and writes its own outputs, so analyze them in parallel;
+        # both pools return the summaries in frequency order
+        jobs = [frequencies[key] for key in ['1', '2', '3', '4']]
+        if Parallel is not None:
+            # joblib adds progress reporting for the analysts running this
+            summaries = Parallel(n_jobs=len(jobs), prefer='processes', verbose=10)(
+                delayed(analyze_single_frequency)(freq_name, path, args.xlsx) for freq_name, path in jobs)
+        else:
+            with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                summaries = list(pool.map(analyze_single_frequency, *zip(*jobs), [args.xlsx] * len(jobs)))
+        all_summaries.extend(summary for summary in summaries if summary)
     else:
         # Process single frequency
         freq_name, path = frequencies[choice]
-        summary = analyze_single_frequency(freq_name, path)
+        summary = analyze_single_frequency(freq_name, path, args.xlsx)
         if summary:
             all_summaries.append(summary)
     
@@ -157,10 +414,11 @@ def main():
         print(summary_df.to_string(index=False, float_format='%.6f'))
         
         # Save master summary
-        os.makedirs("output", exist_ok=True)
-        summary_df.to_excel("output/master_summary.xlsx", index=False)
-        summary_df.to_csv("output/master_summary.csv", index=False)
-        print("\n💾 Master summary saved to output/master_summary.xlsx")
+        summary_file = os.path.join(OUTPUT_DIR, "master_summary.csv")
+        summary_df.to_csv(summary_file, index=False)
+        if args.xlsx:
+            save_table(summary_df, os.path.join(OUTPUT_DIR, "master_summary"), 'xlsx')
+        print(f"\n💾 Master summary saved to {summary_file}")
         
         # Show total effort across all analyzed frequencies
         if len(all_summaries) > 1:
@@ -4,6 +4,8 @@ Simple LLM Performance Chart - Clean visualization for presentation
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Charts are only written to files
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -29,10 +31,8 @@ def create_simple_performance_chart():
     bars = ax1.bar(frequencies, total_times, color=colors, alpha=0.8, edgecolor='black', linewidth=1)
     
     # Add value labels on bars
-    for bar, value in zip(bars, total_times):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 20,
-                f'{value:.1f}ms', ha='center', va='bottom', fontweight='bold', fontsize=12)
+    ax1.bar_label(bars, labels=[f'{value:.1f}ms' for value in total_times],
+                  padding=3, fontweight='bold', fontsize=12)
     
     # Highlight the baseline
     baseline_idx = frequencies.index('1600MHz')
@@ -59,13 +59,9 @@ def create_simple_performance_chart():
     
     bars2 = ax2.bar(frequencies, improvements, color=colors_2, alpha=0.7, edgecolor='black', linewidth=1)
     
-    # Add value labels
-    for bar, value in zip(bars2, improvements):
-        height = bar.get_height()
-        y_pos = height + (2 if height > 0 else -5)
-        va = 'bottom' if height > 0 else 'top'
-        ax2.text(bar.get_x() + bar.get_width()/2., y_pos,
-                f'{value:+.1f}%', ha='center', va=va, fontweight='bold', fontsize=12)
+    # Add value labels (placed below the bar end for negative changes)
+    ax2.bar_label(bars2, labels=[f'{value:+.1f}%' for value in improvements],
+                  padding=3, fontweight='bold', fontsize=12)
     
     ax2.axhline(y=0, color='black', linestyle='-', alpha=0.8, linewidth=2)
     ax2.set_title('Performance Change vs 1600MHz\n(Positive = Better Performance)', fontsize=16, fontweight='bold', pad=20)
@@ -90,7 +86,7 @@ def create_simple_performance_chart():
     # Save the chart
     plt.savefig('output/llm_performance_simple.png', dpi=300, bbox_inches='tight')
     plt.savefig('output/llm_performance_simple.pdf', bbox_inches='tight')  # For presentations
-    plt.show()
+    plt.close(fig)
     
     # Print summary
     print("\n" + "="*70)
@@ -98,9 +94,9 @@ def create_simple_performance_chart():
     print("="*70)
     print("🎯 Baseline (1600MHz): TTFT=550ms, TPOT=51.5ms → Total=601.5ms")
     print("\n📈 Projected Performance:")
-    for i, row in df.iterrows():
-        status = "🚀" if row['performance_improvement'] > 0 else "⚠️"
-        print(f"   {status} {row['frequency_str']:>8}: {row['projected_total']:6.1f}ms ({row['performance_improvement']:+5.1f}%)")
+    for row in df.itertuples(index=False):
+        status = "🚀" if row.performance_improvement > 0 else "⚠️"
+        print(f"   {status} {row.frequency_str:>8}: {row.projected_total:6.1f}ms ({row.performance_improvement:+5.1f}%)")
     
     print(f"\n🏆 Best: 2000MHz → {df.loc[df['projected_total'].idxmin(), 'projected_total']:.1f}ms")
     print(f"⚠️ Worst: 600MHz → {df.loc[df['projected_total'].idxmax(), 'projected_total']:.1f}ms")
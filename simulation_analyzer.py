@@ -1,11 +1,128 @@
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are only written to files
 import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 import os
+import hashlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
+try:
+    import polars as pl
+except ImportError:  # Without Polars the sweep is loaded, filtered and aggregated with pandas
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # CSVs are then read and filtered with pandas in chunks, without the local cache
+    pa = pc = pacsv = pq = None
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # The per-transition moments then use np.bincount
+    get_num_threads = njit = prange = None
+
+# The only columns of simulation_results.csv the analysis reads; the rest are never parsed
+ANALYSIS_COLUMNS = ['RESOURCE', 'DURATION', 'TRANSITION']
+
+# Rows per thread below which the compiled kernel does not bother splitting the work
+_MIN_ROWS_PER_THREAD = 1 << 16
+
+def _group_moments(codes, vals, ngroups):
+    """Count, sum, squared deviations from the mean, min and max of vals per group code.
+    
+    Rows with a negative code or a NaN value are skipped, as pandas' groupby skips them.
+    """
+    valid = (codes >= 0) & ~np.isnan(vals)
+    codes, vals = codes[valid], vals[valid]
+    count = np.bincount(codes, minlength=ngroups)
+    total = np.bincount(codes, weights=vals, minlength=ngroups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+    m2 = np.bincount(codes, weights=(vals - mean[codes]) ** 2, minlength=ngroups)
+    mn = np.full(ngroups, np.inf)
+    mx = np.full(ngroups, -np.inf)
+    np.minimum.at(mn, codes, vals)
+    np.maximum.at(mx, codes, vals)
+    mn[count == 0] = np.nan
+    mx[count == 0] = np.nan
+    return count, total, m2, mn, mx
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _group_moments(codes, vals, ngroups):
+        """Count, sum, squared deviations from the mean, min and max of vals per group code.
+        
+        Each thread reduces its own block of rows into private per-group arrays, which are
+        then combined, so there are no shared writes.
+        """
+        n = vals.size
+        nblocks = max(1, min(get_num_threads(), n // _MIN_ROWS_PER_THREAD))
+        step = (n + nblocks - 1) // nblocks
+        block_count = np.zeros((nblocks, ngroups), dtype=np.int64)
+        block_total = np.zeros((nblocks, ngroups))
+        block_mn = np.full((nblocks, ngroups), np.inf)
+        block_mx = np.full((nblocks, ngroups), -np.inf)
+        for b in prange(nblocks):
+            for i in range(b * step, min(n, (b + 1) * step)):
+                g, v = codes[i], vals[i]
+                if g < 0 or np.isnan(v):
+                    continue
+                block_count[b, g] += 1
+                block_total[b, g] += v
+                block_mn[b, g] = min(block_mn[b, g], v)
+                block_mx[b, g] = max(block_mx[b, g], v)
+        
+        count = np.zeros(ngroups, dtype=np.int64)
+        total = np.zeros(ngroups)
+        mn = np.full(ngroups, np.inf)
+        mx = np.full(ngroups, -np.inf)
+        for g in range(ngroups):
+            for b in range(nblocks):
+                count[g] += block_count[b, g]
+                total[g] += block_total[b, g]
+                mn[g] = min(mn[g], block_mn[b, g])
+                mx[g] = max(mx[g], block_mx[b, g])
+            if count[g] == 0:
+                mn[g] = np.nan
+                mx[g] = np.nan
+        
+        # Second pass for the spread, which is more accurate than sum-of-squares arithmetic
+        block_m2 = np.zeros((nblocks, ngroups))
+        for b in prange(nblocks):
+            for i in range(b * step, min(n, (b + 1) * step)):
+                g, v = codes[i], vals[i]
+                if g < 0 or np.isnan(v):
+                    continue
+                d = v - total[g] / count[g]
+                block_m2[b, g] += d * d
+        m2 = np.zeros(ngroups)
+        for g in range(ngroups):
+            for b in range(nblocks):
+                m2[g] += block_m2[b, g]
+        return count, total, m2, mn, mx
+
+# Chart style, resolved from matplotlib's bundled seaborn sheet once at import
+_PLOT_STYLE = dict(matplotlib.style.library['seaborn-v0_8'])
+
+# Local cache of the gt/* rows of each results CSV, so repeat runs skip the network share
+GT_CACHE_DIR = Path.home() / '.cache' / 'simulation_analyzer'
+
+def _gt_cache_path(file_path: str, stat: os.stat_result) -> Path:
+    """Cache file for this exact version of file_path; a new size or mtime gives a new name.
+    
+    The name starts with a hash of the path alone, so older versions can be found and evicted.
+    """
+    source = hashlib.blake2b(file_path.encode(), digest_size=8).hexdigest()
+    version = hashlib.blake2b(f"{stat.st_size}|{stat.st_mtime_ns}".encode(), digest_size=8).hexdigest()
+    return GT_CACHE_DIR / f"{source}-{version}.parquet"
+
 class SimulationAnalyzer:
     """
     Analyzes simulation_results.csv files from multiple frequency sweep directories.
@@ -27,28 +144,74 @@ class SimulationAnalyzer:
             print(f"Loading {file_path}...")
             print("  This may take a moment for large files...")
             
-            # Load in chunks for better memory management
-            chunk_size = 50000
-            chunks = []
-            total_rows = 0
-            
-            for chunk in pd.read_csv(file_path, chunksize=chunk_size):
-                chunks.append(chunk)
-                total_rows += len(chunk)
-                print(f"  Loaded {total_rows:,} rows...", end='\r')
-            
-            df = pd.concat(chunks, ignore_index=True)
+            if pacsv is not None:
+                # Multithreaded Arrow parse straight into one table, so there is no chunk
+                # list to concatenate; the table's buffers are released as pandas takes them
+                table = pacsv.read_csv(file_path,
+                                       read_options=pacsv.ReadOptions(use_threads=True, block_size=64 << 20),
+                                       convert_options=pacsv.ConvertOptions(include_columns=ANALYSIS_COLUMNS))
+                df = table.to_pandas(self_destruct=True, split_blocks=True)
+                del table
+                print(f"  Loaded {len(df):,} rows...", end='\r')
+            else:
+                # Load in chunks for better memory management
+                chunk_size = 50000
+                chunks = []
+                total_rows = 0
+                
+                for chunk in pd.read_csv(file_path, usecols=ANALYSIS_COLUMNS, chunksize=chunk_size,
+                                         dtype={'RESOURCE': str, 'TRANSITION': str}):
+                    chunks.append(chunk)
+                    total_rows += len(chunk)
+                    print(f"  Loaded {total_rows:,} rows...", end='\r')
+                
+                df = pd.concat(chunks, ignore_index=True)
             print(f"\n✓ Successfully loaded {file_path}")
             print(f"  Shape: {df.shape}")
             print(f"  Columns: {df.columns.tolist()}")
             return df
-        except KeyboardInterrupt:
+        except KeyboardInterrupt:  # Direct calls only; run_analysis' worker threads never see Ctrl-C
             print(f"\n⚠ Loading interrupted for {file_path}")
             return pd.DataFrame()
         except Exception as e:
             print(f"\n✗ Error loading {file_path}: {e}")
             return pd.DataFrame()
     
+    def load_gt_resources(self, file_path: str) -> Tuple[int, pd.DataFrame]:
+        """Arrow equivalent of load_csv_file followed by filter_gt_resources.
+        
+        The gt/ prefix mask runs as an Arrow compute kernel on the parsed table, so only the
+        GT rows are ever converted to pandas. Returns (total_rows, gt_filtered).
+        """
+        try:
+            print(f"Loading {file_path}...")
+            print("  This may take a moment for large files...")
+            table = pacsv.read_csv(file_path,
+                                   read_options=pacsv.ReadOptions(use_threads=True, block_size=64 << 20),
+                                   convert_options=pacsv.ConvertOptions(include_columns=ANALYSIS_COLUMNS))
+        except KeyboardInterrupt:  # Direct calls only; run_analysis' worker threads never see Ctrl-C
+            print(f"\n⚠ Loading interrupted for {file_path}")
+            return 0, pd.DataFrame()
+        except Exception as e:
+            print(f"\n✗ Error loading {file_path}: {e}")
+            return 0, pd.DataFrame()
+        
+        print(f"✓ Successfully loaded {file_path}")
+        print(f"  Shape: {table.shape}")
+        print(f"  Columns: {table.column_names}")
+        if 'RESOURCE' not in table.column_names:
+            print("Warning: RESOURCE column not found in DataFrame")
+            return table.num_rows, pd.DataFrame()
+        
+        # Rows with a null RESOURCE are dropped by the filter, like na=False in pandas
+        gt_table = table.filter(pc.starts_with(table['RESOURCE'], 'gt/'))
+        total_rows = table.num_rows
+        del table
+        gt_filtered = gt_table.to_pandas(self_destruct=True, split_blocks=True)
+        
+        print(f"Filtered {len(gt_filtered)} rows with gt/* resources from {total_rows} total rows")
+        return total_rows, gt_filtered
+    
     def filter_gt_resources(self, df: pd.DataFrame) -> pd.DataFrame:
         """Filter DataFrame for RESOURCE column containing 'gt/' patterns."""
         if 'RESOURCE' not in df.columns:
@@ -67,17 +230,25 @@ class SimulationAnalyzer:
         if df.empty or 'DURATION' not in df.columns:
             return {'total_duration': 0, 'avg_duration': 0, 'count': 0}
         
-        # Convert DURATION to numeric, handling any non-numeric values
-        df['DURATION'] = pd.to_numeric(df['DURATION'], errors='coerce')
+        # Convert DURATION to numeric, handling any non-numeric values, into one array without
+        # writing back into the caller's frame; the statistics skip NaN like pandas does
+        duration = pd.to_numeric(df['DURATION'], errors='coerce').to_numpy(np.float64)
+        duration = duration[~np.isnan(duration)]
+        
+        if duration.size == 0:
+            return {'total_duration': 0.0, 'avg_duration': np.nan, 'median_duration': np.nan,
+                    'max_duration': np.nan, 'min_duration': np.nan, 'count': len(df),
+                    'std_duration': np.nan}
         
+        total = duration.sum()
         summary = {
-            'total_duration': df['DURATION'].sum(),
-            'avg_duration': df['DURATION'].mean(),
-            'median_duration': df['DURATION'].median(),
-            'max_duration': df['DURATION'].max(),
-            'min_duration': df['DURATION'].min(),
+            'total_duration': total,
+            'avg_duration': total / duration.size,
+            'median_duration': np.median(duration),
+            'max_duration': duration.max(),
+            'min_duration': duration.min(),
             'count': len(df),
-            'std_duration': df['DURATION'].std()
+            'std_duration': duration.std(ddof=1) if duration.size > 1 else np.nan
         }
         
         return summary
@@ -87,17 +258,110 @@ class SimulationAnalyzer:
         if df.empty or 'TRANSITION' not in df.columns:
             return pd.DataFrame()
         
-        # Group by transition and calculate statistics
-        transition_summary = df.groupby('TRANSITION').agg({
-            'DURATION': ['count', 'sum', 'mean', 'median', 'std', 'min', 'max']
-        }).round(4)
+        # Group by transition and calculate statistics; categorical keys give integer group codes
+        # instead of hashing every string (categories are sorted, so the row order is unchanged)
+        transition = df['TRANSITION'].astype('category')
+        duration = pd.to_numeric(df['DURATION'], errors='coerce')
+        count, total, m2, mn, mx = _group_moments(transition.cat.codes.to_numpy(np.int64),
+                                                  duration.to_numpy(np.float64),
+                                                  len(transition.cat.categories))
+        # Median needs the sorted values, so it stays a pandas groupby
+        median = duration.groupby(transition, observed=True).median().to_numpy()
         
-        # Flatten column names
-        transition_summary.columns = ['_'.join(col).strip() for col in transition_summary.columns]
-        transition_summary = transition_summary.reset_index()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = total / count
+            std = np.sqrt(m2 / (count - 1))
+        std[count < 2] = np.nan
+        
+        transition_summary = pd.DataFrame({
+            'TRANSITION': transition.cat.categories,
+            'DURATION_count': count,
+            'DURATION_sum': total,
+            'DURATION_mean': mean,
+            'DURATION_median': median,
+            'DURATION_std': std,
+            'DURATION_min': mn,
+            'DURATION_max': mx
+        }).round(4)
         
         return transition_summary
     
+    def scan_frequency_sweep(self, file_path: str) -> Tuple[int, pd.DataFrame, Dict, pd.DataFrame]:
+        """Polars equivalent of load_csv_file, filter_gt_resources and the two summaries.
+        
+        The GT filter, numeric cast and aggregations run in one lazy multithreaded plan;
+        returns (total_rows, gt_filtered, duration_summary, transition_analysis).
+        """
+        print(f"Loading {file_path}...")
+        # DURATION is read as text so stray non-numeric values become null, as with pd.to_numeric
+        lf = pl.scan_csv(file_path, schema_overrides={'RESOURCE': pl.String, 'TRANSITION': pl.String,
+                                                      'DURATION': pl.String}).select(ANALYSIS_COLUMNS)
+        gt = (lf.filter(pl.col('RESOURCE').str.starts_with('gt/'))
+                .with_columns(pl.col('DURATION').cast(pl.Float64, strict=False)))
+        duration = pl.col('DURATION')
+        
+        totals, gt_filtered, stats, transitions = pl.collect_all([
+            lf.select(pl.len().alias('rows')),
+            gt,
+            gt.select(
+                duration.sum().alias('total_duration'),
+                duration.mean().alias('avg_duration'),
+                duration.median().alias('median_duration'),
+                duration.max().alias('max_duration'),
+                duration.min().alias('min_duration'),
+                pl.len().alias('count'),
+                duration.std().alias('std_duration')
+            ),
+            gt.filter(pl.col('TRANSITION').is_not_null())
+              .group_by('TRANSITION')
+              .agg(
+                  duration.count().alias('DURATION_count'),
+                  duration.sum().alias('DURATION_sum'),
+                  duration.mean().alias('DURATION_mean'),
+                  duration.median().alias('DURATION_median'),
+                  duration.std().alias('DURATION_std'),
+                  duration.min().alias('DURATION_min'),
+                  duration.max().alias('DURATION_max')
+              )
+              .sort('TRANSITION')
+        ])
+        total_rows = totals.item()
+        print(f"✓ Successfully loaded {file_path}")
+        print(f"  Shape: ({total_rows}, {len(gt_filtered.columns)})")
+        print(f"Filtered {len(gt_filtered)} rows with gt/* resources from {total_rows} total rows")
+        
+        # Only the finished results are converted to pandas for the rest of the report
+        return (total_rows, gt_filtered.to_pandas(), stats.row(0, named=True),
+                transitions.to_pandas().round(4))
+    
+    def write_gt_cache(self, gt_filtered: pd.DataFrame, total_rows: int, cache: Path) -> bool:
+        """Save the gt/* rows and the CSV's total row count to the local Parquet cache.
+        
+        Returns whether the cache file was written.
+        """
+        table = pa.Table.from_pandas(gt_filtered, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               b'total_rows': str(total_rows).encode()})
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            # Written under a temporary name so a concurrent run never reads a partial file
+            partial = cache.with_suffix(f'.{os.getpid()}.tmp')
+            pq.write_table(table, partial, compression='zstd', compression_level=3)
+            os.replace(partial, cache)
+        except OSError as e:  # e.g. a read-only home directory; just run uncached
+            print(f"⚠ Could not cache gt/* rows: {e}")
+            return False
+        
+        # Older versions of the same CSV are never read again
+        source = cache.name.split('-')[0]
+        for stale in cache.parent.glob(f"{source}-*.parquet"):
+            if stale != cache:
+                try:
+                    stale.unlink()
+                except OSError:  # e.g. still open in a concurrent run on Windows
+                    pass
+        return True
+    
     def process_frequency_sweep(self, frequency: str, path: str) -> Dict:
         """Process a single frequency sweep directory."""
         print(f"\n{'='*50}")
@@ -107,26 +371,55 @@ class SimulationAnalyzer:
         csv_file = os.path.join(path, 'simulation_results.csv')
         
         # Check if file exists
-        if not os.path.exists(csv_file):
+        try:
+            stat = os.stat(csv_file)
+        except OSError:
             print(f"Warning: simulation_results.csv not found at {csv_file}")
             return {'error': f'File not found: {csv_file}'}
         
-        # Load CSV
-        df = self.load_csv_file(csv_file)
-        if df.empty:
-            return {'error': f'Failed to load or empty file: {csv_file}'}
+        cache = _gt_cache_path(csv_file, stat) if pq is not None else None
+        cached = cache is not None and cache.is_file()
+        duration_summary = transition_analysis = None
+        
+        if cached:
+            print(f"Loading cached gt/* rows of {csv_file}...")
+            # Memory-mapped, so the OS pages the cached file in rather than copying it to the heap
+            table = pq.read_table(cache, memory_map=True)
+            total_rows = int(table.schema.metadata[b'total_rows'])
+            gt_filtered = table.to_pandas(self_destruct=True, split_blocks=True)
+            del table
+            print(f"Filtered {len(gt_filtered)} rows with gt/* resources from {total_rows} total rows")
+        elif pl is not None:
+            total_rows, gt_filtered, duration_summary, transition_analysis = self.scan_frequency_sweep(csv_file)
+        elif pacsv is not None:
+            # Load CSV and filter for gt/* resources on the Arrow table
+            total_rows, gt_filtered = self.load_gt_resources(csv_file)
+            if total_rows == 0:
+                return {'error': f'Failed to load or empty file: {csv_file}'}
+        else:
+            # Load CSV
+            df = self.load_csv_file(csv_file)
+            if df.empty:
+                return {'error': f'Failed to load or empty file: {csv_file}'}
+            total_rows = len(df)
+            
+            # Filter for gt/* resources
+            gt_filtered = self.filter_gt_resources(df)
+            del df
         
-        # Filter for gt/* resources
-        gt_filtered = self.filter_gt_resources(df)
         if gt_filtered.empty:
             print("No gt/* resources found in the data")
             return {'error': 'No gt/* resources found'}
         
-        # Calculate duration summary
-        duration_summary = self.calculate_duration_summary(gt_filtered)
+        if cache is not None and not cached:
+            cached = self.write_gt_cache(gt_filtered, total_rows, cache)
         
-        # Analyze transitions
-        transition_analysis = self.analyze_transitions(gt_filtered)
+        if duration_summary is None:
+            # Calculate duration summary
+            duration_summary = self.calculate_duration_summary(gt_filtered)
+            
+            # Analyze transitions
+            transition_analysis = self.analyze_transitions(gt_filtered)
         
         # Store unique resources and transitions for reference
         unique_resources = gt_filtered['RESOURCE'].unique().tolist() if 'RESOURCE' in gt_filtered.columns else []
@@ -135,15 +428,21 @@ class SimulationAnalyzer:
         result = {
             'frequency': frequency,
             'path': path,
-            'total_rows': len(df),
+            'total_rows': total_rows,
             'gt_filtered_rows': len(gt_filtered),
             'duration_summary': duration_summary,
             'transition_analysis': transition_analysis,
             'unique_resources': unique_resources,
-            'unique_transitions': unique_transitions,
-            'raw_data': gt_filtered
+            'unique_transitions': unique_transitions
         }
         
+        # Once the rows are in the local cache, keep only its path; export_results reads them back
+        # from there, so the filtered frames are not all held in memory for the whole run
+        if cached:
+            result['raw_data_path'] = str(cache)
+        else:
+            result['raw_data'] = gt_filtered
+        
         return result
     
     def run_analysis(self) -> Dict:
@@ -153,64 +452,92 @@ class SimulationAnalyzer:
         
         all_results = {}
         
-        for i, (freq, path) in enumerate(self.frequency_paths.items(), 1):
-            print(f"\nProcessing {i}/4: {freq}")
-            try:
-                result = self.process_frequency_sweep(freq, path)
-                all_results[freq] = result
-                self.results[freq] = result
-                print(f"✓ Completed {freq}")
-            except KeyboardInterrupt:
-                print(f"\n⚠ Analysis interrupted at {freq}")
-                break
-            except Exception as e:
-                print(f"✗ Error processing {freq}: {e}")
-                all_results[freq] = {'error': str(e)}
-                self.results[freq] = {'error': str(e)}
+        # Each sweep is a separate read from the network share, so overlap them in threads;
+        # the CSV parsers release the GIL while they work
+        pool = ThreadPoolExecutor(max_workers=max(len(self.frequency_paths), 1))
+        try:
+            futures = {}
+            for i, (freq, path) in enumerate(self.frequency_paths.items(), 1):
+                print(f"\nProcessing {i}/{len(self.frequency_paths)}: {freq}")
+                futures[freq] = pool.submit(self.process_frequency_sweep, freq, path)
+            
+            # Collected in frequency order, so the report order does not depend on timing
+            for freq, future in futures.items():
+                try:
+                    result = future.result()
+                    all_results[freq] = result
+                    self.results[freq] = result
+                    print(f"✓ Completed {freq}")
+                except Exception as e:
+                    print(f"✗ Error processing {freq}: {e}")
+                    all_results[freq] = {'error': str(e)}
+                    self.results[freq] = {'error': str(e)}
+        except KeyboardInterrupt:
+            # Ctrl-C reaches only this thread: sweeps not yet started are cancelled and the
+            # completed ones returned at once, but loads already running cannot be stopped
+            # from here and finish in the background before the interpreter exits
+            print("\n⚠ Analysis interrupted; skipping the sweeps that have not started")
+            pool.shutdown(wait=False, cancel_futures=True)
+            return all_results
+        pool.shutdown()
         
         return all_results
     
     def create_summary_report(self) -> pd.DataFrame:
         """Create a comprehensive summary report across all frequencies."""
-        summary_data = []
+        n = len(self.results)
+        columns = {
+            'Frequency': list(self.results),
+            'Status': ['Error' if 'error' in result else 'Success' for result in self.results.values()],
+            'Error': [result.get('error', '') for result in self.results.values()],
+            'Total_Rows': np.zeros(n, dtype=np.int64),
+            'GT_Filtered_Rows': np.zeros(n, dtype=np.int64),
+            'Total_Duration': np.zeros(n),
+            'Avg_Duration': np.zeros(n),
+            'Median_Duration': np.full(n, np.nan),
+            'Max_Duration': np.full(n, np.nan),
+            'Min_Duration': np.full(n, np.nan),
+            'Std_Duration': np.full(n, np.nan),
+            'Transition_Count': np.zeros(n, dtype=np.int64),
+            'Resource_Count': np.zeros(n, dtype=np.int64)
+        }
         
-        for freq, result in self.results.items():
-            if 'error' in result:
-                summary_data.append({
-                    'Frequency': freq,
-                    'Status': 'Error',
-                    'Error': result['error'],
-                    'Total_Duration': 0,
-                    'Avg_Duration': 0,
-                    'Transition_Count': 0,
-                    'Resource_Count': 0
-                })
-            else:
+        # Failed sweeps keep zero counts and durations and NaN statistics
+        for i, result in enumerate(self.results.values()):
+            if 'error' not in result:
                 duration_sum = result['duration_summary']
-                summary_data.append({
-                    'Frequency': freq,
-                    'Status': 'Success',
-                    'Total_Rows': result['total_rows'],
-                    'GT_Filtered_Rows': result['gt_filtered_rows'],
-                    'Total_Duration': duration_sum['total_duration'],
-                    'Avg_Duration': duration_sum['avg_duration'],
-                    'Median_Duration': duration_sum['median_duration'],
-                    'Max_Duration': duration_sum['max_duration'],
-                    'Min_Duration': duration_sum['min_duration'],
-                    'Std_Duration': duration_sum['std_duration'],
-                    'Transition_Count': len(result['unique_transitions']),
-                    'Resource_Count': len(result['unique_resources'])
-                })
-        
-        return pd.DataFrame(summary_data)
+                columns['Total_Rows'][i] = result['total_rows']
+                columns['GT_Filtered_Rows'][i] = result['gt_filtered_rows']
+                columns['Total_Duration'][i] = duration_sum['total_duration']
+                columns['Avg_Duration'][i] = duration_sum['avg_duration']
+                columns['Median_Duration'][i] = duration_sum['median_duration']
+                columns['Max_Duration'][i] = duration_sum['max_duration']
+                columns['Min_Duration'][i] = duration_sum['min_duration']
+                columns['Std_Duration'][i] = duration_sum['std_duration']
+                columns['Transition_Count'][i] = len(result['unique_transitions'])
+                columns['Resource_Count'][i] = len(result['unique_resources'])
+        
+        # The Error column is only reported when a sweep actually failed
+        if not any(columns['Error']):
+            del columns['Error']
+        
+        return pd.DataFrame(columns)
     
-    def export_results(self, output_dir: str = "output"):
-        """Export all results to Excel and CSV files."""
+    def export_results(self, output_dir: str = "output", formats: Tuple[str, ...] = None):
+        """Export all results to CSV, plus Parquet and Excel copies as listed in formats.
+        
+        formats defaults to ('parquet', 'csv'), or ('csv',) without pyarrow. Summary and
+        transition tables are always written as CSV; 'xlsx' is meant for those small
+        tables and is slow for the filtered raw data.
+        """
         os.makedirs(output_dir, exist_ok=True)
+        if formats is None:
+            formats = ('parquet', 'csv') if pq is not None else ('csv',)
         
         # Export summary report
         summary_df = self.create_summary_report()
-        summary_df.to_excel(os.path.join(output_dir, 'frequency_sweep_summary.xlsx'), index=False)
+        if 'xlsx' in formats:
+            summary_df.to_excel(os.path.join(output_dir, 'frequency_sweep_summary.xlsx'), index=False)
         summary_df.to_csv(os.path.join(output_dir, 'frequency_sweep_summary.csv'), index=False)
         
         # Export detailed results for each frequency
@@ -219,22 +546,37 @@ class SimulationAnalyzer:
                 # Export transition analysis
                 if not result['transition_analysis'].empty:
                     filename = f"{freq.replace('MHz', '')}_transition_analysis"
-                    result['transition_analysis'].to_excel(
-                        os.path.join(output_dir, f'{filename}.xlsx'), index=False
-                    )
+                    if 'xlsx' in formats:
+                        result['transition_analysis'].to_excel(
+                            os.path.join(output_dir, f'{filename}.xlsx'), index=False
+                        )
                     result['transition_analysis'].to_csv(
                         os.path.join(output_dir, f'{filename}.csv'), index=False
                     )
                 
                 # Export filtered raw data
-                if not result['raw_data'].empty:
-                    filename = f"{freq.replace('MHz', '')}_filtered_data"
-                    result['raw_data'].to_excel(
-                        os.path.join(output_dir, f'{filename}.xlsx'), index=False
-                    )
-                    result['raw_data'].to_csv(
-                        os.path.join(output_dir, f'{filename}.csv'), index=False
+                filename = f"{freq.replace('MHz', '')}_filtered_data"
+                raw_data = result.get('raw_data')
+                if 'raw_data_path' in result:
+                    # Already Parquet on local disk: copy it as is, and load it only for other formats
+                    if 'parquet' in formats:
+                        shutil.copyfile(result['raw_data_path'], os.path.join(output_dir, f'{filename}.parquet'))
+                    if 'xlsx' in formats or 'csv' in formats:
+                        raw_data = pd.read_parquet(result['raw_data_path'], memory_map=True)
+                elif not raw_data.empty and 'parquet' in formats:
+                    raw_data.to_parquet(
+                        os.path.join(output_dir, f'{filename}.parquet'), index=False, compression='zstd'
                     )
+                
+                if raw_data is not None and not raw_data.empty:
+                    if 'xlsx' in formats:
+                        raw_data.to_excel(
+                            os.path.join(output_dir, f'{filename}.xlsx'), index=False
+                        )
+                    if 'csv' in formats:
+                        raw_data.to_csv(
+                            os.path.join(output_dir, f'{filename}.csv'), index=False
+                        )
         
         print(f"Results exported to {output_dir} directory")
     
@@ -243,7 +585,7 @@ class SimulationAnalyzer:
         os.makedirs(output_dir, exist_ok=True)
         
         # Set style
-        plt.style.use('seaborn-v0_8')
+        plt.rcParams.update(_PLOT_STYLE)
         
         # 1. Duration comparison across frequencies
         freq_durations = []
@@ -255,33 +597,37 @@ class SimulationAnalyzer:
                 freq_labels.append(freq)
         
         if freq_durations:
-            plt.figure(figsize=(10, 6))
-            plt.bar(freq_labels, freq_durations, color='skyblue', alpha=0.7)
-            plt.title('Total Duration by Frequency Sweep')
-            plt.xlabel('Frequency')
-            plt.ylabel('Total Duration')
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(os.path.join(output_dir, 'duration_by_frequency.png'), dpi=300)
-            plt.show()
-        
-        # 2. Transition analysis for each frequency
+            fig, ax = plt.subplots(figsize=(10, 6))
+            ax.bar(freq_labels, freq_durations, color='skyblue', alpha=0.7)
+            ax.set_title('Total Duration by Frequency Sweep')
+            ax.set_xlabel('Frequency')
+            ax.set_ylabel('Total Duration')
+            ax.tick_params(axis='x', labelrotation=45)
+            fig.tight_layout()
+            fig.savefig(os.path.join(output_dir, 'duration_by_frequency.png'), dpi=300)
+            plt.close(fig)
+        
+        # 2. Transition analysis for each frequency, redrawn on one reused figure
+        fig = ax = None
         for freq, result in self.results.items():
             if 'error' not in result and not result['transition_analysis'].empty:
-                plt.figure(figsize=(12, 8))
-                
                 # Get top 10 transitions by total duration
-                trans_df = result['transition_analysis'].copy()
+                trans_df = result['transition_analysis']
                 if 'DURATION_sum' in trans_df.columns:
                     top_transitions = trans_df.nlargest(10, 'DURATION_sum')
                     
-                    plt.barh(top_transitions['TRANSITION'], top_transitions['DURATION_sum'])
-                    plt.title(f'Top 10 Transitions by Total Duration - {freq}')
-                    plt.xlabel('Total Duration')
-                    plt.ylabel('Transition')
-                    plt.tight_layout()
-                    plt.savefig(os.path.join(output_dir, f'{freq}_top_transitions.png'), dpi=300)
-                    plt.show()
+                    if fig is None:
+                        fig, ax = plt.subplots(figsize=(12, 8))
+                    else:
+                        ax.clear()
+                    ax.barh(top_transitions['TRANSITION'], top_transitions['DURATION_sum'])
+                    ax.set_title(f'Top 10 Transitions by Total Duration - {freq}')
+                    ax.set_xlabel('Total Duration')
+                    ax.set_ylabel('Transition')
+                    fig.tight_layout()
+                    fig.savefig(os.path.join(output_dir, f'{freq}_top_transitions.png'), dpi=300)
+        if fig is not None:
+            plt.close(fig)
 
 def main():
     """Main function to run the simulation analysis."""
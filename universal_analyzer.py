@@ -6,72 +6,342 @@ Supports multiple data source types with automatic fallback and configuration.
 
 import pandas as pd
 import numpy as np
+import argparse
+import hashlib
+import io
 import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 from config_manager import config, get_csv_path
 
-def analyze_single_frequency(freq_name: str) -> dict:
-    """Analyze a single frequency sweep using smart path detection."""
+try:
+    import polars as pl
+except ImportError:  # Without Polars the CSV is streamed and aggregated with pyarrow/pandas and NumPy
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # CSVs are then parsed with pandas' C engine, uncached, and tables written as CSV
+    pa = pc = pacsv = feather = pq = None
+
+try:
+    import xlsxwriter
+except ImportError:  # Excel export then uses pandas' default openpyxl engine
+    xlsxwriter = None
+
+try:
+    from numba import njit
+except ImportError:  # The per-transition sums then use np.bincount
+    njit = None
+
+# The only columns of simulation_results.csv the analysis reads
+REQUIRED_COLUMNS = ['RESOURCE', 'DURATION', 'TRANSITION']
+
+# Rows per pandas chunk when streaming a CSV without pyarrow
+CSV_CHUNK_ROWS = 1_000_000
+
+# Feather copies of the GT rows parsed from each CSV, reused while the CSV is unchanged.
+# Kept outside temp_data, which cleanup_extracted_files deletes after every run
+PARSED_CACHE_DIR = Path.home() / ".cache" / "universal_analyzer"
+
+# Data source type by path token, first match wins; anything else is a custom path
+SOURCE_RULES = (('\\\\', 'Network'), ('temp_data', 'ZIP Archive'), ('local_csv', 'Local Directory'))
+SOURCE_ICONS = {
+    "Network": "🌐",
+    "ZIP Archive": "📦",
+    "Local Directory": "📁",
+    "Custom Path": "🔧",
+    "Unknown": "❓"
+}
+
+def _group_sums(codes, vals, ngroups):
+    """Count and sum of vals per group code; rows with a negative (NaN key) code are skipped."""
+    valid = codes >= 0
+    count = np.bincount(codes[valid], minlength=ngroups)
+    total = np.bincount(codes[valid], weights=vals[valid], minlength=ngroups)
+    return count, total
+
+if njit is not None:
+    @njit(cache=True)
+    def _group_sums(codes, vals, ngroups):
+        """Count and sum of vals per group code; rows with a negative (NaN key) code are skipped."""
+        count = np.zeros(ngroups, dtype=np.int64)
+        total = np.zeros(ngroups)
+        for i in range(codes.size):
+            g = codes[i]
+            if g < 0:
+                continue
+            count[g] += 1
+            total[g] += vals[i]
+        return count, total
+
+def _write_xlsx(df, path):
+    """Write df to an Excel workbook, streaming rows when xlsxwriter is available."""
+    if xlsxwriter is not None:
+        with pd.ExcelWriter(path, engine='xlsxwriter',
+                            engine_kwargs={'options': {'constant_memory': True}}) as writer:
+            df.to_excel(writer, index=False)
+    else:
+        df.to_excel(path, index=False)
+
+def _parsed_cache_path(freq_name: str, csv_file: str, stat) -> Path:
+    """Cache file for this exact version of csv_file; a new size or mtime gives a new name."""
+    source = hashlib.blake2b(os.path.abspath(csv_file).encode(), digest_size=8).hexdigest()
+    version = hashlib.blake2b(f"{stat.st_size}|{stat.st_mtime_ns}".encode(), digest_size=8).hexdigest()
+    return PARSED_CACHE_DIR / f"{freq_name}_{source}-{version}.feather"
+
+def _write_parsed_cache(gt_table, total_rows: int, n_columns: int, cache: Path):
+    """Save the GT rows with the CSV's row and column counts to the Feather cache.
+    
+    Entries for older versions of the same CSV are removed once the new one is in place.
+    """
+    gt_table = gt_table.replace_schema_metadata({
+        b'total_rows': str(total_rows).encode(),
+        b'csv_columns': str(n_columns).encode()
+    })
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a temporary name so a concurrent run never reads a partial file
+        partial = cache.with_suffix(f'.{os.getpid()}.tmp')
+        feather.write_feather(gt_table, partial, compression='zstd')
+        os.replace(partial, cache)
+        source = cache.name.rsplit('-', 1)[0]
+        for stale in cache.parent.glob(f"{source}-*.feather"):
+            if stale != cache:
+                stale.unlink(missing_ok=True)
+    except OSError as e:  # e.g. a read-only home directory; just run uncached
+        print(f"⚠️ Could not cache parsed rows: {e}")
+
+def _summarize_gt_rows(gt_df):
+    """Duration statistics and per-transition table of the GT rows.
+    
+    Returns (duration_stats, transition_summary), or (None, None) if no duration is numeric.
+    """
+    # Plain arrays from here on; gt_df itself is never modified
+    durations = pd.to_numeric(gt_df['DURATION'], errors='coerce').to_numpy(dtype=np.float64)
+    
+    # Remove any invalid durations
+    valid_durations = ~np.isnan(durations)
+    durations = durations[valid_durations]
+    # .array keeps a categorical TRANSITION as integer codes instead of materialising strings
+    transition_keys = gt_df['TRANSITION'].array[valid_durations]
+    
+    if durations.size == 0:
+        return None, None
+    
+    # One array, reused by every reduction
+    total_duration = durations.sum()
+    duration_stats = {
+        'total_duration': total_duration,
+        'avg_duration': total_duration / durations.size,
+        'median_duration': np.median(durations),
+        'max_duration': durations.max(),
+        'min_duration': durations.min(),
+        'std_duration': durations.std(ddof=1) if durations.size > 1 else np.nan,
+        'count': durations.size
+    }
+    
+    # Sorted integer codes stand in for the string keys, in the order groupby would list them
+    codes, transitions = pd.factorize(transition_keys, sort=True)
+    count, total = _group_sums(codes, durations, len(transitions))
+    
+    # Medians from one sort of the durations by (code, value): each group is a contiguous run
+    valid = codes >= 0
+    ordered = durations[valid][np.lexsort((durations[valid], codes[valid]))]
+    starts = np.cumsum(count) - count
+    median = (ordered[starts + (count - 1) // 2] + ordered[starts + count // 2]) / 2
+    
+    transition_summary = pd.DataFrame({
+        'TRANSITION': np.asarray(transitions),
+        'count': count,
+        'total_duration': total,
+        'avg_duration': total / count,
+        'median_duration': median
+    }).round(6)
+    return duration_stats, transition_summary
+
+def _scan_gt_stats(csv_file: str, keep_rows: bool = False):
+    """Polars equivalent of streaming plus _summarize_gt_rows, run as one lazy plan.
+    
+    Returns (total_rows, gt_rows, duration_stats, transition_summary, gt_table); the
+    stats and summary are None if no GT duration is numeric. gt_table holds the GT rows
+    as an Arrow table for the parsed cache when keep_rows is set, and is None otherwise.
+    """
+    lf = pl.scan_csv(csv_file, low_memory=True, infer_schema_length=0)
+    gt_all = lf.filter(pl.col('RESOURCE').str.starts_with('gt/'))
+    gt = gt_all.select('TRANSITION', pl.col('DURATION').cast(pl.Float64, strict=False))
+    duration = pl.col('DURATION')
+    valid = gt.filter(duration.is_not_null() & duration.is_not_nan())
+    
+    queries = [
+        lf.select(pl.len().alias('rows')),
+        gt.select(pl.len().alias('rows')),
+        valid.select(
+            duration.sum().alias('total_duration'),
+            duration.mean().alias('avg_duration'),
+            duration.median().alias('median_duration'),
+            duration.max().alias('max_duration'),
+            duration.min().alias('min_duration'),
+            duration.std().alias('std_duration'),
+            pl.len().alias('count')
+        ),
+        valid.filter(pl.col('TRANSITION').is_not_null())
+             .group_by('TRANSITION')
+             .agg(
+                 pl.len().cast(pl.Int64).alias('count'),
+                 duration.sum().alias('total_duration'),
+                 duration.mean().alias('avg_duration'),
+                 duration.median().alias('median_duration')
+             )
+             .sort('TRANSITION')
+    ]
+    if keep_rows:
+        # Same text columns as the Arrow reader caches, with TRANSITION dictionary-encoded
+        queries.append(gt_all.select(REQUIRED_COLUMNS)
+                             .with_columns(pl.col('TRANSITION').cast(pl.Categorical)))
+    totals, gt_rows, stats, transitions, *rows = pl.collect_all(queries, streaming=True)
+    gt_table = rows[0].to_arrow() if rows else None
+    
+    duration_stats = stats.row(0, named=True)
+    if duration_stats['count'] == 0:
+        return totals.item(), gt_rows.item(), None, None, gt_table
+    duration_stats = {key: np.nan if value is None else value for key, value in duration_stats.items()}
+    return totals.item(), gt_rows.item(), duration_stats, transitions.to_pandas().round(6), gt_table
+
+def resolve_csv_paths(frequencies) -> dict:
+    """CSV path of each frequency from the configuration manager (None where not found)."""
+    if config.config["analysis_settings"]["verbose_logging"]:
+        # One at a time, so each frequency's search log stays readable
+        return {freq: get_csv_path(freq) for freq in frequencies}
+    # The lookups are dominated by file/network stats, which release the GIL
+    with ThreadPoolExecutor(max_workers=len(frequencies)) as executor:
+        return dict(zip(frequencies, executor.map(get_csv_path, frequencies)))
+
+def analyze_single_frequency(freq_name: str, csv_file: str = None) -> dict:
+    """Analyze a single frequency sweep using smart path detection.
+    
+    csv_file skips the path lookup when the caller has already resolved it.
+    """
     print(f"\n{'='*60}")
     print(f"Analyzing {freq_name}")
     print(f"{'='*60}")
     
     # Get CSV file using configuration manager
-    csv_file = get_csv_path(freq_name)
+    if csv_file is None:
+        csv_file = get_csv_path(freq_name)
     
     if not csv_file:
         print(f"❌ No CSV file available for {freq_name}")
         return None
     
     print(f"📁 Using CSV file: {csv_file}")
+    
+    # The cache is keyed on the CSV's size and mtime, so any other version of the file misses it
+    cache = None
+    if feather is not None and config.config["analysis_settings"].get("cache_parsed", True):
+        try:
+            cache = _parsed_cache_path(freq_name.replace('/', '_'), csv_file, os.stat(csv_file))
+        except OSError:
+            cache = None
+    cached = cache is not None and cache.is_file()
+    
+    gt_df = duration_stats = transition_summary = None
     try:
-        # Load CSV
-        df = pd.read_csv(csv_file)
-        print(f"✅ Loaded {len(df):,} rows, {len(df.columns)} columns")
+        if cached:
+            print(f"⚡ Loading cached gt/* rows: {cache}")
+            # Memory-mapped, so the OS pages the cached file in rather than copying it to the heap
+            gt_table = feather.read_table(cache, memory_map=True)
+            total_rows = int(gt_table.schema.metadata[b'total_rows'])
+            n_columns = int(gt_table.schema.metadata[b'csv_columns'])
+            gt_df = gt_table.to_pandas(self_destruct=True, split_blocks=True)
+            del gt_table
+            gt_rows = len(gt_df)
+            print(f"✅ Loaded {total_rows:,} rows, {n_columns} columns")
+        else:
+            # Validate required columns from the header, then parse only those columns
+            columns = pd.read_csv(csv_file, nrows=0).columns.tolist()
+            missing_cols = [col for col in REQUIRED_COLUMNS if col not in columns]
+            if missing_cols:
+                print(f"⚠️ Missing required columns: {missing_cols}")
+                print(f"Available columns: {columns}")
+                return None
+            
+            # Stream the CSV and filter for GT resources batch by batch, so only GT rows are held
+            print("🔍 Filtering for gt/* resources...")
+            total_rows = 0
+            if pl is not None:
+                # Parse, filter and aggregate in one parallel Polars plan; no GT frame is built
+                total_rows, gt_rows, duration_stats, transition_summary, gt_table = \
+                    _scan_gt_stats(csv_file, keep_rows=cache is not None)
+                if gt_table is not None:
+                    _write_parsed_cache(gt_table, total_rows, len(columns), cache)
+                    del gt_table
+            elif pacsv is not None:
+                reader = pacsv.open_csv(
+                    csv_file,
+                    read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 23),
+                    convert_options=pacsv.ConvertOptions(
+                        include_columns=REQUIRED_COLUMNS,
+                        # TRANSITION repeats heavily, so it arrives in pandas as a categorical.
+                        # DURATION stays text: the streaming reader infers types from the first
+                        # block only, and _summarize_gt_rows coerces bad values to NaN anyway
+                        column_types={'RESOURCE': pa.string(),
+                                      'DURATION': pa.string(),
+                                      'TRANSITION': pa.dictionary(pa.int32(), pa.string())}))
+                gt_batches = []
+                for batch in reader:
+                    total_rows += batch.num_rows
+                    # Arrow's starts_with kernel; only the GT rows are converted to pandas
+                    gt_batch = batch.filter(pc.starts_with(batch.column('RESOURCE'), pattern='gt/'))
+                    if gt_batch.num_rows:
+                        gt_batches.append(gt_batch)
+                # One shared TRANSITION dictionary across batches, as the Feather file requires
+                gt_table = pa.Table.from_batches(gt_batches, schema=reader.schema).unify_dictionaries()
+                del gt_batches
+                if cache is not None:
+                    _write_parsed_cache(gt_table, total_rows, len(columns), cache)
+                gt_df = gt_table.to_pandas(self_destruct=True, split_blocks=True)
+                del gt_table
+            else:
+                gt_chunks = []
+                for chunk in pd.read_csv(csv_file, usecols=REQUIRED_COLUMNS, chunksize=CSV_CHUNK_ROWS,
+                                         dtype={'RESOURCE': str, 'TRANSITION': str}):
+                    total_rows += len(chunk)
+                    gt_chunks.append(chunk[chunk['RESOURCE'].str.startswith('gt/', na=False)])
+                gt_df = pd.concat(gt_chunks, ignore_index=True) if gt_chunks else \
+                    pd.DataFrame(columns=REQUIRED_COLUMNS)
+                del gt_chunks
+            if gt_df is not None:
+                gt_rows = len(gt_df)
+            print(f"✅ Loaded {total_rows:,} rows, {len(columns)} columns")
     except Exception as e:
         print(f"❌ Error loading file: {e}")
         return None
     
-    # Validate required columns
-    required_cols = ['RESOURCE', 'DURATION', 'TRANSITION']
-    missing_cols = [col for col in required_cols if col not in df.columns]
-    if missing_cols:
-        print(f"⚠️ Missing required columns: {missing_cols}")
-        print(f"Available columns: {df.columns.tolist()}")
-        return None
-    
-    # Filter for GT resources
-    print("🔍 Filtering for gt/* resources...")
-    gt_mask = df['RESOURCE'].str.startswith('gt/', na=False)
-    gt_df = df[gt_mask].copy()
-    print(f"✅ Found {len(gt_df):,} GT resources ({len(gt_df)/len(df)*100:.1f}% of total)")
+    print(f"✅ Found {gt_rows:,} GT resources ({gt_rows/max(total_rows, 1)*100:.1f}% of total)")
     
-    if len(gt_df) == 0:
+    if gt_rows == 0:
         print("⚠️ No GT resources found!")
         return None
     
     # Duration analysis
     print("📊 Analyzing durations...")
-    gt_df['DURATION'] = pd.to_numeric(gt_df['DURATION'], errors='coerce')
-    
-    # Remove any invalid durations
-    valid_durations = gt_df['DURATION'].notna()
-    gt_df = gt_df[valid_durations]
+    if gt_df is not None:
+        duration_stats, transition_summary = _summarize_gt_rows(gt_df)
+        del gt_df
     
-    if len(gt_df) == 0:
+    if duration_stats is None:
         print("⚠️ No valid duration data found!")
         return None
     
-    duration_stats = {
-        'total_duration': gt_df['DURATION'].sum(),
-        'avg_duration': gt_df['DURATION'].mean(),
-        'median_duration': gt_df['DURATION'].median(),
-        'max_duration': gt_df['DURATION'].max(),
-        'min_duration': gt_df['DURATION'].min(),
-        'std_duration': gt_df['DURATION'].std(),
-        'count': len(gt_df)
-    }
-    
     print(f"💰 TOTAL DURATION: {duration_stats['total_duration']:,.6f}")
     print(f"📈 Average: {duration_stats['avg_duration']:.6f}")
     print(f"📊 Median: {duration_stats['median_duration']:.6f}")
@@ -80,21 +350,14 @@ def analyze_single_frequency(freq_name: str) -> dict:
     
     # Transition analysis
     print("🔄 Analyzing transitions...")
-    transition_summary = gt_df.groupby('TRANSITION').agg({
-        'DURATION': ['count', 'sum', 'mean', 'median']
-    }).round(6)
-    
-    transition_summary.columns = ['count', 'total_duration', 'avg_duration', 'median_duration']
-    transition_summary = transition_summary.reset_index()
-    transition_summary = transition_summary.sort_values('total_duration', ascending=False)
-    
     print(f"🎯 Found {len(transition_summary)} unique transitions")
     
     # Show top transitions
     print("\n🏆 TOP 10 TRANSITIONS BY TOTAL DURATION:")
     print("-" * 80)
-    for i, (_, row) in enumerate(transition_summary.head(10).iterrows(), 1):
-        print(f"{i:2d}. {row['total_duration']:12.6f} | {row['count']:6d} times | {row['TRANSITION'][:50]}...")
+    top_transitions = transition_summary.nlargest(10, 'total_duration')
+    for i, (transition, count, total_duration, _, _) in enumerate(top_transitions.itertuples(index=False), 1):
+        print(f"{i:2d}. {total_duration:12.6f} | {count:6d} times | {transition[:50]}...")
     
     # Save results
     output_dir = "output"
@@ -102,28 +365,29 @@ def analyze_single_frequency(freq_name: str) -> dict:
     
     freq_clean = freq_name.replace('MHz', '').replace('/', '_')
     
-    # Save transition summary
-    trans_file = os.path.join(output_dir, f"{freq_clean}_transitions.xlsx")
-    transition_summary.to_excel(trans_file, index=False)
+    # Save transition summary, largest total first; Excel copies are opt-in via analysis_settings.write_xlsx
+    transition_summary = transition_summary.sort_values('total_duration', ascending=False)
+    trans_stem = os.path.join(output_dir, f"{freq_clean}_transitions")
+    if pq is not None:
+        trans_file = f"{trans_stem}.parquet"
+        transition_summary.to_parquet(trans_file, engine='pyarrow', compression='zstd', index=False)
+    else:
+        trans_file = f"{trans_stem}.csv"
+        transition_summary.to_csv(trans_file, index=False)
     print(f"\n💾 Saved transition analysis: {trans_file}")
+    if config.config["analysis_settings"].get("write_xlsx", False):
+        _write_xlsx(transition_summary, f"{trans_stem}.xlsx")
+        print(f"💾 Saved transition analysis: {trans_stem}.xlsx")
     
     # Determine data source type for reporting
-    data_source = "Unknown"
-    if csv_file.startswith('\\\\'):
-        data_source = "Network"
-    elif 'temp_data' in csv_file:
-        data_source = "ZIP Archive"
-    elif 'local_csv' in csv_file:
-        data_source = "Local Directory"
-    else:
-        data_source = "Custom Path"
+    data_source = next((name for token, name in SOURCE_RULES if token in csv_file), "Custom Path")
     
     # Save summary stats
     summary_data = {
         'Frequency': freq_name,
-        'Total_Rows': len(df),
-        'GT_Rows': len(gt_df),
-        'GT_Percentage': len(gt_df)/len(df)*100,
+        'Total_Rows': total_rows,
+        'GT_Rows': duration_stats['count'],
+        'GT_Percentage': duration_stats['count']/total_rows*100,
         **duration_stats,
         'Unique_Transitions': len(transition_summary),
         'Data_Source': data_source,
@@ -132,6 +396,17 @@ def analyze_single_frequency(freq_name: str) -> dict:
     
     return summary_data
 
+def _analyze_captured(freq_name: str, csv_file: str = None):
+    """Run analyze_single_frequency in a worker process, returning (summary, log, error)."""
+    log = io.StringIO()
+    summary = error = None
+    with redirect_stdout(log):
+        try:
+            summary = analyze_single_frequency(freq_name, csv_file)
+        except Exception as e:
+            error = str(e)
+    return summary, log.getvalue(), error
+
 def interactive_setup():
     """Interactive setup for adding custom data locations."""
     print("\n🔧 INTERACTIVE DATA SOURCE SETUP")
@@ -181,8 +456,7 @@ def interactive_setup():
         
         elif choice == "4":
             print("\n🧪 Testing configuration...")
-            for freq in ["600MHz", "1000MHz", "1600MHz", "2000MHz"]:
-                csv_path = get_csv_path(freq)
+            for freq, csv_path in resolve_csv_paths(["600MHz", "1000MHz", "1600MHz", "2000MHz"]).items():
                 status = "✅ Found" if csv_path else "❌ Not found"
                 print(f"   {freq}: {status}")
                 if csv_path:
@@ -196,6 +470,11 @@ def interactive_setup():
 
 def main():
     """Main analysis function with smart data source detection."""
+    parser = argparse.ArgumentParser(description="Universal Simulation Results Analyzer")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Delete the cached parsed CSVs before analysing")
+    args = parser.parse_args()
+    
     frequencies = ["600MHz", "1000MHz", "1600MHz", "2000MHz"]
     
     print("🚀 UNIVERSAL SIMULATION RESULTS ANALYZER")
@@ -203,17 +482,20 @@ def main():
     print("Smart data source detection with automatic fallback")
     print("Supports: Network paths, ZIP archives, local files, custom locations")
     
-    # Check if we need interactive setup
-    available_sources = 0
-    for freq in frequencies:
-        if get_csv_path(freq):
-            available_sources += 1
+    if args.clear_cache:
+        shutil.rmtree(PARSED_CACHE_DIR, ignore_errors=True)
+        print(f"🧹 Cleared parsed CSV cache: {PARSED_CACHE_DIR}")
+    
+    # Check if we need interactive setup; the paths found are reused by the analysis
+    csv_paths = resolve_csv_paths(frequencies)
+    available_sources = sum(1 for csv_file in csv_paths.values() if csv_file)
     
     if available_sources == 0:
         print("\n⚠️ No data sources found with current configuration!")
         setup_choice = input("Would you like to configure data sources? (y/n): ").strip().lower()
         if setup_choice == 'y':
             interactive_setup()
+            csv_paths = resolve_csv_paths(frequencies)
         else:
             print("❌ Cannot proceed without data sources. Exiting.")
             return
@@ -223,92 +505,113 @@ def main():
         setup_choice = input("Configure additional sources? (y/n): ").strip().lower()
         if setup_choice == 'y':
             interactive_setup()
+            csv_paths = resolve_csv_paths(frequencies)
     
     # Run analysis
     print(f"\n📋 Starting analysis for {len(frequencies)} frequencies...")
     all_summaries = []
     
-    for i, freq_name in enumerate(frequencies, 1):
-        print(f"\n📋 Processing {i}/{len(frequencies)}: {freq_name}")
-        try:
-            summary = analyze_single_frequency(freq_name)
-            if summary:
+    # Frequencies are analysed in parallel processes; each log is printed in frequency order
+    with ProcessPoolExecutor(max_workers=min(len(frequencies), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(_analyze_captured, freq_name, csv_paths[freq_name])
+                   for freq_name in frequencies]
+        for i, (freq_name, future) in enumerate(zip(frequencies, futures), 1):
+            print(f"\n📋 Processing {i}/{len(frequencies)}: {freq_name}")
+            try:
+                summary, log, error = future.result()
+            except Exception as e:  # e.g. BrokenProcessPool when a worker is killed
+                summary, log, error = None, "", str(e) or type(e).__name__
+            print(log, end="")
+            if error is not None:
+                print(f"❌ Error processing {freq_name}: {error}")
+            elif summary:
                 all_summaries.append(summary)
                 print(f"✅ {freq_name} completed successfully")
             else:
                 print(f"❌ {freq_name} failed or no data available")
-        except Exception as e:
-            print(f"❌ Error processing {freq_name}: {e}")
     
     # Generate comprehensive summary
     if all_summaries:
-        print("\n" + "="*100)
-        print("📋 COMPREHENSIVE ANALYSIS SUMMARY")
-        print("="*100)
+        # The report is collected and written in one go rather than line by line
+        lines = []
+        lines.append("\n" + "="*100)
+        lines.append("📋 COMPREHENSIVE ANALYSIS SUMMARY")
+        lines.append("="*100)
         
         summary_df = pd.DataFrame(all_summaries)
         
         # Display summary with data sources
-        print("\n🎯 ANALYSIS RESULTS BY FREQUENCY:")
-        print("-" * 100)
-        for _, row in summary_df.iterrows():
-            source_icons = {
-                "Network": "🌐",
-                "ZIP Archive": "📦", 
-                "Local Directory": "📁",
-                "Custom Path": "🔧",
-                "Unknown": "❓"
-            }
-            icon = source_icons.get(row['Data_Source'], "❓")
-            
-            print(f"{row['Frequency']:>8} {icon} | GT Resources: {row['GT_Rows']:>8,} | "
-                  f"Total Duration: {row['total_duration']:>15,.2f} | Avg: {row['avg_duration']:>8.2f}")
-            print(f"         Source: {row['Data_Source']} | Path: {row['File_Path'][:70]}...")
+        lines.append("\n🎯 ANALYSIS RESULTS BY FREQUENCY:")
+        lines.append("-" * 100)
+        icons = summary_df['Data_Source'].map(SOURCE_ICONS).fillna("❓")
+        rows = summary_df.assign(icon=icons)[['Frequency', 'icon', 'GT_Rows', 'total_duration',
+                                              'avg_duration', 'Data_Source', 'File_Path']]
+        lines.extend(
+            f"{freq:>8} {icon} | GT Resources: {gt_rows:>8,} | "
+            f"Total Duration: {total:>15,.2f} | Avg: {avg:>8.2f}\n"
+            f"         Source: {source} | Path: {path[:70]}..."
+            for freq, icon, gt_rows, total, avg, source, path in rows.itertuples(index=False, name=None))
         
         # Save results
         os.makedirs("output", exist_ok=True)
-        summary_df.to_excel("output/universal_analysis_summary.xlsx", index=False)
         summary_df.to_csv("output/universal_analysis_summary.csv", index=False)
-        print(f"\n💾 Results saved to output/universal_analysis_summary.xlsx")
+        lines.append(f"\n💾 Results saved to output/universal_analysis_summary.csv")
+        if pq is not None:
+            summary_df.to_parquet("output/universal_analysis_summary.parquet",
+                                  engine='pyarrow', compression='zstd', index=False)
+            lines.append(f"💾 Results saved to output/universal_analysis_summary.parquet")
+        if config.config["analysis_settings"].get("write_xlsx", False):
+            _write_xlsx(summary_df, "output/universal_analysis_summary.xlsx")
+            lines.append(f"💾 Results saved to output/universal_analysis_summary.xlsx")
+        
+        # Cleanup if configured; the extracted files are no longer needed, so the delete
+        # overlaps with the report below and may finish just after it
+        if config.config["analysis_settings"]["cleanup_extracted_files"]:
+            cleanup_path = Path("temp_data")
+            if cleanup_path.exists():
+                try:
+                    # Renamed first so a new run never sees a half-deleted temp_data
+                    cleanup_path = cleanup_path.rename(f"temp_data.gc.{os.getpid()}")
+                except OSError:
+                    pass
+                # Not a daemon thread, so exiting never cuts the delete short
+                threading.Thread(target=shutil.rmtree, args=(cleanup_path,),
+                                 kwargs={'ignore_errors': True}).start()
+                lines.append("🧹 Cleaning up extracted files in the background")
         
         # Calculate statistics
         total_gt_resources = summary_df['GT_Rows'].sum()
         total_effort = summary_df['total_duration'].sum()
         avg_effort_per_freq = summary_df['total_duration'].mean()
         
-        print("\n" + "="*100)
-        print("🎯 OVERALL ANALYSIS STATISTICS")
-        print("="*100)
-        print(f"📊 Total GT/* Resources: {total_gt_resources:,}")
-        print(f"💰 Total Effort: {total_effort:,.2f}")
-        print(f"📈 Average Effort Per Frequency: {avg_effort_per_freq:,.2f}")
-        print(f"🔢 Frequencies Analyzed: {len(all_summaries)}")
+        lines.append("\n" + "="*100)
+        lines.append("🎯 OVERALL ANALYSIS STATISTICS")
+        lines.append("="*100)
+        lines.append(f"📊 Total GT/* Resources: {total_gt_resources:,}")
+        lines.append(f"💰 Total Effort: {total_effort:,.2f}")
+        lines.append(f"📈 Average Effort Per Frequency: {avg_effort_per_freq:,.2f}")
+        lines.append(f"🔢 Frequencies Analyzed: {len(all_summaries)}")
         
         # Data source summary
         source_counts = summary_df['Data_Source'].value_counts()
-        print(f"\n📊 Data Sources Used:")
+        lines.append(f"\n📊 Data Sources Used:")
         for source, count in source_counts.items():
-            icon = {"Network": "🌐", "ZIP Archive": "📦", "Local Directory": "📁", "Custom Path": "🔧"}.get(source, "❓")
-            print(f"   {icon} {source}: {count} frequencies")
+            icon = SOURCE_ICONS.get(source, "❓")
+            lines.append(f"   {icon} {source}: {count} frequencies")
         
         # Frequency comparison
-        print("\n📈 EFFORT COMPARISON:")
-        print("-" * 60)
-        for _, row in summary_df.iterrows():
-            percentage = (row['total_duration'] / total_effort) * 100
-            print(f"{row['Frequency']:>8}: {row['total_duration']:>12,.2f} ({percentage:5.1f}%)")
+        lines.append("\n📈 EFFORT COMPARISON:")
+        lines.append("-" * 60)
+        lines.extend(
+            f"{freq:>8}: {total:>12,.2f} ({total / total_effort * 100:5.1f}%)"
+            for freq, total in summary_df[['Frequency', 'total_duration']].itertuples(index=False, name=None))
         
-        print("\n✅ Analysis Complete!")
-        print("📁 Check 'output/' folder for detailed results")
-        print("🔧 Use 'python config_manager.py' to manage data sources")
+        lines.append("\n✅ Analysis Complete!")
+        lines.append("📁 Check 'output/' folder for detailed results")
+        lines.append("🔧 Use 'python config_manager.py' to manage data sources")
         
-        # Cleanup if configured
-        if config.config["analysis_settings"]["cleanup_extracted_files"]:
-            cleanup_path = Path("temp_data")
-            if cleanup_path.exists():
-                import shutil
-                shutil.rmtree(cleanup_path)
-                print("🧹 Cleaned up extracted files")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     else:
         print("\n❌ No data was successfully analyzed!")